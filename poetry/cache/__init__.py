@@ -0,0 +1,5 @@
+from .cache_manager import CacheManager
+from .repository_cache import RepositoryCache
+from .server import CacheClient
+from .server import CacheServer
+from .sqlite_store import SQLiteStore
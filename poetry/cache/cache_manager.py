@@ -0,0 +1,33 @@
+from cachy import CacheManager as BaseCacheManager
+from cachy import Repository
+
+from .sqlite_store import SQLiteStore
+
+
+class SQLiteRepository(Repository):
+    """
+    A cache repository whose existence checks
+    are not recorded as hits or misses of the store.
+    """
+
+    def has(self, key):
+        return self._store.has(key)
+
+
+class CacheManager(BaseCacheManager):
+    """
+    A cache manager supporting SQLite stores.
+
+    The driver is provided as a method rather than registered
+    with extend() since custom creators do not survive
+    the per-thread initialization of the manager.
+    """
+
+    def _create_sqlite_driver(self, config):
+        return SQLiteRepository(
+            SQLiteStore(
+                config['path'],
+                config.get('table', 'cache'),
+                config.get('key_normalizer')
+            )
+        )
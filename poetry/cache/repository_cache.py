@@ -0,0 +1,325 @@
+import re
+import shutil
+import sqlite3
+import time
+
+from pathlib import Path
+from typing import List
+from typing import Union
+
+from poetry.config import Config
+from poetry.locations import CACHE_DIR
+
+from .sqlite_store import create_tables
+
+
+class RepositoryCache:
+    """
+    The caches of the repositories.
+
+    Each repository keeps its items in a SQLite database,
+    named after the repository, and legacy repositories
+    also keep the dependency cache of pip-tools in a directory
+    of the same name.
+
+    Previous versions kept the items in file stores,
+    in the directories of the repositories, which are removed
+    by remove_legacy_stores().
+    """
+
+    # Directories of the items of the file stores, named after their hash
+    LEGACY_STORE_DIR = re.compile(r'^[0-9a-f]{2}$')
+
+    def __init__(self,
+                 directory: Union[Path, str, None] = None,
+                 max_size: Union[int, None] = None,
+                 max_age: Union[int, None] = None):
+        if directory is None:
+            directory = Path(CACHE_DIR) / 'cache' / 'repositories'
+
+        self._directory = Path(directory)
+        self._max_size = max_size
+        self._max_age = max_age
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def max_size(self) -> Union[int, None]:
+        return self._max_size
+
+    @property
+    def max_age(self) -> Union[int, None]:
+        return self._max_age
+
+    @classmethod
+    def create(cls, config: Config) -> 'RepositoryCache':
+        """
+        Create the repository cache with the budget
+        set in the user configuration.
+        """
+        max_size = config.setting('settings.cache.max-size')
+        if max_size is not None:
+            max_size = parse_size(max_size)
+
+        max_age = config.setting('settings.cache.max-age')
+        if max_age is not None:
+            max_age = int(max_age)
+
+        return cls(max_size=max_size, max_age=max_age)
+
+    def names(self) -> List[str]:
+        """
+        Return the names of the cached repositories.
+        """
+        names = set()
+        if self._directory.exists():
+            for path in self._directory.iterdir():
+                if path.suffix == '.db' or path.is_dir():
+                    names.add(path.stem if path.suffix == '.db' else path.name)
+
+        return sorted(names)
+
+    def stats(self, name: str) -> dict:
+        """
+        Return the statistics of the cache of a repository.
+
+        Sizes are in bytes and the items, hits and misses
+        are given for each store of the repository.
+        """
+        stats = {
+            'size': 0,
+            'stores': {}
+        }
+
+        db = self._database(name)
+        if db.exists():
+            stats['size'] += self._database_size(db)
+
+            connection = self._connect(db)
+            try:
+                meta = dict(connection.execute('SELECT name, value FROM meta'))
+                for table in self._tables(connection):
+                    items, size = connection.execute(
+                        f'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {table}'
+                    ).fetchone()
+
+                    stats['stores'][table] = {
+                        'items': items,
+                        'size': size,
+                        'hits': meta.get(f'{table}.hits', 0),
+                        'misses': meta.get(f'{table}.misses', 0),
+                    }
+            finally:
+                connection.close()
+
+        for path in self._files(name):
+            stats['size'] += path.stat().st_size
+
+        return stats
+
+    def clear(self, name: str) -> None:
+        """
+        Remove everything cached for a repository.
+        """
+        db = self._database(name)
+        for path in [db] + [Path(str(db) + s) for s in ('-wal', '-shm')]:
+            if path.exists():
+                path.unlink()
+
+        directory = self._directory / name
+        if directory.exists():
+            shutil.rmtree(str(directory))
+
+    def remove_legacy_stores(self) -> int:
+        """
+        Remove the file stores of previous versions
+        and return the number of removed items.
+
+        The file stores only kept hashes of the keys
+        so their items can not be imported.
+        """
+        if not self._directory.exists():
+            return 0
+
+        removed = 0
+        for directory in self._directory.iterdir():
+            if not directory.is_dir():
+                continue
+
+            for path in directory.iterdir():
+                if path.is_dir() and self.LEGACY_STORE_DIR.match(path.name):
+                    removed += sum(
+                        1 for p in path.glob('**/*') if p.is_file()
+                    )
+                    shutil.rmtree(str(path))
+
+            if not any(directory.iterdir()):
+                directory.rmdir()
+
+        return removed
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used items until the cache
+        fits in its budget and return the number of removed items.
+
+        The budget applies to the size of the cache on disk:
+        the overhead of each database is shared among its items,
+        the dependency caches of pip-tools are evicted like items
+        and the databases are compacted afterwards.
+        """
+        if self._max_size is None and self._max_age is None:
+            return 0
+
+        now = round(time.time())
+        evicted = 0
+
+        items = []
+        total = 0
+        connections = {}
+        try:
+            for name in self.names():
+                db = self._database(name)
+                if db.exists():
+                    connection = self._connect(db)
+                    connections[name] = connection
+
+                    # Items deleted since the last compaction
+                    # must not be accounted for.
+                    if connection.execute(
+                        'PRAGMA freelist_count'
+                    ).fetchone()[0]:
+                        self._compact(connection)
+                    else:
+                        connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+                    rows = []
+                    for table in self._tables(connection):
+                        rows += [
+                            (accessed or 0, size or 0, name, table, key)
+                            for key, accessed, size in connection.execute(
+                                f'SELECT key, accessed, size FROM {table}'
+                            )
+                        ]
+
+                    size = self._database_size(db)
+                    total += size
+
+                    payload = sum(row[1] for row in rows)
+                    if payload:
+                        items += [
+                            (accessed, row_size * size / payload, n, t, key)
+                            for accessed, row_size, n, t, key in rows
+                        ]
+
+                for path in self._files(name):
+                    stat = path.stat()
+                    total += stat.st_size
+                    items.append(
+                        (stat.st_mtime, stat.st_size, name, None, path)
+                    )
+
+            items.sort(key=lambda item: item[0])
+
+            removed = {}
+            for accessed, size, name, table, key in items:
+                expired = (
+                    self._max_age is not None
+                    and now - accessed > self._max_age * 86400
+                )
+                too_big = self._max_size is not None and total > self._max_size
+                if not expired and not too_big:
+                    break
+
+                if table is None:
+                    key.unlink()
+                else:
+                    removed.setdefault((name, table), []).append(key)
+
+                total -= size
+                evicted += 1
+
+            for (name, table), keys in removed.items():
+                connection = connections[name]
+                with connection:
+                    for i in range(0, len(keys), 500):
+                        chunk = keys[i:i + 500]
+                        connection.execute(
+                            f'DELETE FROM {table} '
+                            f'WHERE key IN ({", ".join("?" * len(chunk))})',
+                            chunk
+                        )
+
+            for name in {name for name, _ in removed}:
+                self._compact(connections[name])
+        finally:
+            for connection in connections.values():
+                connection.close()
+
+        return evicted
+
+    def _compact(self, connection: sqlite3.Connection) -> None:
+        connection.execute('VACUUM')
+
+        # Databases in WAL mode only shrink once checkpointed
+        connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    def _database_size(self, db: Path) -> int:
+        size = 0
+        for path in [db, Path(str(db) + '-wal')]:
+            if path.exists():
+                size += path.stat().st_size
+
+        return size
+
+    def _database(self, name: str) -> Path:
+        return self._directory / f'{name}.db'
+
+    def _files(self, name: str) -> List[Path]:
+        directory = self._directory / name
+        if not directory.is_dir():
+            return []
+
+        return [p for p in directory.glob('**/*') if p.is_file()]
+
+    def _connect(self, db: Path) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(db), timeout=30)
+        with connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value)'
+            )
+            for table in self._tables(connection):
+                create_tables(connection, table)
+
+        return connection
+
+    def _tables(self, connection: sqlite3.Connection) -> List[str]:
+        return [
+            row[0] for row in connection.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'table' AND name != 'meta' ORDER BY name"
+            )
+        ]
+
+
+def parse_size(size: Union[int, str]) -> int:
+    """
+    Parse a size in bytes with an optional K, M or G suffix.
+    """
+    if isinstance(size, int):
+        return size
+
+    m = re.match(r'(?i)^\s*(\d+(?:\.\d+)?)\s*([kmg]?)b?\s*$', size)
+    if not m:
+        raise ValueError(f'Invalid size [{size}]')
+
+    factor = {
+        '': 1,
+        'k': 1024,
+        'm': 1024 ** 2,
+        'g': 1024 ** 3,
+    }[m.group(2).lower()]
+
+    return int(float(m.group(1)) * factor)
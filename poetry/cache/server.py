@@ -0,0 +1,286 @@
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Union
+
+from poetry.locations import CACHE_DIR
+
+
+def default_path() -> Path:
+    return Path(CACHE_DIR) / 'cache' / 'server.sock'
+
+
+class CacheServer:
+    """
+    A local server coordinating the retrieval of remote items
+    between concurrent Poetry processes sharing the same caches.
+
+    Clients ask for a lease on a key before retrieving an item.
+    The first one is granted the lease while the others wait
+    for the lease holder to hand over the item, so that identical
+    retrievals happening at the same time only hit the network once
+    and only the lease holder writes the item to the cache.
+
+    Handed over items are only kept for a minute:
+    the server coalesces retrievals, it is not a cache.
+    """
+
+    # Number of seconds during which handed over items are served
+    TTL = 60
+
+    # Maximum number of handed over items kept in memory
+    MAX_ITEMS = 1024
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        if path is None:
+            path = default_path()
+
+        self._path = Path(path)
+        self._server = None
+        self._thread = None
+        self._condition = threading.Condition()
+        self._leases = {}
+        self._items = OrderedDict()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def start(self) -> 'CacheServer':
+        """
+        Start serving in a background thread.
+        """
+        self._bind()
+
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self
+
+    def serve_forever(self) -> None:
+        self._bind()
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._close()
+
+    def acquire(self, key: str, owner: Any, timeout: float = 60) -> dict:
+        """
+        Return the item if it has just been retrieved
+        or grant the lease of the key to its owner.
+        """
+        deadline = time.time() + timeout
+        with self._condition:
+            while True:
+                item = self._get(key)
+                if item is not None:
+                    return {'status': 'hit', 'value': item[1]}
+
+                if key not in self._leases:
+                    self._leases[key] = owner
+
+                    return {'status': 'lease'}
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    # The lease holder is stuck,
+                    # the item is retrieved without coordination.
+                    return {'status': 'timeout'}
+
+                self._condition.wait(remaining)
+
+    def put(self, key: str, owner: Any, value: Any) -> None:
+        """
+        Hand over an item to the clients waiting for it.
+        """
+        with self._condition:
+            self._items[key] = (time.time() + self.TTL, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.MAX_ITEMS:
+                self._items.popitem(last=False)
+
+            if self._leases.get(key) is owner:
+                del self._leases[key]
+
+            self._condition.notify_all()
+
+    def release(self, key: str, owner: Any) -> None:
+        """
+        Give up a lease without handing over an item.
+        """
+        with self._condition:
+            if self._leases.get(key) is owner:
+                del self._leases[key]
+
+            self._condition.notify_all()
+
+    def release_all(self, owner: Any) -> None:
+        with self._condition:
+            for key in [k for k, o in self._leases.items() if o is owner]:
+                del self._leases[key]
+
+            self._condition.notify_all()
+
+    def _get(self, key: str) -> Union[tuple, None]:
+        if key not in self._items:
+            return None
+
+        item = self._items[key]
+        if item[0] <= time.time():
+            del self._items[key]
+
+            return None
+
+        return item
+
+    def _bind(self) -> None:
+        os.makedirs(str(self._path.parent), exist_ok=True)
+        if self._path.exists():
+            # Left over by a server which has not been stopped properly
+            self._path.unlink()
+
+        self._server = _UnixStreamServer(
+            str(self._path), self._create_handler()
+        )
+
+    def _close(self) -> None:
+        self._server.server_close()
+        if self._path.exists():
+            self._path.unlink()
+
+    def _create_handler(self):
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+
+            def handle(self):
+                owner = object()
+                try:
+                    for line in self.rfile:
+                        request = json.loads(line.decode('utf-8'))
+                        op = request['op']
+                        key = request['key']
+
+                        if op == 'acquire':
+                            response = server.acquire(
+                                key, owner, request.get('timeout', 60)
+                            )
+                        elif op == 'put':
+                            server.put(key, owner, request['value'])
+                            response = {'status': 'ok'}
+                        elif op == 'release':
+                            server.release(key, owner)
+                            response = {'status': 'ok'}
+                        else:
+                            response = {'status': 'error'}
+
+                        self.wfile.write(
+                            json.dumps(response).encode('utf-8') + b'\n'
+                        )
+                finally:
+                    # Leases of disconnected clients are released
+                    # so that a crashed process does not block the others.
+                    server.release_all(owner)
+
+        return Handler
+
+
+class _UnixStreamServer(socketserver.ThreadingMixIn,
+                        socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+
+class CacheClient:
+    """
+    A client of the cache server.
+
+    If the server is not running, items are simply
+    retrieved without coordination.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, timeout=60):
+        if path is None:
+            path = default_path()
+
+        self._path = Path(path)
+        self._timeout = timeout
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def remember(self, key: str, callback: Callable[[], Any]) -> Any:
+        """
+        Return the item handed over by another process
+        retrieving the same key or retrieve it with the callback.
+
+        Items must be serializable to JSON.
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(self._path))
+        except OSError:
+            sock.close()
+
+            return callback()
+
+        with sock, sock.makefile('rwb') as stream:
+            try:
+                response = self._send(
+                    stream,
+                    {'op': 'acquire', 'key': key, 'timeout': self._timeout}
+                )
+            except (OSError, ValueError):
+                return callback()
+
+            if response['status'] == 'hit':
+                return response['value']
+
+            if response['status'] != 'lease':
+                return callback()
+
+            try:
+                value = callback()
+            except Exception:
+                self._release(stream, key)
+
+                raise
+
+            try:
+                self._send(stream, {'op': 'put', 'key': key, 'value': value})
+            except (OSError, ValueError):
+                # The server went away but the item is still valid
+                pass
+
+            return value
+
+    def _release(self, stream, key: str) -> None:
+        try:
+            self._send(stream, {'op': 'release', 'key': key})
+        except (OSError, ValueError):
+            pass
+
+    def _send(self, stream, request: dict) -> dict:
+        stream.write(json.dumps(request).encode('utf-8') + b'\n')
+        stream.flush()
+
+        line = stream.readline()
+        if not line:
+            raise ConnectionError('The cache server closed the connection')
+
+        return json.loads(line.decode('utf-8'))
@@ -0,0 +1,381 @@
+import atexit
+import math
+import os
+import sqlite3
+import time
+
+from pathlib import Path
+from typing import Callable
+from typing import Iterable
+from typing import Union
+
+from cachy.contracts.store import Store
+
+
+class SQLiteStore(Store):
+    """
+    A cache store keeping all its items in a single SQLite database.
+
+    Items can be loaded in bulk into memory with warm_up()
+    and the database is regularly compacted to reclaim
+    the space used by expired and forgotten items.
+
+    The last access time of the items, used for eviction,
+    is updated as they are read, at most once per ACCESS_RESOLUTION,
+    and the hit and miss counters are recorded when the process exits.
+
+    If a key normalizer is given, the keys stored
+    by older versions are normalized once when connecting.
+    """
+
+    # Expiration of items stored forever
+    FOREVER = 9999999999
+
+    # Number of seconds between two compactions of the database
+    COMPACTION_INTERVAL = 7 * 24 * 3600
+
+    # Number of seconds between two updates of the access time of an item
+    ACCESS_RESOLUTION = 3600
+
+    def __init__(self,
+                 path: Union[str, Path],
+                 table: str = 'cache',
+                 key_normalizer: Union[Callable[[str], str], None] = None):
+        self._path = Path(path)
+        self._table = table
+        self._key_normalizer = key_normalizer
+        self._connection = None
+        self._warmed = {}
+        self._hits = 0
+        self._misses = 0
+        self._recording = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def table(self) -> str:
+        return self._table
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = self._connect()
+
+        return self._connection
+
+    def get(self, key):
+        payload = self._get_payload(key)
+        self._record(payload['data'] is not None)
+
+        if payload['data'] is not None:
+            self._touch(key, payload['accessed'])
+
+        return payload['data']
+
+    def has(self, key) -> bool:
+        """
+        Whether an item exists, without recording it in the statistics.
+        """
+        return self._get_payload(key)['data'] is not None
+
+    def _get_payload(self, key) -> dict:
+        if key in self._warmed:
+            row = self._warmed[key]
+        else:
+            row = self.connection.execute(
+                f'SELECT value, expiration, accessed '
+                f'FROM {self._table} WHERE key = ?',
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            return {'data': None, 'time': None, 'accessed': None}
+
+        value, expiration, accessed = row
+        if round(time.time()) >= expiration:
+            self.forget(key)
+
+            return {'data': None, 'time': None, 'accessed': None}
+
+        return {
+            'data': self.unserialize(value),
+            'time': math.ceil((expiration - round(time.time())) / 60.),
+            'accessed': accessed
+        }
+
+    def put(self, key, value, minutes):
+        self._write(key, value, self._expiration(minutes))
+
+    def forever(self, key, value):
+        self._write(key, value, self.FOREVER)
+
+    def increment(self, key, value=1):
+        payload = self._get_payload(key)
+
+        integer = int(payload['data']) + value
+
+        self.put(key, integer, int(payload['time']))
+
+        return integer
+
+    def decrement(self, key, value=1):
+        return self.increment(key, value * -1)
+
+    def forget(self, key):
+        self._warmed.pop(key, None)
+
+        with self.connection:
+            cursor = self.connection.execute(
+                f'DELETE FROM {self._table} WHERE key = ?', (key,)
+            )
+
+        return cursor.rowcount > 0
+
+    def flush(self):
+        self._warmed = {}
+
+        with self.connection:
+            self.connection.execute(f'DELETE FROM {self._table}')
+
+    def get_prefix(self):
+        return ''
+
+    def warm_up(self, keys: Union[Iterable[str], None] = None) -> int:
+        """
+        Load items into memory with as few queries as possible.
+
+        All the items are loaded if no keys are given.
+        Return the number of loaded items.
+        """
+        query = f'SELECT key, value, expiration, accessed FROM {self._table}'
+        if keys is None:
+            rows = self.connection.execute(query).fetchall()
+        else:
+            keys = [key for key in keys if key not in self._warmed]
+            rows = []
+
+            # SQLite limits the number of parameters of a query
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows += self.connection.execute(
+                    query + ' WHERE key IN ({})'.format(
+                        ', '.join('?' * len(chunk))
+                    ),
+                    chunk
+                ).fetchall()
+
+        for key, value, expiration, accessed in rows:
+            self._warmed[key] = (value, expiration, accessed)
+
+        return len(rows)
+
+    def compact(self) -> None:
+        """
+        Remove expired items and reclaim unused space.
+        """
+        with self.connection:
+            self.connection.execute(
+                f'DELETE FROM {self._table} WHERE expiration <= ?',
+                (round(time.time()),)
+            )
+            self.connection.execute(
+                'INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)',
+                (f'{self._table}.compacted_at', round(time.time()))
+            )
+
+        self.connection.execute('VACUUM')
+
+    def normalize_keys(self, normalizer: Callable[[str], str]) -> int:
+        """
+        Rename the items whose key is not normalized
+        and return the number of renamed items.
+
+        If several items share the same normalized key,
+        only one of them is kept.
+        """
+        self._warmed = {}
+
+        rows = self.connection.execute(
+            f'SELECT key FROM {self._table} '
+            f'ORDER BY accessed DESC, key'
+        ).fetchall()
+
+        renamed = 0
+        with self.connection:
+            for key, in rows:
+                normalized = normalizer(key)
+                if normalized == key:
+                    continue
+
+                self.connection.execute(
+                    f'INSERT OR IGNORE INTO {self._table} '
+                    f'(key, value, expiration, accessed, size) '
+                    f'SELECT ?, value, expiration, accessed, size '
+                    f'FROM {self._table} WHERE key = ?',
+                    (normalized, key)
+                )
+                self.connection.execute(
+                    f'DELETE FROM {self._table} WHERE key = ?', (key,)
+                )
+                renamed += 1
+
+        return renamed
+
+    def _write(self, key, value, expiration) -> None:
+        value = self.serialize(value)
+        now = round(time.time())
+
+        with self.connection:
+            self.connection.execute(
+                f'INSERT OR REPLACE INTO {self._table} '
+                f'(key, value, expiration, accessed, size) '
+                f'VALUES (?, ?, ?, ?, ?)',
+                (key, value, expiration, now, len(value))
+            )
+
+        if key in self._warmed:
+            self._warmed[key] = (value, expiration, now)
+
+    def _touch(self, key, accessed) -> None:
+        """
+        Update the access time of an item
+        unless it has been updated recently.
+        """
+        now = round(time.time())
+        if accessed is not None and now - accessed < self.ACCESS_RESOLUTION:
+            return
+
+        try:
+            with self.connection:
+                self.connection.execute(
+                    f'UPDATE {self._table} SET accessed = ? WHERE key = ?',
+                    (now, key)
+                )
+        except sqlite3.Error:
+            # Access times are not worth failing for
+            return
+
+        if key in self._warmed:
+            value, expiration, _ = self._warmed[key]
+            self._warmed[key] = (value, expiration, now)
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+        if not self._recording:
+            self._recording = True
+            atexit.register(self.flush_statistics)
+
+    def flush_statistics(self) -> None:
+        """
+        Persist the hit and miss counters.
+        """
+        if not self._hits and not self._misses or not self._path.exists():
+            return
+
+        # The store may have been used from another thread
+        # so a dedicated connection is used.
+        connection = sqlite3.connect(str(self._path), timeout=30)
+        try:
+            with connection:
+                for name, count in [('hits', self._hits),
+                                    ('misses', self._misses)]:
+                    connection.execute(
+                        'INSERT OR IGNORE INTO meta (name, value) '
+                        'VALUES (?, 0)',
+                        (f'{self._table}.{name}',)
+                    )
+                    connection.execute(
+                        'UPDATE meta SET value = value + ? WHERE name = ?',
+                        (count, f'{self._table}.{name}')
+                    )
+        except sqlite3.Error:
+            # Statistics are not worth failing for
+            pass
+        finally:
+            connection.close()
+
+        self._hits = 0
+        self._misses = 0
+
+    def _expiration(self, minutes) -> int:
+        if minutes == 0:
+            return self.FOREVER
+
+        return round(time.time()) + int(minutes * 60)
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(str(self._path.parent), exist_ok=True)
+
+        connection = sqlite3.connect(str(self._path), timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+
+        with connection:
+            create_tables(connection, self._table)
+
+        self._connection = connection
+
+        row = connection.execute(
+            'SELECT value FROM meta WHERE name = ?',
+            (f'{self._table}.compacted_at',)
+        ).fetchone()
+        if row is None:
+            with connection:
+                connection.execute(
+                    'INSERT OR IGNORE INTO meta (name, value) VALUES (?, ?)',
+                    (f'{self._table}.compacted_at', round(time.time()))
+                )
+        elif round(time.time()) - row[0] >= self.COMPACTION_INTERVAL:
+            self.compact()
+
+        if self._key_normalizer is not None:
+            row = connection.execute(
+                'SELECT value FROM meta WHERE name = ?',
+                (f'{self._table}.normalized',)
+            ).fetchone()
+            if row is None:
+                self.normalize_keys(self._key_normalizer)
+
+                with connection:
+                    connection.execute(
+                        'INSERT OR IGNORE INTO meta (name, value) '
+                        'VALUES (?, 1)',
+                        (f'{self._table}.normalized',)
+                    )
+
+        return connection
+
+
+def create_tables(connection: sqlite3.Connection, table: str) -> None:
+    """
+    Create the tables of a store if they do not exist
+    and upgrade them if they have been created by an older version.
+    """
+    connection.execute(
+        f'CREATE TABLE IF NOT EXISTS {table} ('
+        f'key TEXT PRIMARY KEY, value BLOB, expiration INTEGER, '
+        f'accessed INTEGER, size INTEGER'
+        f')'
+    )
+    connection.execute(
+        'CREATE TABLE IF NOT EXISTS meta ('
+        'name TEXT PRIMARY KEY, value'
+        ')'
+    )
+
+    columns = [
+        row[1] for row in connection.execute(f'PRAGMA table_info({table})')
+    ]
+    if 'accessed' not in columns:
+        # Tables created before eviction was supported
+        connection.execute(f'ALTER TABLE {table} ADD COLUMN accessed INTEGER')
+        connection.execute(f'ALTER TABLE {table} ADD COLUMN size INTEGER')
+        connection.execute(
+            f'UPDATE {table} SET accessed = ?, size = length(value)',
+            (round(time.time()),)
+        )
@@ -0,0 +1,46 @@
+from pathlib import Path
+from typing import Any
+
+from .locations import CONFIG_DIR
+from .utils.toml_file import TomlFile
+
+
+class Config:
+    """
+    The user configuration of Poetry.
+
+    Settings are accessed with their dotted name,
+    for instance ``settings.repositories.concurrent``.
+    """
+
+    def __init__(self, file: TomlFile):
+        self._file = file
+        if not self._file.exists():
+            self._content = {}
+        else:
+            self._content = file.read(raw=True)
+
+    @property
+    def file(self) -> TomlFile:
+        return self._file
+
+    @property
+    def content(self) -> dict:
+        return self._content
+
+    def setting(self, setting_name: str, default: Any = None) -> Any:
+        """
+        Retrieve a setting value.
+        """
+        content = self._content
+        for key in setting_name.split('.'):
+            if not isinstance(content, dict) or key not in content:
+                return default
+
+            content = content[key]
+
+        return content
+
+    @classmethod
+    def create(cls, file_name: str) -> 'Config':
+        return cls(TomlFile(Path(CONFIG_DIR) / file_name))
@@ -8,11 +8,13 @@ from poetry.utils.venv import Venv
 from .commands import AboutCommand
 from .commands import AddCommand
 from .commands import BuildCommand
+from .commands import CacheCommand
 from .commands import InstallCommand
 from .commands import LockCommand
 from .commands import NewCommand
 from .commands import RemoveCommand
 from .commands import ShowCommand
+from .commands import SnapshotCommand
 from .commands import UpdateCommand
 
 
@@ -47,11 +49,13 @@ class Application(BaseApplication):
             AboutCommand(),
             AddCommand(),
             BuildCommand(),
+            CacheCommand(),
             InstallCommand(),
             LockCommand(),
             NewCommand(),
             RemoveCommand(),
             ShowCommand(),
+            SnapshotCommand(),
             UpdateCommand(),
         ]
 
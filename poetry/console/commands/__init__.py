@@ -1,9 +1,11 @@
 from .about import AboutCommand
 from .add import AddCommand
 from .build import BuildCommand
+from .cache import CacheCommand
 from .install import InstallCommand
 from .lock import LockCommand
 from .new import NewCommand
 from .remove import RemoveCommand
 from .show import ShowCommand
+from .snapshot import SnapshotCommand
 from .update import UpdateCommand
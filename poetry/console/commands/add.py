@@ -20,6 +20,8 @@ class AddCommand(Command):
         {--optional : Add as an optional dependency. }
         {--dry-run : Outputs the operations but will not execute anything
                      (implicitly enables --verbose). }
+        {--offline : Resolve dependencies from the cache only,
+                     without accessing the network. }
     """
 
     help = """The add command adds required packages to your <comment>poetry.toml</> and installs them.
@@ -44,6 +46,9 @@ If you do not specify a version constraint, poetry will choose a suitable one ba
                 if key.lower() == name.lower():
                     raise ValueError(f'Package {name} is already present')
 
+        if self.option('offline'):
+            self.poetry.pool.offline()
+
         requirements = self._determine_requirements(packages)
         requirements = self._format_requirements(requirements)
 
@@ -64,11 +69,15 @@ If you do not specify a version constraint, poetry will choose a suitable one ba
         # Update packages
         self.reset_poetry()
 
+        if self.option('offline'):
+            self.poetry.pool.offline()
+
         installer = Installer(
             self.output,
             self.poetry.package,
             self.poetry.locker,
-            self.poetry.pool
+            self.poetry.pool,
+            self.poetry.settings
         )
 
         installer.dry_run(self.option('dry-run'))
@@ -0,0 +1,111 @@
+from poetry.cache import CacheServer
+from poetry.cache import RepositoryCache
+from poetry.config import Config
+
+from .command import Command
+
+
+class CacheCommand(Command):
+    """
+    Manages the caches of the repositories.
+
+    cache
+        { action : The action to perform (list, clear, stats or serve). }
+        { name? : The repository to act upon (all of them by default). }
+    """
+
+    help = """The <info>cache</info> command manages the caches of the repositories.
+
+<info>poetry cache list</info> lists the cached repositories and their sizes.
+<info>poetry cache stats</info> displays the items, sizes and hit rates of each store.
+<info>poetry cache clear pypi</info> removes everything cached for a repository.
+<info>poetry cache serve</info> runs the cache server.
+
+The caches can be bounded by setting a budget in the <comment>config.toml</> file:
+
+[settings.cache]
+max-size = "500M"
+max-age = 30  # days
+
+The cache server coordinates concurrent Poetry processes
+so that identical retrievals only hit the network once.
+It is used by setting <comment>server = true</> in the same section.
+"""
+
+    def handle(self):
+        action = self.argument('action')
+        if action not in ['list', 'clear', 'stats', 'serve']:
+            raise ValueError(f'Invalid action [{action}]')
+
+        if action == 'serve':
+            return self._serve()
+
+        cache = RepositoryCache.create(Config.create('config.toml'))
+        cache.remove_legacy_stores()
+
+        names = cache.names()
+        name = self.argument('name')
+        if name:
+            if name not in names:
+                raise ValueError(f'No cache found for repository [{name}]')
+
+            names = [name]
+
+        return getattr(self, f'_{action}')(cache, names)
+
+    def _list(self, cache: RepositoryCache, names: list) -> int:
+        for name in names:
+            size = cache.stats(name)['size']
+            self.line(f'<info>{name}</> <comment>{format_size(size)}</>')
+
+        return 0
+
+    def _clear(self, cache: RepositoryCache, names: list) -> int:
+        for name in names:
+            cache.clear(name)
+            self.line(f'Cleared the cache of <info>{name}</>')
+
+        return 0
+
+    def _stats(self, cache: RepositoryCache, names: list) -> int:
+        for name in names:
+            stats = cache.stats(name)
+
+            self.line(
+                f'<info>{name}</> <comment>{format_size(stats["size"])}</>'
+            )
+            for store, store_stats in stats['stores'].items():
+                lookups = store_stats['hits'] + store_stats['misses']
+                hit_rate = 'n/a'
+                if lookups:
+                    hit_rate = f'{100 * store_stats["hits"] / lookups:.1f}%'
+
+                self.line(
+                    f' - {store}: {store_stats["items"]} items, '
+                    f'{format_size(store_stats["size"])}, '
+                    f'hit rate: {hit_rate} ({lookups} lookups)'
+                )
+
+        return 0
+
+    def _serve(self) -> int:
+        server = CacheServer()
+
+        self.line(f'Serving the cache on <comment>{server.path}</>')
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+        return 0
+
+
+def format_size(size: int) -> str:
+    for unit in ['B', 'KB', 'MB']:
+        if size < 1024:
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+
+        size /= 1024
+
+    return f'{size:.1f} GB'
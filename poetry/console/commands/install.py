@@ -29,7 +29,8 @@ exist it will look for <comment>poetry.toml</> and do the same.
             self.output,
             self.poetry.package,
             self.poetry.locker,
-            self.poetry.pool
+            self.poetry.pool,
+            self.poetry.settings
         )
 
         installer.extras(self.option('extras'))
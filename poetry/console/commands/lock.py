@@ -10,6 +10,8 @@ class LockCommand(Command):
 
     lock
         { --no-dev : Do not install dev dependencies. }
+        { --offline : Resolve dependencies from the cache only,
+                      without accessing the network. }
     """
 
     help = """The <info>lock</info> command reads the <comment>poetry.toml</> file from
@@ -19,11 +21,15 @@ the current directory, processes it, and locks the depdencies in the <comment>po
 """
 
     def handle(self):
+        if self.option('offline'):
+            self.poetry.pool.offline()
+
         installer = Installer(
             self.output,
             self.poetry.package,
             self.poetry.locker,
-            self.poetry.pool
+            self.poetry.pool,
+            self.poetry.settings
         )
 
         installer.update(True)
@@ -56,7 +56,8 @@ list of installed packages
             self.output,
             self.poetry.package,
             self.poetry.locker,
-            self.poetry.pool
+            self.poetry.pool,
+            self.poetry.settings
         )
 
         installer.dry_run(self.option('dry-run'))
@@ -14,6 +14,8 @@ class ShowCommand(Command):
         { --l|latest : Show the latest version. }
         { --o|outdated : Show the latest version
                          but only for packages that are outdated. }
+        { --offline : Only use the cached information
+                      to find the latest versions. }
     """
 
     help = """The show command displays detailed information about a package, or
@@ -36,6 +38,9 @@ lists all packages available."""
         if self.option('outdated'):
             self.input.set_option('latest', True)
 
+        if self.option('offline'):
+            self.poetry.pool.offline()
+
         installed_repo = self.poetry.locker.locked_repository(True)
 
         # Show tree view if requested
@@ -0,0 +1,47 @@
+from poetry.repositories.snapshot_repository import SnapshotRepository
+
+from .command import Command
+
+
+class SnapshotCommand(Command):
+    """
+    Exports the release information of the locked packages to a snapshot.
+
+    snapshot
+        { path : The snapshot file to write. }
+        { --no-dev : Do not include dev dependencies. }
+        { --offline : Only use the cached release information. }
+    """
+
+    help = """The <info>snapshot</info> command writes the release information
+of the packages locked in the <comment>pyproject.lock</> file
+to a single file which can then be used as a source:
+
+<info>poetry snapshot snapshot.zip</info>
+
+[[tool.poetry.source]]
+name = "snapshot"
+snapshot = "snapshot.zip"
+"""
+
+    def handle(self):
+        if not self.poetry.locker.is_locked():
+            raise RuntimeError(
+                'The lock file does not exist, run the lock command first.'
+            )
+
+        if self.option('offline'):
+            self.poetry.pool.offline()
+
+        locked_repository = self.poetry.locker.locked_repository(
+            not self.option('no-dev')
+        )
+
+        path = self.argument('path')
+        count = SnapshotRepository.export(
+            path, self.poetry.pool, locked_repository.packages
+        )
+
+        self.line(
+            f'Exported <info>{count}</> releases to <comment>{path}</>'
+        )
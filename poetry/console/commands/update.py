@@ -13,16 +13,22 @@ class UpdateCommand(Command):
         { --no-dev : Do not install dev dependencies. }
         { --dry-run : Outputs the operations but will not execute anything
                       (implicitly enables --verbose). }
+        { --offline : Resolve dependencies from the cache only,
+                      without accessing the network. }
     """
 
     def handle(self):
         packages = self.argument('packages')
 
+        if self.option('offline'):
+            self.poetry.pool.offline()
+
         installer = Installer(
             self.output,
             self.poetry.package,
             self.poetry.locker,
-            self.poetry.pool
+            self.poetry.pool,
+            self.poetry.settings
         )
 
         if packages:
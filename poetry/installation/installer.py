@@ -1,7 +1,10 @@
 import sys
 
 from typing import List
+from typing import Union
 
+from poetry.cache import RepositoryCache
+from poetry.config import Config
 from poetry.packages import Dependency
 from poetry.packages import Locker
 from poetry.packages import Package
@@ -26,11 +29,13 @@ class Installer:
                  io,
                  package: Package,
                  locker: Locker,
-                 pool: Pool):
+                 pool: Pool,
+                 settings: Union[Config, None] = None):
         self._io = io
         self._package = package
         self._locker = locker
         self._pool = pool
+        self._settings = settings
 
         self._dry_run = False
         self._update = False
@@ -62,6 +67,14 @@ class Installer:
         local_repo = Repository()
         self._do_install(local_repo)
 
+        if self._settings is not None:
+            cache = RepositoryCache.create(self._settings)
+            cache.remove_legacy_stores()
+
+            if self._update:
+                # Keep the repository caches within their budget
+                cache.evict()
+
         return 0
 
     def dry_run(self, dry_run=True) -> 'Installer':
@@ -146,17 +159,42 @@ class Installer:
                             Dependency(candidate.name, candidate.version)
                         )
 
+            # The locked packages will most likely be inspected
+            # so their cached information is loaded beforehand.
+            self._pool.warm_up(locked_repository.packages)
+
             solver = Solver(
                 self._package,
                 self._pool,
                 locked_repository,
-                self._io
+                self._io,
+                engine=self._engine()
             )
 
             request = self._package.requires
             request += self._package.dev_requires
 
-            ops = solver.solve(request, fixed=fixed)
+            # When only some packages are updated the resolution
+            # starts from the lock so that the other ones are kept
+            # without looking them up again.
+            changed = None
+            if self._whitelist and self._locker.is_locked():
+                changed = list(self._whitelist.keys())
+
+            ops = solver.solve(request, fixed=fixed, changed=changed)
+
+            if self._io.is_debug():
+                stats = self._pool.session.stats()
+                self._io.writeln(
+                    f'<comment>{stats["requests"]}</> HTTP requests sent '
+                    f'over <comment>{stats["connections"]}</> connections'
+                )
+
+                parsing = VersionParser.cache_info()
+                self._io.writeln(
+                    f'<comment>{parsing.hits}</> constraints reused, '
+                    f'<comment>{parsing.misses}</> parsed'
+                )
         else:
             self._io.writeln('<info>Installing dependencies from lock file</>')
             if not self._locker.is_fresh():
@@ -314,19 +352,18 @@ class Installer:
                 package = op.package
 
             acted_on = False
-            for pkg in local_repo.packages:
-                if pkg.name == package.name:
-                    # The package we operate on is in the local repo
-                    if op.job_type == 'update':
-                        if pkg.version == package.version:
-                            break
-
-                        local_repo.remove_package(pkg)
-                        local_repo.add_package(op.target_package)
-                    elif op.job_type == 'uninstall':
-                        local_repo.remove_package(op.package)
+            for pkg in local_repo.packages_by_name(package.name):
+                # The package we operate on is in the local repo
+                if op.job_type == 'update':
+                    if pkg.version == package.version:
+                        break
+
+                    local_repo.remove_package(pkg)
+                    local_repo.add_package(op.target_package)
+                elif op.job_type == 'uninstall':
+                    local_repo.remove_package(op.package)
 
-                    acted_on = True
+                acted_on = True
 
             if not acted_on:
                 local_repo.add_package(package)
@@ -336,26 +373,25 @@ class Installer:
                                   ) -> List[Operation]:
         installed_repo = InstalledRepository.load(self._io.venv)
         ops = []
-        extras = []
+        extras = set()
         for extra_name, packages in self._locker.lock_data.get('extras').items():
             if extra_name in self._extras:
                 for package in packages:
-                    extras.append(package.lower())
+                    extras.add(package.lower())
 
         for locked in locked_repository.packages:
             is_installed = False
-            for installed in installed_repo.packages:
-                if locked.name == installed.name:
-                    is_installed = True
-                    if locked.category == 'dev' and not self.is_dev_mode():
-                        ops.append(Uninstall(locked))
-                    elif locked.is_optional() and locked.name not in extras:
-                        # Installed but optional and not requested in extras
-                        ops.append(Uninstall(locked))
-                    elif locked.version != installed.version:
-                        ops.append(Update(
-                            installed, locked
-                        ))
+            for installed in installed_repo.packages_by_name(locked.name):
+                is_installed = True
+                if locked.category == 'dev' and not self.is_dev_mode():
+                    ops.append(Uninstall(locked))
+                elif locked.is_optional() and locked.name not in extras:
+                    # Installed but optional and not requested in extras
+                    ops.append(Uninstall(locked))
+                elif locked.version != installed.version:
+                    ops.append(Update(
+                        installed, locked
+                    ))
 
             if not is_installed:
                 # If it's optional and not in required extras
@@ -409,5 +445,11 @@ class Installer:
                 if drop:
                     op.skip('Not required')
 
+    def _engine(self) -> str:
+        if self._settings is None:
+            return 'mixology'
+
+        return self._settings.setting('settings.resolver.engine', 'mixology')
+
     def _get_installer(self) -> BaseInstaller:
         return PipInstaller(self._io.venv, self._io)
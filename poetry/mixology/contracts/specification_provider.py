@@ -40,6 +40,16 @@ class SpecificationProvider:
         """
         return []
 
+    def dependencies_known(self, specification: Any) -> bool:
+        """
+        Returns whether the dependencies of specification
+        can be returned without a costly lookup.
+
+        Possibilities whose dependencies are not known
+        are only looked up when the resolver tries them.
+        """
+        return True
+
     def is_requirement_satisfied_by(self,
                                     requirement: Any,
                                     activated: DependencyGraph,
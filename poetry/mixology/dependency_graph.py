@@ -1,26 +1,106 @@
+from itertools import count
+
 from .exceptions import CircularDependencyError
-from .graph.log import Log
+from .graph.edge import Edge
+from .graph.vertex import Vertex
+from .graph.vertex import VertexState
 
 
 class DependencyGraph:
+    """
+    A directed acyclic graph of dependencies.
+
+    The graph is persistent: tagging its current state
+    and rewinding to a tagged state are constant time operations,
+    whatever the number of changes made in between.
+
+    The table of vertices and the states of the vertices
+    are shared with the tagged snapshots and only copied
+    the first time they are modified after a tag or a rewind.
+    """
 
     def __init__(self):
+        # The states of the vertices of the current snapshot
+        self._states = {}
+
+        # The vertices ever added, which read their state
+        # from the current snapshot
         self._vertices = {}
-        self._log = Log()
 
-    @property
-    def vertices(self):
-        return self._vertices
+        self._generations = count(1)
+        self._searches = count(1)
+        self._generation = 0
+        self._owns_states = True
+
+        # The stack of tagged snapshots
+        # and the positions of each tag in it
+        self._tags = []
+        self._tag_positions = {}
 
     @property
-    def log(self):
-        return self._log
+    def vertices(self):
+        return {name: self._vertices[name] for name in self._states}
 
     def tag(self, tag):
-        return self._log.tag(self, tag)
+        """
+        Tags the current state of the graph as the given tag.
+        """
+        self._tag_positions.setdefault(tag, []).append(len(self._tags))
+        self._tags.append((tag, self._states))
+        self._start_generation()
 
     def rewind_to(self, tag):
-        return self._log.rewind_to(self, tag)
+        """
+        Restores the state of the graph when it was tagged.
+
+        The tag and the ones made after it are dropped.
+        """
+        positions = self._tag_positions.get(tag)
+        if not positions:
+            raise ValueError('No tag "{}" found'.format(tag))
+
+        position = positions[-1]
+        while len(self._tags) > position:
+            popped, states = self._tags.pop()
+
+            self._tag_positions[popped].pop()
+            if not self._tag_positions[popped]:
+                del self._tag_positions[popped]
+
+        self._states = states
+        self._start_generation()
+
+    def vertex_state(self, name, writable=False):
+        """
+        Return the state of the vertex with the given name.
+
+        The state must be writable to be modified:
+        it is then copied if it is shared with a snapshot.
+
+        The vertices which are not in the graph anymore,
+        because they were detached or rewound away,
+        keep the last state they had.
+        """
+        state = self._states.get(name)
+        if state is None:
+            vertex = self._vertices[name]
+            if writable and vertex.state.generation != self._generation:
+                vertex.state = vertex.state.copy(self._generation)
+
+            return vertex.state
+
+        if writable and state.generation != self._generation:
+            state = state.copy(self._generation)
+            self._writable_states()[name] = state
+            self._vertices[name].state = state
+
+        return state
+
+    def next_search(self) -> int:
+        """
+        Return a new number identifying a search of the graph.
+        """
+        return next(self._searches)
 
     def add_child_vertex(self, name, payload, parent_names, requirement):
         root = True
@@ -33,7 +113,7 @@ class DependencyGraph:
         parent_names = [n for n in parent_names if n is not None]
         vertex = self.add_vertex(name, payload, root)
         if root:
-            vertex.explicit_requirements.append(requirement)
+            self.add_explicit_requirement(name, requirement)
 
         for parent_name in parent_names:
             parent_vertex = self.vertex_named(parent_name)
@@ -42,13 +122,63 @@ class DependencyGraph:
         return vertex
 
     def add_vertex(self, name, payload, root=False):
-        return self._log.add_vertex(self, name, payload, root)
+        if name not in self._vertices:
+            self._vertices[name] = Vertex(self, name)
+
+        vertex = self._vertices[name]
+        state = self._states.get(name)
+        if state is None:
+            state = VertexState(payload, root, self._generation)
+            self._writable_states()[name] = state
+            vertex.state = state
+        elif not state.payload or not state.root:
+            state = self.vertex_state(name, True)
+            if not state.payload:
+                state.payload = payload
+
+            if not state.root:
+                state.root = root
+
+        return vertex
 
     def detach_vertex_named(self, name):
-        return self._log.detach_vertex_named(self, name)
+        """
+        Detach the vertex with the given name
+        and its successors which are not required anymore.
+        """
+        if name not in self._states:
+            return []
+
+        state = self._writable_states().pop(name)
+
+        removed_vertices = [self._vertices[name]]
+        for e in state.outgoing_edges:
+            v = e.destination
+            if v.name not in self._states:
+                continue
+
+            destination = self.vertex_state(v.name, True)
+            self._delete_first(destination.incoming_edges, e)
+
+            if not destination.root and not destination.incoming_edges:
+                removed_vertices += self.detach_vertex_named(v.name)
+
+        for e in state.incoming_edges:
+            v = e.origin
+            if v.name not in self._states:
+                continue
+
+            self._delete_first(
+                self.vertex_state(v.name, True).outgoing_edges, e
+            )
+
+        return removed_vertices
 
     def vertex_named(self, name):
-        return self.vertices.get(name)
+        if name not in self._states:
+            return
+
+        return self._vertices[name]
 
     def root_vertex_named(self, name):
         vertex = self.vertex_named(name)
@@ -62,22 +192,57 @@ class DependencyGraph:
         return self.add_edge_no_circular(origin, destination, requirement)
 
     def add_edge_no_circular(self, origin, destination, requirement):
-        self._log.add_edge_no_circular(
-            self,
-            origin.name, destination.name,
+        edge = Edge(
+            self._vertices[origin.name],
+            self._vertices[destination.name],
             requirement
         )
 
+        self.vertex_state(origin.name, True).outgoing_edges.append(edge)
+        self.vertex_state(destination.name, True).incoming_edges.append(edge)
+
+        return edge
+
     def delete_edge(self, edge):
-        return self._log.delete_edge(
-            self,
-            edge.origin.name,
-            edge.destination.name,
-            edge.requirement
-        )
+        origin = self.vertex_state(edge.origin.name, True)
+        destination = self.vertex_state(edge.destination.name, True)
+
+        self._delete_first(origin.outgoing_edges, edge)
+        self._delete_first(destination.incoming_edges, edge)
 
     def set_payload(self, name, payload):
-        return self._log.set_payload(self, name, payload)
+        self.vertex_state(name, True).payload = payload
+
+    def add_explicit_requirement(self, name, requirement):
+        self.vertex_state(name, True).explicit_requirements.append(
+            requirement
+        )
+
+    def _start_generation(self):
+        # The current states are now shared with a snapshot
+        self._generation = next(self._generations)
+        self._owns_states = False
+
+    def _writable_states(self):
+        if not self._owns_states:
+            self._states = dict(self._states)
+            self._owns_states = True
+
+        return self._states
+
+    def _delete_first(self, elements, element):
+        for i, e in enumerate(elements):
+            if e is element:
+                del elements[i]
+
+                return
+
+        try:
+            index = elements.index(element)
+        except ValueError:
+            return
+
+        del elements[index]
 
     def to_dot(self):
         dot_vertices = []
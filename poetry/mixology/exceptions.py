@@ -29,7 +29,10 @@ class CircularDependencyError(ResolverError):
             )
         )
 
-        self._dependencies = [v.payload.possibilities[-1] for v in vertices]
+        self._dependencies = [
+            getattr(v.payload, 'possibilities', [v.payload])[-1]
+            for v in vertices
+        ]
 
     @property
     def dependencies(self):
@@ -132,3 +135,21 @@ class VersionConflict(ResolverError):
         return ''.join(o).strip()
 
 
+class VersionSolvingFailure(ResolverError):
+
+    def __init__(self, incompatibility):
+        super().__init__(
+            'Unable to find a solution because:\n\n'
+            '{}'.format(
+                '\n'.join(
+                    '- {}'.format(i)
+                    for i in incompatibility.external_incompatibilities()
+                )
+            )
+        )
+
+        self._incompatibility = incompatibility
+
+    @property
+    def incompatibility(self):
+        return self._incompatibility
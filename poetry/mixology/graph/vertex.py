@@ -1,25 +1,97 @@
 from ..utils import unique
 
-class Vertex:
 
-    def __init__(self, name, payload):
-        self.name = name
+class VertexState:
+    """
+    The state of a vertex in a snapshot of a DependencyGraph.
+
+    States are shared between snapshots:
+    they belong to the generation of the graph which created them
+    and are copied before being modified by a later one.
+    """
+
+    __slots__ = (
+        'payload',
+        'root',
+        'explicit_requirements',
+        'outgoing_edges',
+        'incoming_edges',
+        'generation',
+    )
+
+    def __init__(self, payload, root=False, generation=0):
         self.payload = payload
-        self.root = False
-        self._explicit_requirements = []
+        self.root = root
+        self.explicit_requirements = []
         self.outgoing_edges = []
         self.incoming_edges = []
+        self.generation = generation
+
+    def copy(self, generation) -> 'VertexState':
+        state = VertexState(self.payload, self.root, generation)
+        state.explicit_requirements = list(self.explicit_requirements)
+        state.outgoing_edges = list(self.outgoing_edges)
+        state.incoming_edges = list(self.incoming_edges)
+
+        return state
+
+
+class Vertex:
+    """
+    A vertex of a DependencyGraph.
+
+    The vertex reads its state from the current snapshot of the graph
+    so the same vertex can be used before and after a rewind.
+    """
+
+    def __init__(self, graph, name):
+        self._graph = graph
+        self.name = name
+
+        # The last state of the vertex in the graph
+        self.state = None
+
+        # The number of the last search which visited the vertex
+        self._search = 0
+
+    @property
+    def payload(self):
+        return self._graph.vertex_state(self.name).payload
+
+    @payload.setter
+    def payload(self, payload):
+        self._graph.vertex_state(self.name, True).payload = payload
+
+    @property
+    def root(self):
+        return self._graph.vertex_state(self.name).root
+
+    @root.setter
+    def root(self, root):
+        self._graph.vertex_state(self.name, True).root = root
 
     @property
     def explicit_requirements(self):
-        return self._explicit_requirements
-        
+        # The list is shared with the snapshots of the graph:
+        # use DependencyGraph.add_explicit_requirement() to modify it.
+        return self._graph.vertex_state(self.name).explicit_requirements
+
+    @property
+    def outgoing_edges(self):
+        return self._graph.vertex_state(self.name).outgoing_edges
+
+    @property
+    def incoming_edges(self):
+        return self._graph.vertex_state(self.name).incoming_edges
+
     @property
     def requirements(self):
+        state = self._graph.vertex_state(self.name)
+
         return unique([
-            edge.requirement for edge in self.incoming_edges
-        ] + self._explicit_requirements)
-    
+            edge.requirement for edge in state.incoming_edges
+        ] + state.explicit_requirements)
+
     @property
     def predecessors(self):
         return [edge.origin for edge in self.incoming_edges]
@@ -85,10 +157,28 @@ class Vertex:
         return hash(self.name)
 
     def has_path_to(self, other):
-        return (
-            self == other
-            or any([v.has_path_to(other) for v in self.successors])
-        )
+        """
+        Whether the other vertex can be reached from this one.
+
+        Each vertex is walked at most once: visited vertices are stamped
+        with the number of the search instead of being put in a set.
+        Stamps are not part of the state of the graph,
+        so they do not need to be restored on rewind.
+        """
+        search = self._graph.next_search()
+        self._search = search
+        stack = [self]
+        while stack:
+            vertex = stack.pop()
+            if vertex == other:
+                return True
+
+            for successor in vertex.successors:
+                if successor._search != search:
+                    successor._search = search
+                    stack.append(successor)
+
+        return False
 
     def is_ancestor(self, other):
         return other.path_to(self)
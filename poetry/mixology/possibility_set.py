@@ -1,9 +1,21 @@
 class PossibilitySet:
 
     def __init__(self, dependencies, possibilities):
-        self.dependencies = dependencies
+        """
+        :param dependencies: The dependencies shared by the possibilities
+                             or a callable returning them, in which case
+                             they will only be retrieved when first needed.
+        """
+        self._dependencies = dependencies
         self.possibilities = possibilities
 
+    @property
+    def dependencies(self):
+        if callable(self._dependencies):
+            self._dependencies = self._dependencies()
+
+        return self._dependencies
+
     @property
     def latest_version(self):
         if self.possibilities:
@@ -0,0 +1 @@
+from .resolver import PubGrubResolver
@@ -0,0 +1,144 @@
+from typing import Any
+from typing import List
+
+from .term import ROOT
+from .term import Term
+
+
+class RootCause:
+    """
+    The root project must be selected.
+    """
+
+
+class DependencyCause:
+    """
+    A package version depends on a dependency.
+    """
+
+    def __init__(self, dependency: Any):
+        self._dependency = dependency
+
+    @property
+    def dependency(self) -> Any:
+        return self._dependency
+
+
+class NoVersionsCause:
+    """
+    No version of a package matches a constraint.
+    """
+
+
+class ConflictCause:
+    """
+    The incompatibility has been derived from two others
+    while resolving a conflict.
+    """
+
+    def __init__(self,
+                 conflict: 'Incompatibility',
+                 other: 'Incompatibility'):
+        self._conflict = conflict
+        self._other = other
+
+    @property
+    def conflict(self) -> 'Incompatibility':
+        return self._conflict
+
+    @property
+    def other(self) -> 'Incompatibility':
+        return self._other
+
+
+class Incompatibility:
+    """
+    A set of terms which must not all be true at the same time.
+    """
+
+    def __init__(self, terms: List[Term], cause: Any):
+        if (
+            len(terms) != 1
+            and isinstance(cause, ConflictCause)
+            and any(t.positive and t.name == ROOT for t in terms)
+        ):
+            # The root project is always selected
+            # so it does not add anything to derived incompatibilities.
+            terms = [t for t in terms if not t.positive or t.name != ROOT]
+
+        # Terms referring to the same package are merged
+        by_name = {}
+        for term in terms:
+            if term.name in by_name:
+                term = by_name[term.name].intersect(term)
+
+            by_name[term.name] = term
+
+        self._terms = list(by_name.values())
+        self._cause = cause
+
+    @property
+    def terms(self) -> List[Term]:
+        return self._terms
+
+    @property
+    def cause(self) -> Any:
+        return self._cause
+
+    def is_failure(self) -> bool:
+        """
+        Whether the incompatibility means that
+        there is no solution at all.
+        """
+        return not self._terms or (
+            len(self._terms) == 1
+            and self._terms[0].positive
+            and self._terms[0].name == ROOT
+        )
+
+    def external_incompatibilities(self) -> List['Incompatibility']:
+        """
+        Return the incompatibilities which have not been derived
+        from others and from which this one has been derived.
+        """
+        if not isinstance(self._cause, ConflictCause):
+            return [self]
+
+        incompatibilities = []
+        for incompatibility in [self._cause.conflict, self._cause.other]:
+            for external in incompatibility.external_incompatibilities():
+                if external not in incompatibilities:
+                    incompatibilities.append(external)
+
+        return incompatibilities
+
+    def __str__(self):
+        if isinstance(self._cause, RootCause):
+            return 'the root project is selected'
+
+        if isinstance(self._cause, DependencyCause):
+            depender, dependee = self._terms
+
+            return f'{depender.describe()} depends on {dependee.describe()}'
+
+        if isinstance(self._cause, NoVersionsCause):
+            term = self._terms[0]
+            if term.constraint.is_any():
+                return f'no versions of {term.name} are available'
+
+            return f'no versions of {term.name} match {term.constraint}'
+
+        if self.is_failure():
+            return 'version solving failed'
+
+        if len(self._terms) == 1:
+            term = self._terms[0]
+            if term.positive:
+                return f'{term.describe()} is forbidden'
+
+            return f'{term.describe()} is required'
+
+        return ' and '.join(str(t) for t in self._terms) + ' are incompatible'
+
+    def __repr__(self):
+        return f'<Incompatibility {self}>'
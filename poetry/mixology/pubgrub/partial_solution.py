@@ -0,0 +1,201 @@
+from collections import OrderedDict
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Union
+
+from poetry.semver.constraints.version_range import VersionRange
+from poetry.semver.version import Version
+
+from .incompatibility import Incompatibility
+from .term import OVERLAPPING
+from .term import SUBSET
+from .term import Term
+
+
+class Assignment(Term):
+    """
+    A term of the partial solution,
+    either a decision or derived from an incompatibility.
+    """
+
+    def __init__(self,
+                 name: str,
+                 constraint,
+                 positive: bool,
+                 decision_level: int,
+                 index: int,
+                 cause: Union[Incompatibility, None] = None):
+        super().__init__(name, constraint, positive)
+
+        self._decision_level = decision_level
+        self._index = index
+        self._cause = cause
+
+    @property
+    def decision_level(self) -> int:
+        return self._decision_level
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def cause(self) -> Union[Incompatibility, None]:
+        return self._cause
+
+    def is_decision(self) -> bool:
+        return self._cause is None
+
+
+class PartialSolution:
+    """
+    The ordered assignments made so far by the resolver.
+    """
+
+    def __init__(self):
+        self._assignments = []
+        self._decisions = OrderedDict()
+
+        # The intersection of the assignments of each package:
+        # positive if at least one of them is, negative otherwise.
+        self._positive = OrderedDict()
+        self._negative = {}
+
+        self._attempted_solutions = 1
+        self._backtracking = False
+
+    @property
+    def decisions(self) -> Dict[str, Any]:
+        return self._decisions
+
+    @property
+    def decision_level(self) -> int:
+        return len(self._decisions)
+
+    @property
+    def attempted_solutions(self) -> int:
+        return self._attempted_solutions
+
+    def unsatisfied(self) -> List[Term]:
+        """
+        Return the positive terms of the packages
+        for which no version has been decided yet.
+        """
+        return [
+            term for name, term in self._positive.items()
+            if name not in self._decisions
+        ]
+
+    def decide(self, name: str, version: Version, spec: Any) -> None:
+        """
+        Select a version of a package.
+        """
+        # When a decision is made after backtracking,
+        # another solution is attempted.
+        if self._backtracking:
+            self._attempted_solutions += 1
+
+        self._backtracking = False
+        self._decisions[name] = spec
+
+        self._assign(Assignment(
+            name,
+            VersionRange(version, version, True, True),
+            True,
+            self.decision_level,
+            len(self._assignments)
+        ))
+
+    def derive(self, term: Term, cause: Incompatibility) -> None:
+        """
+        Add a term derived from an incompatibility.
+        """
+        self._assign(Assignment(
+            term.name,
+            term.constraint,
+            term.positive,
+            self.decision_level,
+            len(self._assignments),
+            cause
+        ))
+
+    def backtrack(self, decision_level: int) -> None:
+        """
+        Remove the assignments made after the given decision level.
+        """
+        self._backtracking = True
+
+        removed = set()
+        while (
+            self._assignments
+            and self._assignments[-1].decision_level > decision_level
+        ):
+            removed.add(self._assignments.pop().name)
+
+        for name in removed:
+            self._positive.pop(name, None)
+            self._negative.pop(name, None)
+            self._decisions.pop(name, None)
+
+        for assignment in self._assignments:
+            if assignment.name in removed:
+                self._register(assignment)
+
+    def satisfies(self, term: Term) -> bool:
+        return self.relation(term) == SUBSET
+
+    def relation(self, term: Term) -> str:
+        positive = self._positive.get(term.name)
+        if positive is not None:
+            return positive.relation(term)
+
+        negative = self._negative.get(term.name)
+        if negative is None:
+            return OVERLAPPING
+
+        return negative.relation(term)
+
+    def satisfier(self, term: Term) -> Assignment:
+        """
+        Return the earliest assignment which,
+        together with the previous ones, satisfies the term.
+        """
+        assigned = None
+        for assignment in self._assignments:
+            if assignment.name != term.name:
+                continue
+
+            if assigned is None:
+                assigned = assignment
+            else:
+                assigned = assigned.intersect(assignment)
+
+            if assigned.satisfies(term):
+                return assignment
+
+        raise RuntimeError(f'[BUG] {term} is not satisfied')
+
+    def _assign(self, assignment: Assignment) -> None:
+        self._assignments.append(assignment)
+        self._register(assignment)
+
+    def _register(self, assignment: Assignment) -> None:
+        name = assignment.name
+
+        positive = self._positive.get(name)
+        if positive is not None:
+            self._positive[name] = positive.intersect(assignment)
+
+            return
+
+        term = assignment
+        negative = self._negative.get(name)
+        if negative is not None:
+            term = negative.intersect(assignment)
+
+        if term.positive:
+            self._negative.pop(name, None)
+            self._positive[name] = term
+        else:
+            self._negative[name] = term
@@ -0,0 +1,453 @@
+from datetime import datetime
+from typing import Any
+from typing import List
+from typing import Union
+
+from poetry.semver.constraints.version_range import VersionRange
+from poetry.semver.version import Version
+
+from ..contracts import SpecificationProvider
+from ..contracts import UI
+from ..dependency_graph import DependencyGraph
+from ..exceptions import VersionSolvingFailure
+from .incompatibility import ConflictCause
+from .incompatibility import DependencyCause
+from .incompatibility import Incompatibility
+from .incompatibility import NoVersionsCause
+from .incompatibility import RootCause
+from .partial_solution import PartialSolution
+from .term import DISJOINT
+from .term import OVERLAPPING
+from .term import ROOT
+from .term import Term
+
+_CONFLICT = object()
+
+
+class PubGrubResolver:
+    """
+    A conflict-driven resolver implementing the PubGrub algorithm.
+
+    When a conflict is found, the resolver derives an incompatibility
+    explaining it and jumps back directly to the decision causing it.
+    Derived incompatibilities are kept so that the same conflict
+    is never explored twice.
+
+    It has the same interface as the Resolver class:
+    it relies on the same specification provider
+    and returns the same dependency graph.
+    """
+
+    def __init__(self,
+                 specification_provider: SpecificationProvider,
+                 resolver_ui: UI):
+        self._specification_provider = specification_provider
+        self._resolver_ui = resolver_ui
+
+    @property
+    def specification_provider(self) -> SpecificationProvider:
+        return self._specification_provider
+
+    @property
+    def ui(self) -> UI:
+        return self._resolver_ui
+
+    def resolve(self,
+                requested: List[Any],
+                base: Union[DependencyGraph, None] = None) -> DependencyGraph:
+        return _Resolution(
+            self._specification_provider,
+            self._resolver_ui,
+            requested,
+            base or DependencyGraph()
+        ).resolve()
+
+
+class _Resolution:
+
+    def __init__(self,
+                 provider: SpecificationProvider,
+                 ui: UI,
+                 requested: List[Any],
+                 base: DependencyGraph):
+        self._provider = provider
+        self._ui = ui
+        self._requested = requested
+        self._locked = {
+            name: vertex.payload for name, vertex in base.vertices.items()
+        }
+
+        self._solution = PartialSolution()
+        self._incompatibilities = {}
+
+        # The dependencies found for each package name
+        # and the specifications matching them
+        self._dependencies = {}
+        self._candidates = {}
+
+        # The dependencies of the decided specifications
+        self._dependencies_of = {}
+
+        self._iteration_counter = 0
+        self._iteration_rate = None
+        self._started_at = None
+
+    def resolve(self) -> DependencyGraph:
+        self._started_at = datetime.now()
+        self._ui.before_resolution()
+
+        try:
+            self._add_incompatibility(Incompatibility(
+                [Term(ROOT, VersionRange(), False)], RootCause()
+            ))
+
+            name = ROOT
+            while name is not None:
+                self._propagate(name)
+                self._indicate_progress()
+                name = self._choose_package_version()
+
+            self._debug(
+                f'Version solving took '
+                f'{(datetime.now() - self._started_at).total_seconds():.3f} '
+                f'seconds.\n'
+                f'Tried {self._solution.attempted_solutions} solutions.'
+            )
+
+            return self._build_graph()
+        finally:
+            self._ui.after_resolution()
+
+    def _propagate(self, name: str) -> None:
+        """
+        Derive the terms implied by the incompatibilities
+        of the packages whose assignments have changed.
+        """
+        changed = {name}
+        while changed:
+            name = changed.pop()
+
+            # The most recent incompatibilities are the most likely
+            # to be relevant so they are checked first.
+            for incompatibility in reversed(self._incompatibilities[name]):
+                result = self._propagate_incompatibility(incompatibility)
+                if result is _CONFLICT:
+                    root_cause = self._resolve_conflict(incompatibility)
+
+                    changed.clear()
+                    changed.add(self._propagate_incompatibility(root_cause))
+
+                    break
+
+                if result is not None:
+                    changed.add(result)
+
+    def _propagate_incompatibility(self,
+                                   incompatibility: Incompatibility) -> Any:
+        unsatisfied = None
+        for term in incompatibility.terms:
+            relation = self._solution.relation(term)
+            if relation == DISJOINT:
+                # The incompatibility can not be satisfied anymore
+                return
+
+            if relation == OVERLAPPING:
+                if unsatisfied is not None:
+                    # More than one term is undecided
+                    return
+
+                unsatisfied = term
+
+        if unsatisfied is None:
+            return _CONFLICT
+
+        self._debug(f'Derived {unsatisfied.inverse} from {incompatibility}')
+        self._solution.derive(unsatisfied.inverse, incompatibility)
+
+        return unsatisfied.name
+
+    def _resolve_conflict(self,
+                          incompatibility: Incompatibility) -> Incompatibility:
+        """
+        Derive the root cause of a conflict, backtrack
+        to the decision level at which it is not satisfied anymore
+        and return it.
+        """
+        self._debug(f'Conflict: {incompatibility}')
+
+        new_incompatibility = False
+        while not incompatibility.is_failure():
+            # The term satisfied last and its satisfier
+            most_recent_term = None
+            most_recent_satisfier = None
+            difference = None
+
+            # The decision level at which the incompatibility
+            # is not satisfied anymore
+            previous_satisfier_level = 1
+
+            for term in incompatibility.terms:
+                satisfier = self._solution.satisfier(term)
+                if most_recent_satisfier is None:
+                    most_recent_term = term
+                    most_recent_satisfier = satisfier
+                elif most_recent_satisfier.index < satisfier.index:
+                    previous_satisfier_level = max(
+                        previous_satisfier_level,
+                        most_recent_satisfier.decision_level
+                    )
+                    most_recent_term = term
+                    most_recent_satisfier = satisfier
+                    difference = None
+                else:
+                    previous_satisfier_level = max(
+                        previous_satisfier_level, satisfier.decision_level
+                    )
+
+                if most_recent_term is term:
+                    # The satisfier may only partially satisfy the term,
+                    # the rest is satisfied by a previous assignment.
+                    difference = most_recent_satisfier.difference(
+                        most_recent_term
+                    )
+                    if difference.is_empty():
+                        difference = None
+                    else:
+                        previous_satisfier_level = max(
+                            previous_satisfier_level,
+                            self._solution.satisfier(
+                                difference.inverse
+                            ).decision_level
+                        )
+
+            if (
+                previous_satisfier_level < most_recent_satisfier.decision_level
+                or most_recent_satisfier.is_decision()
+            ):
+                self._solution.backtrack(previous_satisfier_level)
+                if new_incompatibility:
+                    self._add_incompatibility(incompatibility)
+
+                return incompatibility
+
+            # The incompatibility and the cause of the satisfier
+            # can not be both satisfied: merge them into
+            # an incompatibility closer to the root cause.
+            cause = most_recent_satisfier.cause
+            terms = [
+                t for t in incompatibility.terms if t is not most_recent_term
+            ]
+            terms += [
+                t for t in cause.terms if t.name != most_recent_satisfier.name
+            ]
+            if difference is not None:
+                terms.append(difference.inverse)
+
+            incompatibility = Incompatibility(
+                terms, ConflictCause(incompatibility, cause)
+            )
+            new_incompatibility = True
+
+            self._debug(f'Derived {incompatibility}')
+
+        raise VersionSolvingFailure(incompatibility)
+
+    def _choose_package_version(self) -> Union[str, None]:
+        """
+        Select a version of the package with the fewest candidates
+        and return its name, or None if every package is decided.
+        """
+        unsatisfied = self._solution.unsatisfied()
+        if not unsatisfied:
+            return
+
+        if unsatisfied[0].name == ROOT:
+            self._decide(ROOT, Version.parse('0'), None, self._requested)
+
+            return ROOT
+
+        candidates = {
+            term.name: [
+                (version, spec)
+                for version, spec in self._candidates_for(term.name)
+                if term.constraint.allows(version)
+            ]
+            for term in unsatisfied
+        }
+        term = min(unsatisfied, key=lambda t: len(candidates[t.name]))
+        candidates = candidates[term.name]
+
+        if not candidates:
+            self._add_incompatibility(
+                Incompatibility([term], NoVersionsCause())
+            )
+
+            return term.name
+
+        version, spec = self._preferred(term.name, candidates)
+        dependencies = self._provider.dependencies_for(spec)
+
+        self._decide(term.name, version, spec, dependencies)
+
+        return term.name
+
+    def _decide(self,
+                name: str,
+                version: Version,
+                spec: Any,
+                dependencies: List[Any]) -> None:
+        conflict = False
+        for dependency in dependencies:
+            dependency_name = self._provider.name_for(dependency)
+            if dependency_name == name:
+                continue
+
+            self._dependencies.setdefault(dependency_name, [])
+            if dependency not in self._dependencies[dependency_name]:
+                self._dependencies[dependency_name].append(dependency)
+                self._candidates.pop(dependency_name, None)
+
+            incompatibility = Incompatibility(
+                [
+                    Term(name, VersionRange(version, version, True, True)),
+                    Term(
+                        dependency_name,
+                        dependency.constraint.to_range(),
+                        False
+                    )
+                ],
+                DependencyCause(dependency)
+            )
+            self._add_incompatibility(incompatibility)
+
+            # If the incompatibility is already satisfied
+            # selecting this version would lead to a conflict.
+            conflict = conflict or all(
+                t.name == name or self._solution.satisfies(t)
+                for t in incompatibility.terms
+            )
+
+        if conflict:
+            return
+
+        self._dependencies_of[name] = dependencies
+        self._solution.decide(name, version, spec)
+
+        if name != ROOT:
+            self._debug(f'Selecting {name} ({version})')
+
+    def _candidates_for(self, name: str) -> list:
+        """
+        Return the specifications matching the dependencies
+        found for a package, sorted by ascending version.
+        """
+        if name in self._candidates:
+            return self._candidates[name]
+
+        dependencies = self._dependencies[name]
+        activated = self._activated(name, dependencies)
+
+        # Dependencies with extras come first
+        # so that their specifications are the ones kept.
+        dependencies = sorted(
+            dependencies, key=lambda d: -len(getattr(d, 'extras', []))
+        )
+
+        candidates = {}
+        for dependency in dependencies:
+            for spec in self._provider.search_for(dependency):
+                version = Version.parse(str(spec.version))
+                if version in candidates:
+                    continue
+
+                if self._provider.is_requirement_satisfied_by(
+                    dependency, activated, spec
+                ):
+                    candidates[version] = spec
+
+        self._candidates[name] = sorted(candidates.items())
+
+        return self._candidates[name]
+
+    def _preferred(self, name: str, candidates: list) -> tuple:
+        """
+        Return the locked version of a package if it is a candidate
+        or the latest candidate otherwise.
+        """
+        locked = self._locked.get(name)
+        if locked is not None:
+            activated = self._activated(
+                name, self._dependencies[name] + [locked]
+            )
+            for version, spec in reversed(candidates):
+                if self._provider.is_requirement_satisfied_by(
+                    locked, activated, spec
+                ):
+                    return version, spec
+
+        return candidates[-1]
+
+    def _activated(self,
+                   name: str,
+                   requirements: List[Any]) -> DependencyGraph:
+        """
+        Return a graph holding the package as the specification provider
+        would see it, with the given requirements.
+        """
+        activated = DependencyGraph()
+        activated.add_vertex(name, None, True)
+        for requirement in requirements:
+            activated.add_explicit_requirement(name, requirement)
+
+        return activated
+
+    def _add_incompatibility(self, incompatibility: Incompatibility) -> None:
+        for term in incompatibility.terms:
+            self._incompatibilities.setdefault(term.name, [])
+            self._incompatibilities[term.name].append(incompatibility)
+
+    def _build_graph(self) -> DependencyGraph:
+        decisions = self._solution.decisions
+        graph = DependencyGraph()
+
+        for dependency in self._requested:
+            name = self._provider.name_for(dependency)
+            if graph.vertex_named(name) is None:
+                graph.add_vertex(name, decisions[name], True)
+
+            graph.add_explicit_requirement(name, dependency)
+
+        for name, spec in decisions.items():
+            if name != ROOT and graph.vertex_named(name) is None:
+                graph.add_vertex(name, spec)
+
+        for name in decisions:
+            if name == ROOT:
+                continue
+
+            origin = graph.vertex_named(name)
+            for dependency in self._dependencies_of[name]:
+                destination = graph.vertex_named(
+                    self._provider.name_for(dependency)
+                )
+                if destination is not None and destination is not origin:
+                    graph.add_edge(origin, destination, dependency)
+
+        return graph
+
+    def _indicate_progress(self) -> None:
+        self._iteration_counter += 1
+        progress_rate = self._ui.progress_rate
+        if self._iteration_rate is None:
+            elapsed = (datetime.now() - self._started_at).total_seconds()
+            if elapsed >= progress_rate:
+                self._iteration_rate = self._iteration_counter
+
+        if (
+            self._iteration_rate
+            and (self._iteration_counter % self._iteration_rate) == 0
+        ):
+            self._ui.indicate_progress()
+
+    def _debug(self, message: str) -> None:
+        self._ui.debug(message, self._solution.decision_level)
@@ -0,0 +1,153 @@
+from poetry.semver.constraints.version_range import VersionConstraint
+
+# Name of the virtual package depending on the requested dependencies
+ROOT = '<root>'
+
+# Relations between two terms
+SUBSET = 'subset'
+DISJOINT = 'disjoint'
+OVERLAPPING = 'overlapping'
+
+
+class Term:
+    """
+    A statement about a package which is either true or false
+    for a given selection of package versions.
+
+    A positive term is true if a version allowed by the constraint
+    is selected, a negative one if no such version is selected
+    (which includes not selecting the package at all).
+    """
+
+    def __init__(self,
+                 name: str,
+                 constraint: VersionConstraint,
+                 positive: bool = True):
+        self._name = name
+        self._constraint = constraint
+        self._positive = positive
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def constraint(self) -> VersionConstraint:
+        return self._constraint
+
+    @property
+    def positive(self) -> bool:
+        return self._positive
+
+    @property
+    def inverse(self) -> 'Term':
+        return Term(self._name, self._constraint, not self._positive)
+
+    def is_empty(self) -> bool:
+        """
+        Whether the term can never be true.
+        """
+        return self._positive and self._constraint.is_empty()
+
+    def satisfies(self, other: 'Term') -> bool:
+        """
+        Whether this term being true implies that the other one is.
+        """
+        return (
+            self._name == other.name
+            and self.relation(other) == SUBSET
+        )
+
+    def relation(self, other: 'Term') -> str:
+        """
+        Return the relation between the selections
+        for which this term and the other one are true.
+        """
+        constraint = self._constraint
+        other_constraint = other.constraint
+
+        if other.positive:
+            if self._positive:
+                if not constraint.allows_any(other_constraint):
+                    return DISJOINT
+
+                if other_constraint.allows_all(constraint):
+                    return SUBSET
+
+                return OVERLAPPING
+
+            if constraint.allows_all(other_constraint):
+                return DISJOINT
+
+            return OVERLAPPING
+
+        if self._positive:
+            if not other_constraint.allows_any(constraint):
+                return SUBSET
+
+            if other_constraint.allows_all(constraint):
+                return DISJOINT
+
+            return OVERLAPPING
+
+        if constraint.allows_all(other_constraint):
+            return SUBSET
+
+        return OVERLAPPING
+
+    def intersect(self, other: 'Term') -> 'Term':
+        """
+        Return a term true when both this term and the other one are.
+        """
+        if self._positive != other.positive:
+            if self._positive:
+                positive, negative = self, other
+            else:
+                positive, negative = other, self
+
+            return Term(
+                self._name,
+                positive.constraint.difference(negative.constraint)
+            )
+
+        if self._positive:
+            return Term(
+                self._name, self._constraint.intersect(other.constraint)
+            )
+
+        return Term(
+            self._name, self._constraint.union(other.constraint), False
+        )
+
+    def difference(self, other: 'Term') -> 'Term':
+        """
+        Return a term true when this term is but the other one is not.
+        """
+        return self.intersect(other.inverse)
+
+    def describe(self) -> str:
+        """
+        Describe the package and the versions of the term.
+        """
+        if self._name == ROOT:
+            return 'the root project'
+
+        constraint = self._constraint
+        if constraint.is_any():
+            return self._name
+
+        if len(constraint.ranges) == 1:
+            r = constraint.ranges[0]
+            if r.min is not None and r.min == r.max:
+                return f'{self._name} ({r.min.text})'
+
+        return f'{self._name} ({constraint})'
+
+    def __str__(self):
+        if self._positive:
+            return self.describe()
+
+        return f'not {self.describe()}'
+
+    def __repr__(self):
+        return f'<Term {self}>'
@@ -188,10 +188,9 @@ class Resolution:
         """
         graph = DependencyGraph()
         for requested in self._original_requested:
-            vertex = graph.add_vertex(
-                self._provider.name_for(requested), None, True
-            )
-            vertex.explicit_requirements.append(requested)
+            name = self._provider.name_for(requested)
+            graph.add_vertex(name, None, True)
+            graph.add_explicit_requirement(name, requested)
 
         graph.tag('initial_state')
 
@@ -927,6 +926,22 @@ class Resolution:
         current_possibility_set = None
 
         for possibility in reversed(possibilities):
+            if not self._provider.dependencies_known(possibility):
+                # Retrieving the dependencies of every possibility upfront
+                # is costly since most of them will never be tried,
+                # so the possibility gets its own set and its dependencies
+                # are only retrieved when the resolver actually needs them.
+                possibility_sets.insert(
+                    0,
+                    PossibilitySet(
+                        lambda p=possibility: self._provider.dependencies_for(p),
+                        [possibility]
+                    )
+                )
+                current_possibility_set = None
+
+                continue
+
             dependencies = self._provider.dependencies_for(possibility)
             if current_possibility_set and current_possibility_set.dependencies == dependencies:
                 current_possibility_set.possibilities.insert(0, possibility)
@@ -1,6 +1,5 @@
 import poetry.packages
 
-from poetry.semver.constraints import Constraint
 from poetry.semver.constraints import MultiConstraint
 from poetry.semver.constraints.base_constraint import BaseConstraint
 from poetry.semver.version_parser import VersionParser
@@ -99,7 +98,7 @@ class Dependency:
         """
         return (
             self._name == package.name
-            and self._constraint.matches(Constraint('=', package.version))
+            and self._constraint.matches(package.version_constraint)
             and (not package.is_prerelease() or self.allows_prereleases())
         )
 
@@ -181,7 +181,15 @@ class Locker:
             if dependency.is_optional():
                 continue
 
-            dependencies[dependency.pretty_name] = dependency.pretty_constraint
+            if dependency.extras:
+                # The dependencies of the extras are only retrieved
+                # if the lock file keeps track of the extras.
+                dependencies[dependency.pretty_name] = {
+                    'version': dependency.pretty_constraint,
+                    'extras': list(dependency.extras),
+                }
+            else:
+                dependencies[dependency.pretty_name] = dependency.pretty_constraint
 
         data = {
             'name': package.pretty_name,
@@ -1,6 +1,8 @@
 from typing import Union
 
+from poetry.semver.constraints import Constraint
 from poetry.semver.helpers import parse_stability
+from poetry.semver.version import Version
 from poetry.semver.version_parser import VersionParser
 
 from .dependency import Dependency
@@ -43,6 +45,7 @@ class Package:
 
         self._version = version
         self._pretty_version = pretty_version or version
+        self._version_constraint = None
 
         self.description = ''
 
@@ -64,6 +67,7 @@ class Package:
         self.requires = []
         self.dev_requires = []
         self.extras = {}
+        self.requires_extras = []
 
         self._parser = VersionParser()
 
@@ -95,6 +99,20 @@ class Package:
     def pretty_version(self):
         return self._pretty_version
 
+    @property
+    def parsed_version(self) -> Version:
+        return self.version_constraint.parsed_version
+
+    @property
+    def version_constraint(self) -> Constraint:
+        """
+        The constraint matching exactly the version of the package.
+        """
+        if self._version_constraint is None:
+            self._version_constraint = Constraint('==', self._version)
+
+        return self._version_constraint
+
     @property
     def unique_name(self):
         return self.name + '-' + self._version
@@ -1,10 +1,13 @@
 from pathlib import Path
 
 from .__version__ import __version__
+from .cache import CacheClient
+from .config import Config
 from .packages import Locker
 from .packages import Package
 from .repositories import Pool
 from .repositories.pypi_repository import PyPiRepository
+from .repositories.session import Session
 from .semver.helpers import normalize_version
 from .utils.toml_file import TomlFile
 
@@ -17,14 +20,26 @@ class Poetry:
                  file: Path,
                  config: dict,
                  package: Package,
-                 locker: Locker):
+                 locker: Locker,
+                 settings: Config):
         self._file = TomlFile(file)
         self._package = package
         self._config = config
         self._locker = locker
+        self._settings = settings
 
         # Configure sources
-        self._pool = Pool()
+        cache_client = None
+        if settings.setting('settings.cache.server', False):
+            cache_client = CacheClient()
+
+        self._pool = Pool(
+            session=Session.create(settings),
+            concurrent=settings.setting(
+                'settings.repositories.concurrent', False
+            ),
+            cache_client=cache_client
+        )
         for source in self._config.get('source', []):
             self._pool.configure(source)
 
@@ -47,6 +62,10 @@ class Poetry:
     def locker(self) -> Locker:
         return self._locker
 
+    @property
+    def settings(self) -> Config:
+        return self._settings
+
     @property
     def pool(self) -> Pool:
         return self._pool
@@ -104,4 +123,7 @@ class Poetry:
 
         locker = Locker(poetry_file.with_suffix('.lock'), local_config)
 
-        return cls(poetry_file, local_config, package, locker)
+        return cls(
+            poetry_file, local_config, package, locker,
+            Config.create('config.toml')
+        )
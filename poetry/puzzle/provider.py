@@ -1,7 +1,6 @@
 import os
 import shutil
 
-from functools import cmp_to_key
 from pathlib import Path
 from tempfile import mkdtemp
 from typing import Dict
@@ -10,6 +9,7 @@ from typing import List
 from poetry.mixology import DependencyGraph
 from poetry.mixology.conflict import Conflict
 from poetry.mixology.contracts import SpecificationProvider
+from poetry.mixology.exceptions import ResolverError
 
 from poetry.packages import Dependency
 from poetry.packages import Package
@@ -17,8 +17,6 @@ from poetry.packages import VCSDependency
 
 from poetry.repositories import Pool
 
-from poetry.semver import less_than
-
 from poetry.utils.toml_file import TomlFile
 from poetry.utils.venv import Venv
 
@@ -29,15 +27,43 @@ class Provider(SpecificationProvider):
 
     UNSAFE_PACKAGES = {'setuptools', 'distribute', 'pip'}
 
-    def __init__(self, package: Package, pool: Pool):
+    def __init__(self,
+                 package: Package,
+                 pool: Pool,
+                 locked: List[Package] = None):
         self._package = package
         self._pool = pool
         self._python_constraint = package.python_constraint
+        self._search_for = {}
+        self._search_for_hits = 0
+        self._search_for_misses = 0
+
+        # Locked packages which can be reused as is
+        self._locked = {p.name: p for p in locked or []}
+        self._reused = set()
+
+        # The packages whose release information has been retrieved,
+        # by identity since packages only compare by name and version
+        self._completed = {}
 
     @property
     def pool(self) -> Pool:
         return self._pool
 
+    @property
+    def search_for_stats(self) -> dict:
+        return {
+            'hits': self._search_for_hits,
+            'misses': self._search_for_misses,
+        }
+
+    @property
+    def reused_packages(self) -> List[str]:
+        """
+        The names of the locked packages reused so far.
+        """
+        return sorted(self._reused)
+
     @property
     def name_for_explicit_dependency_source(self) -> str:
         return 'poetry.toml'
@@ -58,25 +84,88 @@ class Provider(SpecificationProvider):
 
         The specifications in the returned list will be considered in reverse
         order, so the latest version ought to be last.
+
+        Results are kept until clear_cache() is called,
+        at the end of the resolution.
         """
-        if dependency.is_vcs():
-            return self.search_for_vcs(dependency)
+        key = self._search_key(dependency)
+        if key in self._search_for:
+            self._search_for_hits += 1
 
-        packages = self._pool.find_packages(
-            dependency.name,
-            dependency.constraint,
-            extras=dependency.extras,
-        )
+            return list(self._search_for[key])
+
+        self._search_for_misses += 1
 
-        packages.sort(
-            key=cmp_to_key(
-                lambda x, y:
-                0 if x.version == y.version
-                else -1 * int(less_than(x.version, y.version) or -1)
+        locked = self._locked_package_for(dependency)
+        if locked is not None:
+            packages = [locked]
+        elif dependency.is_vcs():
+            packages = self.search_for_vcs(dependency)
+        else:
+            packages = self._pool.find_packages(
+                dependency.name,
+                dependency.constraint,
+                extras=dependency.extras,
             )
+
+            packages.sort(key=lambda p: p.parsed_version)
+
+        self._search_for[key] = packages
+
+        return list(packages)
+
+    def clear_cache(self) -> None:
+        self._search_for = {}
+        self._completed = {}
+
+    def _locked_package_for(self, dependency: Dependency) -> Package:
+        """
+        Return the locked package satisfying the dependency, if any.
+
+        Locked packages are returned without looking up
+        the repositories, which keeps the previous decisions
+        of the packages which are not affected by a change.
+        """
+        locked = self._locked.get(dependency.name)
+        if locked is None:
+            return
+
+        if dependency.extras:
+            # The dependencies of the extras are not in the lock file
+            # so the package can not be reused for any dependency.
+            if locked.name in self._reused:
+                raise ResolverError(
+                    f'The locked package {locked.name} '
+                    f'does not provide the extras of {dependency}'
+                )
+
+            del self._locked[locked.name]
+
+            return
+
+        if dependency.is_vcs():
+            if (
+                locked.source_type != dependency.vcs
+                or locked.source_url != dependency.source
+            ):
+                return
+        elif locked.source_type or not dependency.accepts(locked):
+            return
+
+        self._reused.add(locked.name)
+
+        return locked
+
+    def _search_key(self, dependency: Dependency) -> tuple:
+        key = (
+            dependency.name,
+            str(dependency.constraint),
+            tuple(dependency.extras)
         )
+        if dependency.is_vcs():
+            key += (dependency.vcs, dependency.source, dependency.reference)
 
-        return packages
+        return key
 
     def search_for_vcs(self, dependency: VCSDependency) -> List[Package]:
         """
@@ -147,11 +236,8 @@ class Provider(SpecificationProvider):
         return [package]
 
     def dependencies_for(self, package: Package):
-        if package.source_type == 'git':
-            # Information should already be set
-            pass
-        else:
-            package = self._pool.package(package.name, package.version)
+        if not self.dependencies_known(package):
+            self.complete_package(package)
 
         return [
             r for r in package.requires
@@ -159,6 +245,44 @@ class Provider(SpecificationProvider):
             and r.name not in self.UNSAFE_PACKAGES
         ]
 
+    def dependencies_known(self, package: Package) -> bool:
+        """
+        Whether the dependencies of a package can be returned
+        without retrieving its release information.
+        """
+        # The information of VCS packages is already set
+        # and the dependencies of locked packages are in the lock file.
+        return (
+            package.source_type == 'git'
+            or self._locked.get(package.name) is package
+            or id(package) in self._completed
+        )
+
+    def complete_package(self, package: Package) -> Package:
+        """
+        Retrieve the full release information of a package
+        returned by search_for() and update it accordingly.
+        """
+        complete_package = self._pool.package(
+            package.name, package.version,
+            extras=package.requires_extras
+        )
+
+        if complete_package is None:
+            raise ValueError(
+                f'Package [{package.name}] ({package.version}) not found.'
+            )
+
+        if complete_package is not package:
+            package.description = complete_package.description
+            package.requires = complete_package.requires
+            package.extras = complete_package.extras
+            package.hashes = complete_package.hashes
+
+        self._completed[id(package)] = package
+
+        return package
+
     def is_requirement_satisfied_by(self,
                                     requirement: Dependency,
                                     activated: DependencyGraph,
@@ -179,7 +303,9 @@ class Provider(SpecificationProvider):
             if not any([r.allows_prereleases() for r in vertex.requirements]):
                 return False
 
-        return self._package.python_constraint.matches(package.python_constraint)
+        return self._package.python_constraint.to_range().allows_any(
+            package.python_constraint
+        )
 
     def sort_dependencies(self,
                           dependencies: List[Dependency],
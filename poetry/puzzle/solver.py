@@ -3,6 +3,7 @@ from typing import List
 from poetry.mixology import Resolver
 from poetry.mixology.dependency_graph import DependencyGraph
 from poetry.mixology.exceptions import ResolverError
+from poetry.mixology.pubgrub import PubGrubResolver
 
 from poetry.semver.version_parser import VersionParser
 
@@ -18,25 +19,48 @@ from .ui import UI
 
 class Solver:
 
-    def __init__(self, package, pool, locked, io):
+    RESOLVERS = {
+        'mixology': Resolver,
+        'pubgrub': PubGrubResolver,
+    }
+
+    def __init__(self, package, pool, locked, io, engine='mixology'):
         self._package = package
         self._pool = pool
         self._locked = locked
         self._io = io
 
-    def solve(self, requested, fixed=None) -> List[Operation]:
-        resolver = Resolver(Provider(self._package, self._pool), UI(self._io))
+        if engine not in self.RESOLVERS:
+            raise ValueError(f'Invalid resolver engine [{engine}]')
 
-        base = None
-        if fixed is not None:
-            base = DependencyGraph()
-            for fixed_req in fixed:
-                base.add_vertex(fixed_req.name, fixed_req, True)
+        self._engine = engine
+
+    @property
+    def engine(self) -> str:
+        return self._engine
+
+    def solve(self, requested, fixed=None, changed=None) -> List[Operation]:
+        """
+        Resolve the requested dependencies
+        and return the operations to perform.
+
+        If the names of the changed requirements are given,
+        the resolution starts from the locked packages:
+        only the changed requirements and their dependencies
+        are looked up, the other packages are kept as they are.
+        If they can not be kept, a full resolution is performed.
+        """
+        locked = None
+        if changed is not None:
+            locked = self._reusable_packages(requested, changed)
 
         try:
-            graph = resolver.resolve(requested, base=base)
-        except ResolverError as e:
-            raise SolverProblemError(e)
+            graph = self._resolve(requested, fixed, locked)
+        except SolverProblemError:
+            if locked is None:
+                raise
+
+            graph = self._resolve(requested, fixed)
 
         packages = [v.payload for v in graph.vertices.values()]
 
@@ -104,6 +128,81 @@ class Solver:
 
         return list(reversed(operations))
 
+    def _resolve(self, requested, fixed=None, locked=None):
+        provider = Provider(self._package, self._pool, locked)
+        resolver = self.RESOLVERS[self._engine](provider, UI(self._io))
+
+        base = None
+        if fixed is not None:
+            base = DependencyGraph()
+            for fixed_req in fixed:
+                base.add_vertex(fixed_req.name, fixed_req, True)
+
+        try:
+            return resolver.resolve(requested, base=base)
+        except ResolverError as e:
+            raise SolverProblemError(e)
+        finally:
+            stats = provider.search_for_stats
+            resolver.ui.debug(
+                f'Searched for {stats["misses"]} requirements, '
+                f'{stats["hits"]} searches answered from the cache',
+                0
+            )
+
+            if locked is not None:
+                resolver.ui.debug(
+                    f'Reused {len(provider.reused_packages)} '
+                    f'of {len(locked)} locked packages',
+                    0
+                )
+
+            provider.clear_cache()
+
+    def _reusable_packages(self, requested, changed) -> list:
+        """
+        Return the locked packages which are not affected
+        by the changed requirements.
+
+        A locked package is affected if it is changed,
+        if it does not satisfy a requested dependency anymore,
+        if it is required with extras, whose dependencies
+        the lock file does not describe,
+        or if it is a dependency, even indirect, of an affected package.
+        """
+        locked = {p.name: p for p in self._locked.packages}
+        affected = {name.lower() for name in changed}
+
+        for package in locked.values():
+            for dependency in package.requires:
+                if dependency.extras:
+                    affected.add(dependency.name)
+
+        for dependency in requested:
+            package = locked.get(dependency.name)
+            if (
+                package is None
+                or dependency.extras
+                or not dependency.accepts(package)
+            ):
+                affected.add(dependency.name)
+
+        names = list(affected)
+        while names:
+            package = locked.get(names.pop())
+            if package is None:
+                continue
+
+            for dependency in package.requires:
+                if dependency.name not in affected:
+                    affected.add(dependency.name)
+                    names.append(dependency.name)
+
+        return [
+            package for name, package in locked.items()
+            if name not in affected
+        ]
+
     def _get_tags_for_vertex(self, vertex, requested):
         tags = {
             'category': [],
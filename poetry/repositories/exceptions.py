@@ -0,0 +1,23 @@
+class RepositoryError(Exception):
+
+    pass
+
+
+class OfflineError(RepositoryError):
+
+    def __init__(self, resource: str, reason: str = 'it is not in the cache'):
+        self._resource = resource
+
+        super().__init__(
+            f'Unable to retrieve [{resource}] in offline mode '
+            f'since {reason}.'
+        )
+
+    @property
+    def resource(self) -> str:
+        return self._resource
+
+
+class PackageNotFound(ValueError):
+
+    pass
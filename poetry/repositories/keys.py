@@ -0,0 +1,39 @@
+from poetry.semver.helpers import normalize_version
+from poetry.utils.helpers import canonicalize_name
+
+
+def release_key(name: str, version: str) -> str:
+    """
+    Return the cache key of a release.
+
+    Equivalent spellings of a name, like Django and django,
+    or of a version, like 1.11 and 1.11.0, share the same key.
+    """
+    try:
+        version = normalize_version(version)
+    except ValueError:
+        # Versions not following any known scheme are kept as is
+        pass
+
+    return f'{canonicalize_name(name)}:{version}'
+
+
+def lookup_key(name: str, constraint=None) -> str:
+    """
+    Return the cache key of a lookup of a package
+    and of an optional constraint.
+    """
+    key = canonicalize_name(name)
+    if constraint is not None:
+        key += f':{constraint}'
+
+    return key
+
+
+def normalize_release_key(key: str) -> str:
+    """
+    Normalize a release key stored by an older version.
+    """
+    name, _, version = key.partition(':')
+
+    return release_key(name, version)
@@ -1,5 +1,8 @@
+import hashlib
 import re
+import zipfile
 
+from email.parser import Parser
 from pathlib import Path
 from piptools.cache import DependencyCache
 from piptools.repositories import PyPIRepository
@@ -8,16 +11,22 @@ from piptools.scripts.compile import get_pip_command
 from pip.req import InstallRequirement
 from pip.exceptions import InstallationError
 
-from cachy import CacheManager
-
 import poetry.packages
 
+from poetry.cache import CacheManager
 from poetry.locations import CACHE_DIR
-from poetry.semver.constraints import Constraint
 from poetry.semver.constraints.base_constraint import BaseConstraint
+from poetry.semver.version import Version
 from poetry.semver.version_parser import VersionParser
+from poetry.utils.helpers import canonicalize_name
 
+from .exceptions import OfflineError
+from .exceptions import PackageNotFound
+from .keys import lookup_key
+from .keys import normalize_release_key
+from .keys import release_key
 from .pypi_repository import PyPiRepository
+from .remote_file import RemoteFile
 
 
 class LegacyRepository(PyPiRepository):
@@ -26,32 +35,51 @@ class LegacyRepository(PyPiRepository):
         if name == 'pypi':
             raise ValueError('The name [pypi] is reserved for repositories')
 
+        super().__init__(url)
+
         self._name = name
-        self._url = url
         command = get_pip_command()
-        opts, _ = command.parse_args([])
-        self._session = command._build_session(opts)
-        self._repository = PyPIRepository(opts, self._session)
+        opts, _ = command.parse_args(['--index-url', url])
+        self._repository = PyPIRepository(
+            opts, command._build_session(opts)
+        )
         self._cache_dir = Path(CACHE_DIR) / 'cache' / 'repositories' / name
 
+        cache_db = Path(CACHE_DIR) / 'cache' / 'repositories' / f'{name}.db'
         self._cache = CacheManager({
             'default': 'releases',
             'serializer': 'json',
             'stores': {
                 'releases': {
-                    'driver': 'file',
-                    'path': Path(CACHE_DIR) / 'cache' / 'repositories' / name
+                    'driver': 'sqlite',
+                    'path': cache_db,
+                    'table': 'releases',
+                    'key_normalizer': normalize_release_key
                 },
                 'packages': {
                     'driver': 'dict'
                 },
                 'matches': {
                     'driver': 'dict'
+                },
+                'misses': {
+                    'driver': 'sqlite',
+                    'path': cache_db,
+                    'table': 'misses'
+                },
+                'versions': {
+                    'driver': 'sqlite',
+                    'path': cache_db,
+                    'table': 'versions',
+                    'key_normalizer': canonicalize_name
                 }
             }
         })
 
     def find_packages(self, name, constraint=None, extras=None):
+        if extras is None:
+            extras = []
+
         packages = []
 
         if constraint is not None and not isinstance(constraint,
@@ -59,141 +87,175 @@ class LegacyRepository(PyPiRepository):
             version_parser = VersionParser()
             constraint = version_parser.parse_constraints(constraint)
 
-        key = name
-        if constraint:
-            key = f'{key}:{str(constraint)}'
+        key = lookup_key(name, constraint)
+        if self._is_missing(lookup_key(name)) or self._is_missing(key):
+            return []
 
         if self._cache.store('matches').has(key):
             versions = self._cache.store('matches').get(key)
         else:
-            candidates = [str(c.version) for c in self._repository.find_all_candidates(name)]
+            candidates = self._get_sorted_versions(name)
+            if not candidates:
+                self._remember_missing(lookup_key(name))
 
-            versions = []
-            for version in candidates:
-                if version in versions:
-                    continue
+                return []
 
-                if (
-                    not constraint
-                    or (constraint and constraint.matches(Constraint('=', version)))
-                ):
-                    versions.append(version)
+            if constraint is not None:
+                candidates = constraint.filter(candidates)
+
+            versions = [version.text for version in candidates]
+            if not versions:
+                self._remember_missing(key)
 
             self._cache.store('matches').put(key, versions, 5)
 
         for version in versions:
-            packages.append(self.package(name, version, extras=extras))
+            package = poetry.packages.Package(name, version, version)
+            package.requires_extras = extras
+
+            packages.append(package)
 
         return packages
 
-    def package(self, name, version, extras=None) -> 'poetry.packages.Package':
+    def get_release_info(self, name: str, version: str) -> dict:
         """
-        Retrieve the release information.
-
-        This is a heavy task which takes time.
-        We have to download a package to get the dependencies.
-        We also need to download every file matching this release
-        to get the various hashes.
-        
-        Note that, this will be cached so the subsequent operations
-        should be much faster.
+        Return the release information given a package name and a version.
+
+        The information is returned from the cache if it exists
+        or retrieved from the remote server.
         """
-        try:
-            index = self._packages.index(
-                poetry.packages.Package(name, version, version)
-            )
+        if self._is_missing(lookup_key(name)):
+            raise PackageNotFound(f'Package [{name}] not found.')
 
-            return self._packages[index]
-        except ValueError:
-            if extras is None:
-                extras = []
+        key = release_key(name, version)
+        if self._offline and not self._cache.store('releases').has(key):
+            raise OfflineError(key)
 
-            release_info = self.get_release_info(name, version)
-            package = poetry.packages.Package(name, version, version)
-            for req in release_info['requires_dist']:
-                req = InstallRequirement.from_line(req)
+        return self._cache.store('releases').remember_forever(
+            key,
+            lambda: self._coalesce(
+                key, lambda: self._get_release_info(name, version)
+            )
+        )
 
-                name = req.name
-                version = str(req.req.specifier)
+    def _get_versions(self, name: str) -> list:
+        """
+        Return all the versions available on the index for a package.
 
-                dependency = Dependency(
-                    name,
-                    version,
-                    optional=req.markers
-                )
+        The versions are kept on disk so that they can
+        be served in offline mode.
+        """
+        key = lookup_key(name)
+        if self._offline:
+            if not self._cache.store('versions').has(key):
+                raise OfflineError(name)
 
-                is_extra = False
-                if req.markers:
-                    # Setting extra dependencies and requirements
-                    requirements = self._convert_markers(
-                        req.markers._markers
-                    )
+            return self._cache.store('versions').get(key)
 
-                    if 'python_version' in requirements:
-                        ors = []
-                        for or_ in requirements['python_version']:
-                            ands = []
-                            for op, version in or_:
-                                ands.append(f'{op}{version}')
+        versions = self._coalesce(key, lambda: [
+            str(c.version)
+            for c in self._repository.find_all_candidates(name)
+        ])
+        self._cache.store('versions').forever(key, versions)
 
-                            ors.append(' '.join(ands))
+        return versions
 
-                        dependency.python_versions = ' || '.join(ors)
+    def _get_release_info(self, name: str, version: str) -> dict:
+        """
+        Retrieve the release information from the distributions
+        available on the index.
 
-                    if 'sys_platform' in requirements:
-                        ors = []
-                        for or_ in requirements['sys_platform']:
-                            ands = []
-                            for op, platform in or_:
-                                ands.append(f'{op}{platform}')
+        If the release has wheels, the metadata is read directly
+        from one of them, otherwise the sdist must be built.
+        Files are retrieved with the session of pip so that
+        the credentials and trusted hosts of the index apply.
+        """
+        # The version may be spelled differently
+        # than the released files, like 1.0.0 for 1.0.
+        parsed = Version.parse(version)
+        with self._repository.allow_all_wheels():
+            links = [
+                c.location
+                for c in self._repository.find_all_candidates(name)
+                if Version.parse(str(c.version)) == parsed
+            ]
+
+        if not links:
+            raise PackageNotFound(f'Package [{name}] not found.')
+
+        wheels = [link for link in links if link.is_wheel]
+        if not wheels:
+            return self._get_sdist_release_info(name, version)
+
+        # Universal wheels are preferred
+        # but metadata should be identical across wheels.
+        wheels.sort(key=lambda link: not link.filename.endswith('-any.whl'))
+        wheel = wheels[0]
+
+        digests = {}
+        metadata = self._get_wheel_metadata(wheel, digests)
 
-                            ors.append(' '.join(ands))
+        data = {
+            'name': name,
+            'version': version,
+            'summary': metadata.get('Summary', ''),
+            'requires_dist': metadata.get_all('Requires-Dist') or [],
+            'requires_python': metadata.get('Requires-Python'),
+            'digests': []
+        }
 
-                        dependency.platform = ' || '.join(ors)
+        for link in links:
+            if link.url_without_fragment in digests:
+                digest = digests[link.url_without_fragment]
+            elif link.hash_name == 'sha256':
+                digest = link.hash
+            else:
+                digest = self._get_file_digest(link)
 
-                    if 'extra' in requirements:
-                        is_extra = True
-                        for _extras in requirements['extra']:
-                            for _, extra in _extras:
-                                if extra not in package.extras:
-                                    package.extras[extra] = []
+            data['digests'].append(digest)
 
-                                package.extras[extra].append(dependency)
+        return data
 
-                if not is_extra:
-                    package.requires.append(dependency)
+    def _get_wheel_metadata(self, link, digests: dict):
+        """
+        Read the METADATA file of a wheel.
 
-            # Adding description
-            package.description = release_info.get('summary', '')
+        Only the central directory and the file itself
+        are downloaded if the index supports range requests.
+        """
+        fp = RemoteFile(link.url_without_fragment, self._repository.session)
+        with zipfile.ZipFile(fp) as wheel:
+            path = None
+            for filename in wheel.namelist():
+                if filename.endswith('.dist-info/METADATA'):
+                    path = filename
 
-            # Adding hashes information
-            package.hashes = release_info['digests']
+                    break
 
-            # Activate extra dependencies
-            for extra in extras:
-                if extra in package.extras:
-                    for dep in package.extras[extra]:
-                        dep.activate()
+            if path is None:
+                raise ValueError(f'No metadata found in [{link.filename}]')
 
-                    package.requires += package.extras[extra]
+            content = wheel.read(path).decode('utf-8')
 
-            self._packages.append(package)
+        if fp.digest is not None:
+            digests[link.url_without_fragment] = fp.digest
 
-            return package
+        return Parser().parsestr(content, headersonly=True)
 
-    def get_release_info(self, name: str, version: str) -> dict:
-        """
-        Return the release information given a package name and a version.
+    def _get_file_digest(self, link) -> str:
+        h = hashlib.sha256()
 
-        The information is returned from the cache if it exists
-        or retrieved from the remote server.
-        """
-        return self._cache.store('releases').remember_forever(
-            f'{name}:{version}',
-            lambda: self._get_release_info(name, version)
+        response = self._repository.session.get(
+            link.url_without_fragment, stream=True
         )
+        response.raise_for_status()
 
-    def _get_release_info(self, name: str, version: str) -> dict:
+        for chunk in response.iter_content(RemoteFile.CHUNK_SIZE):
+            h.update(chunk)
+
+        return h.hexdigest()
+
+    def _get_sdist_release_info(self, name: str, version: str) -> dict:
         ireq = InstallRequirement.from_line(f'{name}=={version}')
         resolver = Resolver(
             [ireq], self._repository,
@@ -1,19 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from typing import Union
 
 import poetry.packages
 
+from poetry.cache import CacheClient
+
 from .base_repository import BaseRepository
+from .exceptions import PackageNotFound
+from .keys import lookup_key
+from .keys import release_key
 from .repository import Repository
+from .session import Session
 
 
 class Pool(BaseRepository):
 
-    def __init__(self, repositories: Union[list, None] = None):
+    def __init__(self,
+                 repositories: Union[list, None] = None,
+                 session: Union[Session, None] = None,
+                 concurrent: bool = False,
+                 cache_client: Union[CacheClient, None] = None):
         if repositories is None:
             repositories = []
 
+        if session is None:
+            session = Session()
+
         self._repositories = []
+        self._session = session
+        self._concurrent = concurrent
+        self._cache_client = cache_client
+        self._offline = False
+        self._executor = None
+        self._misses = set()
+        self._packages_by_unique_name = {}
 
         for repository in repositories:
             self.add_repository(repository)
@@ -24,20 +45,73 @@ class Pool(BaseRepository):
     def repositories(self) -> List[Repository]:
         return self._repositories
 
+    @property
+    def session(self) -> Session:
+        return self._session
+
+    @property
+    def concurrent(self) -> bool:
+        return self._concurrent
+
+    @property
+    def cache_client(self) -> Union[CacheClient, None]:
+        return self._cache_client
+
     def add_repository(self, repository: Repository) -> 'Pool':
         """
         Adds a repository to the pool.
+
+        Remote repositories will share the HTTP session,
+        the cache client and the offline mode of the pool.
         """
+        from .pypi_repository import PyPiRepository
+
+        if isinstance(repository, PyPiRepository):
+            repository.session = self._session
+            repository.cache_client = self._cache_client
+            repository.offline(self._offline)
+
         self._repositories.append(repository)
 
         return self
     
+    def offline(self, offline=True) -> 'Pool':
+        """
+        Only serve packages from the cache of the remote repositories.
+        """
+        from .pypi_repository import PyPiRepository
+
+        self._offline = offline
+
+        for repository in self._repositories:
+            if isinstance(repository, PyPiRepository):
+                repository.offline(offline)
+
+        return self
+
+    def is_offline(self) -> bool:
+        return self._offline
+
+    def warm_up(self, packages: List['poetry.packages.Package']) -> 'Pool':
+        """
+        Load the cached information of the given packages
+        of the remote repositories in bulk.
+        """
+        from .pypi_repository import PyPiRepository
+
+        for repository in self._repositories:
+            if isinstance(repository, PyPiRepository):
+                repository.warm_up(packages)
+
+        return self
+
     def configure(self, source: dict) -> 'Pool':
         """
         Configures a repository based on a source
         specification and add it to the pool.
         """
         from .legacy_repository import LegacyRepository
+        from .snapshot_repository import SnapshotRepository
 
         if 'url' in source:
             # PyPI-like repository
@@ -45,6 +119,12 @@ class Pool(BaseRepository):
                 raise RuntimeError('Missing [name] in source.')
 
             repository = LegacyRepository(source['name'], source['url'])
+        elif 'snapshot' in source:
+            # Read-only snapshot of release information
+            if 'name' not in source:
+                raise RuntimeError('Missing [name] in source.')
+
+            repository = SnapshotRepository(source['name'], source['snapshot'])
         else:
             raise RuntimeError('Unsupported source specified')
 
@@ -53,29 +133,79 @@ class Pool(BaseRepository):
     def has_package(self, package):
         raise NotImplementedError()
 
-    def package(self, name, version) -> Union['poetry.packages.Package', None]:
-        package = poetry.packages.Package(name, version, version)
-        if package in self._packages:
-            return self._packages[self._packages.index(package)]
+    def package(self,
+                name,
+                version,
+                extras=None) -> Union['poetry.packages.Package', None]:
+        unique_name = poetry.packages.Package(name, version).unique_name
+        if unique_name in self._packages_by_unique_name:
+            return self._packages_by_unique_name[unique_name]
 
+        key = release_key(name, version)
         for repository in self._repositories:
-            package = repository.package(name, version)
+            if (id(repository), key) in self._misses:
+                continue
+
+            try:
+                package = repository.package(name, version, extras=extras)
+            except PackageNotFound:
+                package = None
+
             if package:
                 self._packages.append(package)
+                self._packages_by_unique_name[unique_name] = package
 
                 return package
 
+            self._misses.add((id(repository), key))
+
         return None
 
     def find_packages(self,
                       name,
                       constraint=None,
                       extras=None) -> List['poetry.packages.Package']:
-        for repository in self._repositories:
-            packages = repository.find_packages(name, constraint, extras=extras)
+        """
+        Find packages in the first repository, by order of priority,
+        providing matching ones.
+
+        In concurrent mode, all the repositories are queried at once
+        so that misses on a repository do not delay the others.
+        """
+        key = lookup_key(name, constraint)
+        repositories = [
+            repository for repository in self._repositories
+            if (id(repository), key) not in self._misses
+        ]
+
+        if self._concurrent and len(repositories) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self._repositories)
+                )
+
+            results = [
+                self._executor.submit(
+                    repository.find_packages, name, constraint, extras=extras
+                )
+                for repository in repositories
+            ]
+        else:
+            results = None
+
+        for i, repository in enumerate(repositories):
+            if results is not None:
+                packages = results[i].result()
+            else:
+                packages = repository.find_packages(
+                    name, constraint, extras=extras
+                )
+
             if packages:
                 return packages
 
+            self._misses.add((id(repository), key))
+
         return []
 
     def search(self, query, mode=BaseRepository.SEARCH_FULLTEXT):
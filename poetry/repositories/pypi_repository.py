@@ -1,42 +1,118 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pip.req import InstallRequirement
 from typing import List
 from typing import Union
 
-from cachy import CacheManager
-from requests import get
-
+from poetry.cache import CacheClient
+from poetry.cache import CacheManager
 from poetry.locations import CACHE_DIR
 from poetry.packages import Dependency
 from poetry.packages import Package
 from poetry.semver.constraints import Constraint
 from poetry.semver.constraints.base_constraint import BaseConstraint
+from poetry.semver.helpers import normalize_version
+from poetry.semver.version import Version
 from poetry.semver.version_parser import VersionParser
+from poetry.utils.helpers import canonicalize_name
 
+from .exceptions import OfflineError
+from .exceptions import PackageNotFound
+from .keys import lookup_key
+from .keys import normalize_release_key
+from .keys import release_key
 from .repository import Repository
+from .session import Session
 
 
 class PyPiRepository(Repository):
 
-    def __init__(self, url='https://pypi.org/', disable_cache=False):
+    # Number of minutes during which missing packages
+    # and lookups without matches are remembered.
+    MISSES_TTL = 10
+
+    def __init__(self,
+                 url='https://pypi.org/',
+                 disable_cache=False,
+                 max_workers=8,
+                 session=None,
+                 cache_client=None):
         self._url = url
         self._disable_cache = disable_cache
+        self._session = session
+        self._cache_client = cache_client
+        self._max_workers = max_workers
+        self._executor = None
+        self._prefetched = {}
+        self._package_info = {}
+        self._sorted_versions = {}
+        self._misses = {}
+        self._offline = False
+        cache_db = Path(CACHE_DIR) / 'cache' / 'repositories' / 'pypi.db'
         self._cache = CacheManager({
             'default': 'releases',
             'serializer': 'json',
             'stores': {
                 'releases': {
-                    'driver': 'file',
-                    'path': Path(CACHE_DIR) / 'cache' / 'repositories' / 'pypi'
+                    'driver': 'sqlite',
+                    'path': cache_db,
+                    'table': 'releases',
+                    'key_normalizer': normalize_release_key
+                },
+                'http': {
+                    'driver': 'sqlite',
+                    'path': cache_db,
+                    'table': 'http'
                 },
-                'packages': {
-                    'driver': 'dict'
+                'misses': {
+                    'driver': 'sqlite',
+                    'path': cache_db,
+                    'table': 'misses'
+                },
+                'versions': {
+                    'driver': 'sqlite',
+                    'path': cache_db,
+                    'table': 'versions',
+                    'key_normalizer': canonicalize_name
                 }
             }
         })
         
         super().__init__()
 
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = Session()
+
+        return self._session
+
+    @session.setter
+    def session(self, session: Session) -> None:
+        self._session = session
+
+    @property
+    def cache_client(self) -> Union[CacheClient, None]:
+        return self._cache_client
+
+    @cache_client.setter
+    def cache_client(self, cache_client: Union[CacheClient, None]) -> None:
+        self._cache_client = cache_client
+
+    def offline(self, offline=True) -> 'PyPiRepository':
+        """
+        Only serve information from the cache
+        and never access the network.
+        """
+        self._offline = offline
+
+        return self
+
+    def is_offline(self) -> bool:
+        return self._offline
+
     def find_packages(self,
                       name: str,
                       constraint: Union[Constraint, str, None] = None,
@@ -44,28 +120,49 @@ class PyPiRepository(Repository):
                       ) -> List[Package]:
         """
         Find packages on the remote server.
+
+        The returned packages only hold their name and version,
+        the rest of the release information is retrieved
+        when calling package() for a specific version.
         """
+        if extras is None:
+            extras = []
+
         packages = []
 
         if constraint is not None and not isinstance(constraint, BaseConstraint):
             version_parser = VersionParser()
             constraint = version_parser.parse_constraints(constraint)
 
-        info = self.get_package_info(name)
+        key = lookup_key(name, constraint)
+        if self._is_missing(lookup_key(name)) or self._is_missing(key):
+            return []
+
+        try:
+            versions = self._get_sorted_versions(name)
+        except ValueError:
+            return []
+
+        if constraint is not None:
+            versions = constraint.filter(versions)
 
-        versions = []
+        if not versions:
+            self._remember_missing(key)
 
-        for version, release in info['releases'].items():
-            if (
-                not constraint
-                or (constraint and constraint.matches(Constraint('=', version)))
-            ):
-                versions.append(version)
+            return []
+
+        versions = [version.text for version in versions]
+
+        if self._max_workers:
+            # The resolver will most likely only inspect
+            # the latest versions so we retrieve those in advance.
+            self.prefetch(name, versions[-self._max_workers:])
 
         for version in versions:
-            packages.append(
-                self.package(name, version, extras=extras)
-            )
+            package = Package(name, version, version)
+            package.requires_extras = extras
+
+            packages.append(package)
 
         return packages
 
@@ -73,86 +170,85 @@ class PyPiRepository(Repository):
                 name: str,
                 version: str,
                 extras: Union[list, None] = None) -> Package:
-        try:
-            index = self._packages.index(Package(name, version, version))
+        package = self._find(name, version)
+        if package is not None:
+            return package
 
-            return self._packages[index]
-        except ValueError:
-            if extras is None:
-                extras = []
+        if extras is None:
+            extras = []
 
-            release_info = self.get_release_info(name, version)
-            package = Package(name, version, version)
-            for req in release_info['requires_dist']:
-                req = InstallRequirement.from_line(req)
+        release_info = self.get_release_info(name, version)
+        package = Package(name, version, version)
+        for req in release_info['requires_dist']:
+            req = InstallRequirement.from_line(req)
 
-                name = req.name
-                version = str(req.req.specifier)
+            name = req.name
+            version = str(req.req.specifier)
 
-                dependency = Dependency(
-                    name,
-                    version,
-                    optional=req.markers
-                )
+            dependency = Dependency(
+                name,
+                version,
+                optional=req.markers
+            )
 
-                is_extra = False
-                if req.markers:
-                    # Setting extra dependencies and requirements
-                    requirements = self._convert_markers(
-                        req.markers._markers
-                    )
+            is_extra = False
+            if req.markers:
+                # Setting extra dependencies and requirements
+                requirements = self._convert_markers(
+                    req.markers._markers
+                )
 
-                    if 'python_version' in requirements:
-                        ors = []
-                        for or_ in requirements['python_version']:
-                            ands = []
-                            for op, version in or_:
-                                ands.append(f'{op}{version}')
+                if 'python_version' in requirements:
+                    ors = []
+                    for or_ in requirements['python_version']:
+                        ands = []
+                        for op, version in or_:
+                            ands.append(f'{op}{version}')
 
-                            ors.append(' '.join(ands))
+                        ors.append(' '.join(ands))
 
-                        dependency.python_versions = ' || '.join(ors)
+                    dependency.python_versions = ' || '.join(ors)
 
-                    if 'sys_platform' in requirements:
-                        ors = []
-                        for or_ in requirements['sys_platform']:
-                            ands = []
-                            for op, platform in or_:
-                                ands.append(f'{op}{platform}')
+                if 'sys_platform' in requirements:
+                    ors = []
+                    for or_ in requirements['sys_platform']:
+                        ands = []
+                        for op, platform in or_:
+                            ands.append(f'{op}{platform}')
 
-                            ors.append(' '.join(ands))
+                        ors.append(' '.join(ands))
 
-                        dependency.platform = ' || '.join(ors)
+                    dependency.platform = ' || '.join(ors)
 
-                    if 'extra' in requirements:
-                        is_extra = True
-                        for _extras in requirements['extra']:
-                            for _, extra in _extras:
-                                if extra not in package.extras:
-                                    package.extras[extra] = []
+                if 'extra' in requirements:
+                    is_extra = True
+                    for _extras in requirements['extra']:
+                        for _, extra in _extras:
+                            if extra not in package.extras:
+                                package.extras[extra] = []
 
-                                package.extras[extra].append(dependency)
+                            package.extras[extra].append(dependency)
 
-                if not is_extra:
-                    package.requires.append(dependency)
+            if not is_extra:
+                package.requires.append(dependency)
 
-            # Adding description
-            package.description = release_info.get('summary', '')
+        # Adding description
+        package.description = release_info.get('summary', '')
 
-            # Adding hashes information
-            package.hashes = release_info['digests']
+        # Adding hashes information
+        package.hashes = release_info['digests']
 
-            # Activate extra dependencies
-            for extra in extras:
-                if extra in package.extras:
-                    for dep in package.extras[extra]:
-                        dep.activate()
+        # Activate extra dependencies
+        for extra in extras:
+            if extra in package.extras:
+                for dep in package.extras[extra]:
+                    dep.activate()
 
-                    package.requires += package.extras[extra]
+                package.requires += package.extras[extra]
 
-            self._packages.append(package)
+        self.add_package(package)
 
-            return package
+        return package
 
     def search(self, query, mode=0):
         results = []
@@ -176,6 +272,28 @@ class PyPiRepository(Repository):
 
         return results
 
+    def _get_sorted_versions(self, name: str) -> List[Version]:
+        """
+        Return the parsed versions of the releases of a package,
+        sorted so that they can be filtered by bisection.
+        """
+        key = lookup_key(name)
+        if key not in self._sorted_versions:
+            self._sorted_versions[key] = sorted(
+                Version.parse(version)
+                for version in set(self._get_versions(name))
+            )
+
+        return self._sorted_versions[key]
+
+    def _get_versions(self, name: str) -> List[str]:
+        if self._offline and not self._disable_cache:
+            versions = self._cache.store('versions').get(lookup_key(name))
+            if versions is not None:
+                return versions
+
+        return list(self.get_package_info(name)['releases'])
+
     def get_package_info(self, name: str) -> dict:
         """
         Return the package information given its name.
@@ -183,18 +301,35 @@ class PyPiRepository(Repository):
         The information is returned from the cache if it exists
         or retrieved from the remote server.
         """
-        if self._disable_cache:
-            return self._get_package_info(name)
+        # The project document is kept in memory even if the cache
+        # is disabled since every release information is derived from it.
+        # A plain dictionary is used since the stores of the cache manager
+        # are local to each thread and the repository may be queried
+        # from several ones.
+        key = lookup_key(name)
+        if key not in self._package_info:
+            if self._is_missing(key):
+                raise PackageNotFound(f'Package [{name}] not found.')
 
-        return self._cache.store('packages').remember_forever(
-            f'{name}',
-            lambda: self._get_package_info(name)
-        )
+            self._package_info[key] = self._get_package_info(name)
+
+        return self._package_info[key]
 
     def _get_package_info(self, name: str) -> dict:
-        data = self._get(self._url + f'pypi/{name}/json')
+        url = self._url + f'pypi/{canonicalize_name(name)}/json'
+        data = self._coalesce(url, lambda: self._get(url))
         if data is None:
-            raise ValueError(f'Package [{name}] not found.')
+            self._remember_missing(lookup_key(name))
+
+            raise PackageNotFound(f'Package [{name}] not found.')
+
+        if not self._disable_cache:
+            # The document is only kept in the HTTP cache
+            # if it has validators, so the versions are kept
+            # on their own to be served in offline mode.
+            self._cache.store('versions').forever(
+                lookup_key(name), list(data['releases'])
+            )
 
         return data
 
@@ -208,38 +343,209 @@ class PyPiRepository(Repository):
         if self._disable_cache:
             return self._get_release_info(name, version)
 
+        key = release_key(name, version)
+
         return self._cache.remember_forever(
-            f'{name}:{version}',
-            lambda: self._get_release_info(name, version)
+            key,
+            lambda: self._coalesce(
+                key, lambda: self._get_release_info(name, version)
+            )
+        )
+
+    def warm_up(self, packages: List[Package]) -> None:
+        """
+        Load the cached release information
+        of the given packages in a single pass.
+        """
+        if self._disable_cache:
+            return
+
+        self._cache.store('releases').get_store().warm_up(
+            [release_key(package.name, package.version) for package in packages]
+        )
+
+    def prefetch(self, name: str, versions: List[str]) -> None:
+        """
+        Start retrieving the release documents
+        of the given versions in the background.
+
+        Subsequent calls to get_release_info() will wait for
+        the pending requests instead of issuing new ones.
+        """
+        if not self._max_workers or self._offline:
+            return
+
+        latest = self.get_package_info(name)['info']['version']
+        for version in versions:
+            if version == latest:
+                # Already described by the project document
+                continue
+
+            key = release_key(name, version)
+            if key in self._prefetched:
+                continue
+
+            if not self._disable_cache and self._cache.has(key):
+                continue
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers
+                )
+
+            self._prefetched[key] = self._executor.submit(
+                self._get,
+                self._url + f'pypi/{canonicalize_name(name)}/{version}/json'
+            )
+
+    def _get_release_document(self, name: str, version: str) -> dict:
+        key = release_key(name, version)
+        future = self._prefetched.get(key)
+        if future is not None:
+            # Do not hold on to the document once it has been consumed
+            self._prefetched[key] = None
+
+            return future.result()
+
+        return self._get(
+            self._url + f'pypi/{canonicalize_name(name)}/{version}/json'
         )
 
     def _get_release_info(self, name: str, version: str) -> dict:
-        json_data = self._get(self._url + f'pypi/{name}/{version}/json')
-        if json_data is None:
-            raise ValueError(f'Package [{name}] not found.')
+        package_info = self.get_package_info(name)
+
+        # The release information is cached under a key shared
+        # by every spelling of the version so it must be retrieved
+        # with the spelling of the release.
+        version = self._release_version(package_info, version)
+
+        info = package_info['info']
+        if info['version'] != version:
+            # The project document only describes the latest release
+            # so the dependencies of the others must be retrieved
+            # from their own document.
+            json_data = self._get_release_document(name, version)
+            if json_data is None:
+                raise PackageNotFound(f'Package [{name}] not found.')
+
+            info = json_data['info']
 
-        info = json_data['info']
         data = {
             'name': info['name'],
-            'version': info['version'],
+            'version': version,
             'summary': info['summary'],
             'platform': info['platform'],
             'requires_dist': info['requires_dist'],
             'requires_python': info['requires_python'],
             'digests': []
         }
-        for file_info in json_data['releases'][version]:
+        for file_info in package_info['releases'].get(version, []):
             data['digests'].append(file_info['digests']['sha256'])
 
         return data
 
+    def _release_version(self, package_info: dict, version: str) -> str:
+        """
+        Return the spelling of a version used by the released files.
+        """
+        releases = package_info['releases']
+        if version in releases:
+            return version
+
+        try:
+            normalized = normalize_version(version)
+        except ValueError:
+            return version
+
+        for release in releases:
+            try:
+                if normalize_version(release) == normalized:
+                    return release
+            except ValueError:
+                continue
+
+        return version
+
+    def _coalesce(self, key: str, callback):
+        """
+        Retrieve an item with the callback unless another process
+        sharing the cache server is already retrieving it.
+        """
+        if self._cache_client is None or self._offline:
+            return callback()
+
+        return self._cache_client.remember(f'{self._url} {key}', callback)
+
+    def _is_missing(self, key: str) -> bool:
+        """
+        Return whether a lookup is known to have no result.
+        """
+        expiration = self._misses.get(key)
+        if expiration is not None:
+            if expiration > time.time():
+                return True
+
+            del self._misses[key]
+
+        if self._disable_cache or not self._cache.store('misses').has(key):
+            return False
+
+        self._misses[key] = time.time() + self.MISSES_TTL * 60
+
+        return True
+
+    def _remember_missing(self, key: str) -> None:
+        self._misses[key] = time.time() + self.MISSES_TTL * 60
+
+        if not self._disable_cache:
+            self._cache.store('misses').put(key, True, self.MISSES_TTL)
+
     def _get(self, url: str) -> Union[dict, None]:
-        json_response = get(url)
+        """
+        Retrieve a JSON document.
+
+        Documents are kept on disk alongside their validators
+        so that they are only downloaded again if they changed.
+        """
+        headers = {}
+        cached = None
+        if not self._disable_cache:
+            cached = self._cache.store('http').get(url)
+
+        if self._offline:
+            if self._disable_cache:
+                raise OfflineError(url, 'the cache is disabled')
+
+            if not cached:
+                raise OfflineError(url)
+
+            return cached['data']
+
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        json_response = self.session.get(url, headers=headers)
+        if json_response.status_code == 304 and cached:
+            return cached['data']
+
         if json_response.status_code == 404:
             return None
 
         json_data = json_response.json()
 
+        etag = json_response.headers.get('ETag')
+        last_modified = json_response.headers.get('Last-Modified')
+        if not self._disable_cache and (etag or last_modified):
+            self._cache.store('http').forever(url, {
+                'etag': etag,
+                'last_modified': last_modified,
+                'data': json_data
+            })
+
         return json_data
 
     def _group_markers(self, markers):
@@ -0,0 +1,125 @@
+import hashlib
+import io
+
+from typing import Union
+
+from requests import Session
+
+
+class RemoteFile(io.RawIOBase):
+    """
+    A read-only, seekable file over HTTP.
+
+    If the server supports range requests only the parts
+    actually read are downloaded, which allows zipfile
+    to extract a single member without retrieving the whole archive.
+    Otherwise the file is downloaded once and hashed along the way.
+    """
+
+    CHUNK_SIZE = 8192
+
+    def __init__(self, url: str, session: Session):
+        super().__init__()
+
+        self._url = url
+        self._session = session
+        self._position = 0
+        self._content = None
+        self._digest = None
+
+        response = session.head(url, allow_redirects=True)
+        response.raise_for_status()
+
+        self._length = int(response.headers.get('Content-Length', 0))
+        self._ranged = (
+            response.headers.get('Accept-Ranges') == 'bytes'
+            and self._length > 0
+        )
+
+        if not self._ranged:
+            self._download()
+
+    @property
+    def ranged(self) -> bool:
+        return self._ranged
+
+    @property
+    def digest(self) -> Union[str, None]:
+        """
+        The sha256 digest of the file
+        if it has been downloaded entirely.
+        """
+        return self._digest
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self._length + offset
+        else:
+            raise ValueError(f'Invalid whence [{whence}]')
+
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        end = self._length
+        if size is not None and size >= 0:
+            end = min(self._position + size, self._length)
+
+        if end <= self._position:
+            return b''
+
+        if self._content is not None:
+            data = self._content[self._position:end]
+        else:
+            response = self._session.get(
+                self._url,
+                headers={'Range': f'bytes={self._position}-{end - 1}'}
+            )
+            response.raise_for_status()
+
+            data = response.content
+            if response.status_code != 206:
+                # The range has been ignored
+                self._content = data
+                self._digest = hashlib.sha256(data).hexdigest()
+                data = data[self._position:end]
+
+        self._position += len(data)
+
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+
+        return len(data)
+
+    def _download(self) -> None:
+        h = hashlib.sha256()
+        content = io.BytesIO()
+
+        response = self._session.get(self._url, stream=True)
+        response.raise_for_status()
+
+        for chunk in response.iter_content(self.CHUNK_SIZE):
+            h.update(chunk)
+            content.write(chunk)
+
+        self._content = content.getvalue()
+        self._length = len(self._content)
+        self._digest = h.hexdigest()
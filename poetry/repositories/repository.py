@@ -1,6 +1,5 @@
 import re
 
-from poetry.semver.constraints import Constraint
 from poetry.semver.constraints.base_constraint import BaseConstraint
 from poetry.semver.helpers import normalize_version
 from poetry.semver.version_parser import VersionParser
@@ -13,19 +12,27 @@ class Repository(BaseRepository):
     def __init__(self, packages=None):
         super(Repository, self).__init__()
 
+        # Packages indexed by name and by unique name
+        self._packages_by_name = {}
+        self._packages_by_unique_name = {}
+
+        # Packages sorted by version for each name, built on demand
+        self._sorted_by_name = {}
+
         if packages is None:
             packages = []
 
         for package in packages:
             self.add_package(package)
 
-    def package(self, name, version):
-        name = name.lower()
-        version = normalize_version(version)
+    def package(self, name, version, extras=None):
+        return self._find(name, normalize_version(version))
 
-        for package in self.packages:
-            if name == package.name and package.version == version:
-                return package
+    def packages_by_name(self, name):
+        """
+        Return all the versions of a package, in insertion order.
+        """
+        return list(self._packages_by_name.get(name.lower(), []))
 
     def find_packages(self, name, constraint=None, extras=None):
         name = name.lower()
@@ -37,22 +44,44 @@ class Repository(BaseRepository):
             parser = VersionParser()
             constraint = parser.parse_constraints(constraint)
 
-        for package in self.packages:
-            if name == package.name:
-                pkg_constraint = Constraint('==', package.version)
+        versions, candidates = self._sorted_packages(name)
+        if constraint is not None:
+            candidates = [
+                package
+                for s in constraint.slices(versions)
+                for package in candidates[s]
+            ]
 
-                if constraint is None or constraint.matches(pkg_constraint):
-                    for extra in extras:
-                        if extra in package.extras:
-                            for dep in package.extras[extra]:
-                                dep.activate()
+        for package in candidates:
+            for extra in extras:
+                if extra in package.extras:
+                    for dep in package.extras[extra]:
+                        dep.activate()
 
-                            package.requires += package.extras[extra]
+                    package.requires += package.extras[extra]
 
-                    packages.append(package)
+            packages.append(package)
 
         return packages
 
+    def _sorted_packages(self, name):
+        """
+        Return the versions and the packages of the given name
+        sorted by version.
+        """
+        if name not in self._sorted_by_name:
+            packages = sorted(
+                self._packages_by_name.get(name, []),
+                key=lambda p: p.parsed_version
+            )
+
+            self._sorted_by_name[name] = (
+                [package.parsed_version for package in packages],
+                packages
+            )
+
+        return self._sorted_by_name[name]
+
     def search(self, query, mode=0):
         regex = '(?i)(?:{})'.format('|'.join(re.split('\s+', query)))
 
@@ -81,28 +110,46 @@ class Repository(BaseRepository):
         return list(matches.values())
 
     def has_package(self, package):
-        package_id = package.unique_name
-
-        for repo_package in self.packages:
-            if package_id == repo_package.unique_name:
-                return True
-
-        return False
+        return package.unique_name in self._packages_by_unique_name
 
     def add_package(self, package):
         self._packages.append(package)
+        self._packages_by_name.setdefault(package.name, []).append(package)
+        self._sorted_by_name.pop(package.name, None)
+        self._packages_by_unique_name.setdefault(package.unique_name, package)
 
     def remove_package(self, package):
-        package_id = package.unique_name
+        repo_package = self._packages_by_unique_name.pop(
+            package.unique_name, None
+        )
+        if repo_package is None:
+            return
+
+        self._remove(self._packages, repo_package)
+
+        same_name = self._packages_by_name[repo_package.name]
+        self._remove(same_name, repo_package)
+        self._sorted_by_name.pop(repo_package.name, None)
+
+        # Another package with the same name and version may remain
+        for p in same_name:
+            if p.unique_name == package.unique_name:
+                self._packages_by_unique_name[p.unique_name] = p
 
-        index = None
-        for i, repo_package in enumerate(self.packages):
-            if package_id == repo_package.unique_name:
-                index = i
                 break
 
-        if index is not None:
-            del self._packages[index]
+        if not same_name:
+            del self._packages_by_name[repo_package.name]
+
+    def _find(self, name, version):
+        return self._packages_by_unique_name.get(name.lower() + '-' + version)
+
+    def _remove(self, packages, package):
+        for i, p in enumerate(packages):
+            if p is package:
+                del packages[i]
+
+                break
 
     def __len__(self):
         return len(self._packages)
@@ -0,0 +1,79 @@
+from requests import Session as BaseSession
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+from poetry.config import Config
+
+
+class Session(BaseSession):
+    """
+    A HTTP session keeping connections alive
+    so that they can be reused across requests and repositories.
+    """
+
+    def __init__(self,
+                 pool_size: int = 10,
+                 retries: int = 3,
+                 backoff_factor: float = 0.3,
+                 timeout: float = 15):
+        super().__init__()
+
+        self._timeout = timeout
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(500, 502, 503, 504)
+            )
+        )
+
+        self.mount('http://', self._adapter)
+        self.mount('https://', self._adapter)
+
+    @classmethod
+    def create(cls, config: Config) -> 'Session':
+        """
+        Create a session with the settings
+        of the user configuration.
+        """
+        settings = {
+            'pool_size': ('pool-size', int),
+            'retries': ('retries', int),
+            'backoff_factor': ('backoff-factor', float),
+            'timeout': ('timeout', float),
+        }
+
+        kwargs = {}
+        for name, (setting, type_) in settings.items():
+            value = config.setting(f'settings.repositories.{setting}')
+            if value is not None:
+                kwargs[name] = type_(value)
+
+        return cls(**kwargs)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self._timeout)
+
+        return super().request(method, url, **kwargs)
+
+    def stats(self) -> dict:
+        """
+        Return the number of requests sent
+        and of connections opened by the session so far.
+        """
+        requests = 0
+        connections = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+
+            requests += pool.num_requests
+            connections += pool.num_connections
+
+        return {
+            'requests': requests,
+            'connections': connections,
+            'reused': requests - connections
+        }
@@ -0,0 +1,158 @@
+import json
+import zipfile
+
+from datetime import datetime
+from pathlib import Path
+from typing import List
+from typing import Union
+
+import poetry.packages
+
+from poetry.utils.helpers import canonicalize_name
+
+from .exceptions import PackageNotFound
+from .pypi_repository import PyPiRepository
+
+
+class SnapshotRepository(PyPiRepository):
+    """
+    A read-only repository serving the release information
+    stored in a snapshot file.
+
+    A snapshot is a zip archive holding an index of the packages
+    and of their versions alongside one document per package
+    with the release information of each of these versions.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, name: str, path: Union[str, Path]):
+        super().__init__(
+            url=Path(path).resolve().as_uri(),
+            disable_cache=True,
+            max_workers=0
+        )
+
+        self._name = name
+        self._path = Path(path)
+        self._index = None
+        self._documents = {}
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def index(self) -> dict:
+        if self._index is None:
+            self._index = json.loads(self._read('index.json'))
+
+            if self._index['version'] != self.FORMAT_VERSION:
+                raise RuntimeError(
+                    f'Unsupported snapshot format '
+                    f'[{self._index["version"]}] in {self._path}'
+                )
+
+        return self._index
+
+    def get_package_info(self, name: str) -> dict:
+        versions = self.index['packages'].get(canonicalize_name(name))
+        if versions is None:
+            raise PackageNotFound(f'Package [{name}] not found.')
+
+        return {
+            'info': self._get_document(name)['info'],
+            'releases': {version: [] for version in versions}
+        }
+
+    def get_release_info(self, name: str, version: str) -> dict:
+        releases = self._get_document(name)['releases']
+        if version not in releases:
+            raise PackageNotFound(f'Package [{name}] ({version}) not found.')
+
+        return releases[version]
+
+    def _get_document(self, name: str) -> dict:
+        name = canonicalize_name(name)
+        if name not in self._documents:
+            if name not in self.index['packages']:
+                raise PackageNotFound(f'Package [{name}] not found.')
+
+            self._documents[name] = json.loads(
+                self._read(f'packages/{name}.json')
+            )
+
+        return self._documents[name]
+
+    def _read(self, member: str) -> str:
+        with zipfile.ZipFile(str(self._path)) as snapshot:
+            return snapshot.read(member).decode('utf-8')
+
+    def _get(self, url: str) -> None:
+        raise RuntimeError('Snapshot repositories cannot be queried remotely')
+
+    @classmethod
+    def export(cls,
+               path: Union[str, Path],
+               pool,
+               packages: List['poetry.packages.Package']) -> int:
+        """
+        Write a snapshot of the release information
+        of the given packages as provided by the remote
+        repositories of a pool.
+
+        Return the number of exported releases.
+        """
+        documents = {}
+        for package in packages:
+            if package.source_type:
+                # VCS dependencies are not served by repositories
+                continue
+
+            release_info = None
+            for repository in pool.repositories:
+                if not isinstance(repository, PyPiRepository):
+                    continue
+
+                try:
+                    release_info = repository.get_release_info(
+                        package.name, package.version
+                    )
+                except PackageNotFound:
+                    continue
+
+                break
+
+            if release_info is None:
+                raise PackageNotFound(
+                    f'Package [{package.name}] ({package.version}) not found.'
+                )
+
+            name = canonicalize_name(package.name)
+            document = documents.setdefault(name, {
+                'info': {
+                    'name': package.pretty_name,
+                },
+                'releases': {}
+            })
+            document['releases'][package.version] = release_info
+
+        index = {
+            'version': cls.FORMAT_VERSION,
+            'created': datetime.utcnow().isoformat(),
+            'packages': {
+                name: sorted(document['releases'])
+                for name, document in documents.items()
+            }
+        }
+
+        with zipfile.ZipFile(str(path), 'w', zipfile.ZIP_DEFLATED) as snapshot:
+            snapshot.writestr('index.json', json.dumps(index))
+            for name, document in documents.items():
+                snapshot.writestr(f'packages/{name}.json', json.dumps(document))
+
+        return sum(len(versions) for versions in index['packages'].values())
@@ -1,8 +1,7 @@
-from functools import cmp_to_key
-
 from .comparison import less_than
 from .constraints import Constraint
 from .helpers import normalize_version
+from .version import Version
 from .version_parser import VersionParser
 
 SORT_ASC = 1
@@ -47,16 +46,8 @@ def rsort(versions):
 
 
 def _sort(versions, direction):
-    normalized = [
-        (i, normalize_version(version))
-        for i, version in enumerate(versions)
-    ]
-    normalized.sort(
-        key=cmp_to_key(
-            lambda x, y:
-                0 if x[1] == y[1]
-                else -direction * int(less_than(x[1], y[1]) or -1)
-        )
+    return sorted(
+        versions,
+        key=Version.parse,
+        reverse=direction == SORT_DESC
     )
-
-    return [versions[i] for i, _ in normalized]
@@ -1,3 +1,5 @@
 from .constraint import Constraint
 from .empty_constraint import EmptyConstraint
 from .multi_constraint import MultiConstraint
+from .version_range import VersionRange
+from .version_range import VersionUnion
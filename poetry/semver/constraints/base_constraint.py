@@ -1,4 +1,34 @@
 class BaseConstraint:
 
+    _range = None
+
     def matches(self, provider):
         raise NotImplementedError()
+
+    def to_range(self):
+        """
+        Return the versions allowed by the constraint
+        as a VersionRange or a VersionUnion.
+
+        The result is computed once since constraints are immutable.
+        """
+        if self._range is None:
+            self._range = self._to_range()
+
+        return self._range
+
+    def filter(self, versions: list) -> list:
+        """
+        Return the allowed versions of a sorted list of Version objects.
+        """
+        return self.to_range().filter(versions)
+
+    def slices(self, versions: list) -> list:
+        """
+        Return the slices of a sorted list of Version objects
+        holding the allowed versions.
+        """
+        return self.to_range().slices(versions)
+
+    def _to_range(self):
+        raise NotImplementedError()
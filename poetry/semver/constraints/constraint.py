@@ -1,9 +1,9 @@
 import operator
 
-from pkg_resources import parse_version
-
-from ..helpers import normalize_version
+from ..version import Version
 from .base_constraint import BaseConstraint
+from .version_range import VersionRange
+from .version_range import union_of
 
 
 class Constraint(BaseConstraint):
@@ -44,7 +44,8 @@ class Constraint(BaseConstraint):
         self._operator = self._trans_op_str[operator]
         self._string_operator = operator
         self._version = version
-        
+        self._parsed_version = None
+
     @property
     def supported_operators(self) -> list:
         return list(self._trans_op_str.keys())
@@ -61,6 +62,13 @@ class Constraint(BaseConstraint):
     def version(self) -> str:
         return self._version
 
+    @property
+    def parsed_version(self) -> Version:
+        if self._parsed_version is None:
+            self._parsed_version = Version.parse(self._version)
+
+        return self._parsed_version
+
     def matches(self, provider):
         if isinstance(provider, self.__class__):
             return self.match_specific(provider)
@@ -75,21 +83,9 @@ class Constraint(BaseConstraint):
                 f'expected one of: {", ".join(self.supported_operators)}'
             )
 
-        # If we can't normalize the version
-        # we delegate to parse_version()
-        try:
-            a = normalize_version(a)
-        except ValueError:
-            pass
-
-        try:
-            b = normalize_version(b)
-        except ValueError:
-            pass
-
         return self._trans_op_str[operator](
-            parse_version(a),
-            parse_version(b)
+            Version.parse(a),
+            Version.parse(b)
         )
 
     def match_specific(self, provider: 'Constraint') -> bool:
@@ -106,9 +102,7 @@ class Constraint(BaseConstraint):
         # these kinds of comparisons always have a solution
         if is_non_equal_op or is_provider_non_equal_op:
             return (not is_equal_op and not is_provider_equal_op
-                    or self.version_compare(provider.version,
-                                            self._version,
-                                            '!='))
+                    or provider.parsed_version != self.parsed_version)
 
         # An example for the condition is <= 2.0 & < 1.0
         # These kinds of comparisons always have a solution
@@ -116,11 +110,7 @@ class Constraint(BaseConstraint):
                 and no_equal_op == provider_no_equal_op):
             return True
 
-        if self.version_compare(
-            provider.version,
-            self.version,
-            self._trans_op_int[self._operator]
-        ):
+        if self._operator(provider.parsed_version, self.parsed_version):
             # special case, e.g. require >= 1.0 and provide < 1.0
             # 1.0 >= 1.0 but 1.0 is outside of the provided interval
             if (
@@ -134,6 +124,26 @@ class Constraint(BaseConstraint):
 
         return False
 
+    def _to_range(self):
+        version = self.parsed_version
+
+        if self._operator is self.OP_EQ:
+            return VersionRange(version, version, True, True)
+
+        if self._operator is self.OP_NE:
+            return union_of(
+                VersionRange(max=version), VersionRange(min=version)
+            )
+
+        if self._operator in (self.OP_LT, self.OP_LE):
+            return VersionRange(
+                max=version, include_max=self._operator is self.OP_LE
+            )
+
+        return VersionRange(
+            min=version, include_min=self._operator is self.OP_GE
+        )
+
     def __str__(self):
         return '{} {}'.format(
             self._trans_op_int[self._operator],
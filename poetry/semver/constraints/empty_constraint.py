@@ -1,4 +1,5 @@
 from .base_constraint import BaseConstraint
+from .version_range import VersionRange
 
 
 class EmptyConstraint(BaseConstraint):
@@ -8,5 +9,8 @@ class EmptyConstraint(BaseConstraint):
     def matches(self, _):
         return True
 
+    def _to_range(self):
+        return VersionRange()
+
     def __str__(self):
         return '*'
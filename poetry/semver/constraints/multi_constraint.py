@@ -1,4 +1,6 @@
 from .base_constraint import BaseConstraint
+from .version_range import VersionRange
+from .version_range import union_of
 
 
 class MultiConstraint(BaseConstraint):
@@ -18,18 +20,18 @@ class MultiConstraint(BaseConstraint):
         return not self._conjunctive
 
     def matches(self, provider):
-        if self.is_disjunctive():
-            for constraint in self._constraints:
-                if constraint.matches(provider):
-                    return True
+        return self.to_range().allows_any(provider)
 
-            return False
+    def _to_range(self):
+        ranges = [constraint.to_range() for constraint in self._constraints]
+        if self.is_disjunctive():
+            return union_of(*[r for ranges_ in ranges for r in ranges_.ranges])
 
-        for constraint in self._constraints:
-            if not constraint.matches(provider):
-                return False
+        intersection = VersionRange()
+        for r in ranges:
+            intersection = intersection.intersect(r)
 
-        return True
+        return intersection
 
     def __str__(self):
         constraints = []
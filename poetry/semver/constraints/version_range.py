@@ -0,0 +1,351 @@
+from bisect import bisect_left
+from bisect import bisect_right
+from typing import List
+from typing import Union
+
+from ..version import Version
+from .base_constraint import BaseConstraint
+
+
+class VersionConstraint(BaseConstraint):
+    """
+    A set of versions represented as sorted disjoint intervals.
+
+    Operations always return simplified constraints: a VersionRange
+    if the result is a single interval or a VersionUnion otherwise.
+    """
+
+    @property
+    def ranges(self) -> tuple:
+        raise NotImplementedError()
+
+    def is_empty(self) -> bool:
+        return not self.ranges
+
+    def is_any(self) -> bool:
+        return len(self.ranges) == 1 and self.ranges[0].is_any()
+
+    def allows(self, version: Union[Version, str]) -> bool:
+        if not isinstance(version, Version):
+            version = Version.parse(version)
+
+        return any(r.allows(version) for r in self.ranges)
+
+    def filter(self, versions: List[Version]) -> List[Version]:
+        """
+        Return the allowed versions of a sorted list of versions.
+
+        The bounds of each interval are found by bisection
+        so the list is never scanned.
+        """
+        allowed = []
+        for s in self.slices(versions):
+            allowed += versions[s]
+
+        return allowed
+
+    def slices(self, versions: List[Version]) -> List[slice]:
+        slices = []
+        for r in self.ranges:
+            if r.min is None:
+                start = 0
+            elif r.include_min:
+                start = bisect_left(versions, r.min)
+            else:
+                start = bisect_right(versions, r.min)
+
+            if r.max is None:
+                stop = len(versions)
+            elif r.include_max:
+                stop = bisect_right(versions, r.max)
+            else:
+                stop = bisect_left(versions, r.max)
+
+            if start < stop:
+                slices.append(slice(start, stop))
+
+        return slices
+
+    def allows_all(self, other: BaseConstraint) -> bool:
+        return other.to_range().difference(self).is_empty()
+
+    def allows_any(self, other: BaseConstraint) -> bool:
+        return not self.intersect(other).is_empty()
+
+    def intersect(self, other: BaseConstraint) -> 'VersionConstraint':
+        other = other.to_range()
+
+        ranges = []
+        for a in self.ranges:
+            for b in other.ranges:
+                intersection = a.intersect_range(b)
+                if intersection is not None:
+                    ranges.append(intersection)
+
+        return union_of(*ranges)
+
+    def union(self, other: BaseConstraint) -> 'VersionConstraint':
+        return union_of(*(self.ranges + other.to_range().ranges))
+
+    def difference(self, other: BaseConstraint) -> 'VersionConstraint':
+        return self.intersect(other.to_range().complement())
+
+    def complement(self) -> 'VersionConstraint':
+        ranges = []
+        lower, include_lower = None, False
+        for r in self.ranges:
+            if r.min is not None:
+                ranges.append(VersionRange(
+                    lower, r.min, include_lower, not r.include_min
+                ))
+
+            if r.max is None:
+                return union_of(*ranges)
+
+            lower, include_lower = r.max, not r.include_max
+
+        ranges.append(VersionRange(lower, None, include_lower))
+
+        return union_of(*ranges)
+
+    def matches(self, provider: BaseConstraint) -> bool:
+        return self.allows_any(provider)
+
+    def to_range(self) -> 'VersionConstraint':
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, VersionConstraint):
+            return NotImplemented
+
+        return self.ranges == other.ranges
+
+    def __hash__(self):
+        return hash(self.ranges)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} \'{self}\'>'
+
+
+class VersionRange(VersionConstraint):
+    """
+    An interval of versions.
+
+    Missing bounds are unbounded.
+    """
+
+    def __init__(self,
+                 min: Union[Version, None] = None,
+                 max: Union[Version, None] = None,
+                 include_min: bool = False,
+                 include_max: bool = False):
+        self._min = min
+        self._max = max
+        self._include_min = include_min and min is not None
+        self._include_max = include_max and max is not None
+
+    @property
+    def min(self) -> Union[Version, None]:
+        return self._min
+
+    @property
+    def max(self) -> Union[Version, None]:
+        return self._max
+
+    @property
+    def include_min(self) -> bool:
+        return self._include_min
+
+    @property
+    def include_max(self) -> bool:
+        return self._include_max
+
+    @property
+    def ranges(self) -> tuple:
+        return self,
+
+    def is_any(self) -> bool:
+        return self._min is None and self._max is None
+
+    def is_valid(self) -> bool:
+        """
+        Whether the interval holds at least one version.
+        """
+        if self._min is None or self._max is None:
+            return True
+
+        if self._min == self._max:
+            return self._include_min and self._include_max
+
+        return self._min < self._max
+
+    def allows(self, version: Union[Version, str]) -> bool:
+        if not isinstance(version, Version):
+            version = Version.parse(version)
+
+        if self._min is not None:
+            if version < self._min:
+                return False
+
+            if not self._include_min and version == self._min:
+                return False
+
+        if self._max is not None:
+            if version > self._max:
+                return False
+
+            if not self._include_max and version == self._max:
+                return False
+
+        return True
+
+    def intersect_range(self,
+                        other: 'VersionRange') -> Union['VersionRange', None]:
+        lower = max(self, other, key=lambda r: r.lower_key)
+        upper = min(self, other, key=lambda r: r.upper_key)
+
+        intersection = VersionRange(
+            lower.min, upper.max, lower.include_min, upper.include_max
+        )
+        if not intersection.is_valid():
+            return None
+
+        return intersection
+
+    @property
+    def lower_key(self) -> tuple:
+        if self._min is None:
+            return 0,
+
+        return 1, self._min.key, 0 if self._include_min else 1
+
+    @property
+    def upper_key(self) -> tuple:
+        if self._max is None:
+            return 2,
+
+        return 1, self._max.key, 1 if self._include_max else 0
+
+    def to_constraint(self) -> BaseConstraint:
+        """
+        Convert the interval to the equivalent
+        Constraint, MultiConstraint or EmptyConstraint.
+        """
+        from .constraint import Constraint
+        from .empty_constraint import EmptyConstraint
+        from .multi_constraint import MultiConstraint
+
+        if self.is_any():
+            return EmptyConstraint()
+
+        if self._min is not None and self._min == self._max:
+            return Constraint('==', self._min.text)
+
+        constraints = []
+        if self._min is not None:
+            constraints.append(Constraint(
+                '>=' if self._include_min else '>', self._min.text
+            ))
+
+        if self._max is not None:
+            constraints.append(Constraint(
+                '<=' if self._include_max else '<', self._max.text
+            ))
+
+        if len(constraints) == 1:
+            return constraints[0]
+
+        return MultiConstraint(constraints)
+
+    def __eq__(self, other):
+        if not isinstance(other, VersionRange):
+            return super().__eq__(other)
+
+        return (
+            self.lower_key == other.lower_key
+            and self.upper_key == other.upper_key
+        )
+
+    def __hash__(self):
+        return hash((self.lower_key, self.upper_key))
+
+    def __str__(self):
+        if self.is_any():
+            return '*'
+
+        if self._min is not None and self._min == self._max:
+            return f'== {self._min.text}'
+
+        bounds = []
+        if self._min is not None:
+            op = '>=' if self._include_min else '>'
+            bounds.append(f'{op} {self._min.text}')
+
+        if self._max is not None:
+            op = '<=' if self._include_max else '<'
+            bounds.append(f'{op} {self._max.text}')
+
+        return ' '.join(bounds)
+
+
+class VersionUnion(VersionConstraint):
+    """
+    A union of disjoint intervals of versions.
+
+    Use union_of() to create a simplified union.
+    """
+
+    def __init__(self, ranges=()):
+        self._ranges = tuple(ranges)
+
+    @property
+    def ranges(self) -> tuple:
+        return self._ranges
+
+    def __str__(self):
+        if not self._ranges:
+            return '<empty>'
+
+        return ' || '.join(str(r) for r in self._ranges)
+
+
+def union_of(*ranges: VersionRange) -> VersionConstraint:
+    """
+    Merge overlapping and adjacent intervals.
+    """
+    ranges = sorted(
+        (r for r in ranges if r.is_valid()),
+        key=lambda r: r.lower_key
+    )
+
+    merged = []
+    for r in ranges:
+        if not merged:
+            merged.append(r)
+
+            continue
+
+        last = merged[-1]
+        if last.max is None:
+            break
+
+        contiguous = r.min is None or r.min < last.max or (
+            r.min == last.max and (last.include_max or r.include_min)
+        )
+        if not contiguous:
+            merged.append(r)
+
+            continue
+
+        upper = max(last, r, key=lambda r: r.upper_key)
+        merged[-1] = VersionRange(
+            last.min, upper.max, last.include_min, upper.include_max
+        )
+
+    if len(merged) == 1:
+        return merged[0]
+
+    return VersionUnion(merged)
+
+
+EMPTY = VersionUnion()
@@ -1,5 +1,7 @@
 import re
 
+from functools import lru_cache
+
 _modifier_regex = (
     '[._-]?'
     '(?:(stable|beta|b|RC|c|pre|alpha|a|patch|pl|p|post|[a-z])'
@@ -8,25 +10,46 @@ _modifier_regex = (
 )
 
 
+_build_regex = re.compile('^([^,\s+]+)\+[^\s]+$')
+
+_classic_regex = re.compile(
+    '(?i)^v?(\d{{1,5}})(\.\d+)?(\.\d+)?(\.\d+)?{}$'.format(_modifier_regex)
+)
+
+_post_regex = re.compile(
+    '(?i)^v?(\d{{1,5}})(\.\d+)?(\.\d+)?(\.\d+)?-(?:\d+){}$'.format(
+        _modifier_regex
+    )
+)
+
+_date_regex = re.compile(
+    '(?i)^v?(\d{{4}}(?:[.:-]?\d{{2}}){{1,6}}(?:[.:-]?\d{{1,3}})?){}$'.format(
+        _modifier_regex
+    )
+)
+
+# Plain versions, like 1.2.3, which only need to be padded
+_plain_regex = re.compile('^\d{1,5}(?:\.\d+){0,3}$')
+
+
+@lru_cache(maxsize=8192)
 def normalize_version(version):
     """
     Normalizes a version string to be able to perform comparisons on it.
     """
     version = version.strip()
 
+    if _plain_regex.match(version):
+        return version + '.0' * (3 - version.count('.'))
+
     # strip off build metadata
-    m = re.match('^([^,\s+]+)\+[^\s]+$', version)
+    m = _build_regex.match(version)
     if m:
         version = m.group(1)
 
     index = None
     # Match classic versioning
-    m = re.match(
-        '(?i)^v?(\d{{1,5}})(\.\d+)?(\.\d+)?(\.\d+)?{}$'.format(
-            _modifier_regex
-        ),
-        version
-    )
+    m = _classic_regex.match(version)
     if m:
         version = f'{m.group(1)}' \
                   f'{m.group(2) if m.group(2) else ".0"}' \
@@ -36,12 +59,7 @@ def normalize_version(version):
     else:
         # Some versions have the form M.m.p-\d+
         # which means M.m.p-post\d+
-        m = re.match(
-            '(?i)^v?(\d{{1,5}})(\.\d+)?(\.\d+)?(\.\d+)?-(?:\d+){}$'.format(
-                _modifier_regex
-            ),
-            version
-        )
+        m = _post_regex.match(version)
         if m:
             version = f'{m.group(1)}' \
                       f'{m.group(2) if m.group(2) else ".0"}' \
@@ -50,12 +68,7 @@ def normalize_version(version):
             index = 5
         else:
             # Match date(time) based versioning
-            m = re.match(
-                '(?i)^v?(\d{{4}}(?:[.:-]?\d{{2}}){{1,6}}(?:[.:-]?\d{{1,3}})?){}$'.format(
-                    _modifier_regex
-                ),
-                version
-            )
+            m = _date_regex.match(version)
             if m:
                 version = re.sub('\D', '.', m.group(1))
 
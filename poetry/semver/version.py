@@ -0,0 +1,73 @@
+from functools import lru_cache
+from functools import total_ordering
+
+from pkg_resources import parse_version
+
+from .helpers import normalize_version
+
+
+@total_ordering
+class Version:
+    """
+    An immutable parsed version.
+
+    The version is normalized and parsed once
+    so that comparisons only compare precomputed keys.
+    Use Version.parse() to share the instances of identical strings.
+    """
+
+    __slots__ = ('_text', '_normalized', '_key')
+
+    def __init__(self, text: str):
+        self._text = text
+
+        # If we can't normalize the version
+        # we delegate to parse_version()
+        try:
+            self._normalized = normalize_version(text)
+        except ValueError:
+            self._normalized = text
+
+        self._key = parse_version(self._normalized)
+
+    @classmethod
+    def parse(cls, text: str) -> 'Version':
+        return _parse(text)
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def normalized(self) -> str:
+        return self._normalized
+
+    @property
+    def key(self):
+        return self._key
+
+    def __eq__(self, other):
+        if not isinstance(other, Version):
+            return NotImplemented
+
+        return self._key == other.key
+
+    def __lt__(self, other):
+        if not isinstance(other, Version):
+            return NotImplemented
+
+        return self._key < other.key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __str__(self):
+        return self._text
+
+    def __repr__(self):
+        return f'<Version \'{self._text}\'>'
+
+
+@lru_cache(maxsize=8192)
+def _parse(text: str) -> Version:
+    return Version(text)
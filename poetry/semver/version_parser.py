@@ -1,8 +1,11 @@
 import re
 
+from functools import lru_cache
+
 from .constraints.constraint import Constraint
 from .constraints.empty_constraint import EmptyConstraint
 from .constraints.multi_constraint import MultiConstraint
+from .constraints.version_range import VersionRange
 from .helpers import normalize_version, _expand_stability
 
 
@@ -22,7 +25,24 @@ class VersionParser:
         """
         Parses a constraint string into
         MultiConstraint and/or Constraint objects.
+
+        Identical strings share the same constraint objects
+        so they must not be modified.
+        """
+        return _parse_constraints(constraints)
+
+    @classmethod
+    def cache_info(cls):
+        """
+        Return the hits and misses of the parsed constraints cache.
         """
+        return _parse_constraints.cache_info()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        _parse_constraints.cache_clear()
+
+    def _parse_constraints(self, constraints: str):
         pretty_constraint = constraints
 
         m = re.match(
@@ -58,31 +78,15 @@ class VersionParser:
 
         if len(or_groups) == 1:
             constraint = or_groups[0]
-        elif len(or_groups) == 2:
-            # parse the two OR groups and if they are contiguous we collapse
-            # them into one constraint
-            a = str(or_groups[0])
-            b = str(or_groups[1])
-            pos_a = a.find('<', 4)
-            pos_b = a.find('<', 4)
-            if (
-                isinstance(or_groups[0], MultiConstraint)
-                and isinstance(or_groups[1], MultiConstraint)
-                and len(or_groups[0].constraints)
-                and len(or_groups[1].constraints)
-                and a[:3] == '[>=' and pos_a != -1
-                and b[:3] == '[>=' and pos_b != -1
-                and a[pos_a + 2:-1] == b[4:pos_b - 5]
-            ):
-                constraint = MultiConstraint(
-                    Constraint('>=', a[4:pos_a - 5]),
-                    Constraint('<', b[pos_b + 2:-1])
-                )
-            else:
-                constraint = MultiConstraint(or_groups, False)
         else:
             constraint = MultiConstraint(or_groups, False)
 
+            # If the OR groups are contiguous,
+            # like >=1.0,<1.1 || >=1.1,<2.0, we collapse them
+            union = constraint.to_range()
+            if isinstance(union, VersionRange) and not union.is_any():
+                constraint = union.to_constraint()
+
         constraint.pretty_string = pretty_constraint
 
         return constraint
@@ -237,3 +241,8 @@ class VersionParser:
 
         return '{}.{}.{}.{}'.format(matches[0], matches[1],
                                     matches[2], matches[3])
+
+
+@lru_cache(maxsize=2048)
+def _parse_constraints(constraints: str):
+    return VersionParser()._parse_constraints(constraints)
@@ -0,0 +1,170 @@
+import os
+import time
+
+import pytest
+
+from cachy.stores import FileStore
+
+from poetry.cache import CacheManager
+from poetry.cache import RepositoryCache
+from poetry.cache.repository_cache import parse_size
+from poetry.config import Config
+from poetry.utils.toml_file import TomlFile
+
+
+def make_cache(directory, name):
+    return CacheManager({
+        'default': 'releases',
+        'serializer': 'json',
+        'stores': {
+            'releases': {
+                'driver': 'sqlite',
+                'path': str(directory / f'{name}.db'),
+                'table': 'releases'
+            }
+        }
+    })
+
+
+@pytest.fixture()
+def directory(tmpdir):
+    return tmpdir / 'repositories'
+
+
+def test_stats(directory):
+    cache = make_cache(directory, 'pypi')
+    cache.forever('foo:1.0', 'a' * 100)
+    cache.get('foo:1.0')
+    cache.get('foo:2.0')
+    assert cache.has('foo:1.0')
+    assert not cache.has('foo:3.0')
+    cache.store().get_store().flush_statistics()
+
+    directory.mkdir('private').join('depcache-py3.6.json').write('{}')
+
+    repository_cache = RepositoryCache(str(directory))
+
+    assert repository_cache.names() == ['private', 'pypi']
+
+    stats = repository_cache.stats('pypi')
+
+    assert stats['size'] > 0
+    assert stats['stores'] == {
+        'releases': {'items': 1, 'size': 102, 'hits': 1, 'misses': 1}
+    }
+    assert repository_cache.stats('private') == {'size': 2, 'stores': {}}
+
+
+def test_clear(directory):
+    make_cache(directory, 'pypi').forever('foo:1.0', 'bar')
+    make_cache(directory, 'private').forever('foo:1.0', 'bar')
+
+    repository_cache = RepositoryCache(str(directory))
+    repository_cache.clear('pypi')
+
+    assert repository_cache.names() == ['private']
+
+
+def test_remove_legacy_stores(directory):
+    FileStore(str(directory / 'pypi')).forever('foo', 'bar')
+    private = FileStore(str(directory / 'private'))
+    private.forever('foo', 'bar')
+    private.forever('baz', 'bar')
+    directory.join('private', 'depcache-py3.6.json').write('{}')
+    make_cache(directory, 'private').forever('foo:1.0', 'bar')
+
+    repository_cache = RepositoryCache(str(directory))
+
+    assert repository_cache.remove_legacy_stores() == 3
+    assert repository_cache.names() == ['private']
+    assert directory.join('private').listdir() == [
+        directory.join('private', 'depcache-py3.6.json')
+    ]
+    assert repository_cache.remove_legacy_stores() == 0
+
+
+def test_evict_least_recently_used_items(directory, monkeypatch):
+    pypi = make_cache(directory, 'pypi')
+    private = make_cache(directory, 'private')
+
+    now = time.time()
+    for i, cache in enumerate([pypi, private, pypi, private]):
+        monkeypatch.setattr(
+            'poetry.cache.sqlite_store.time.time', lambda: now + i
+        )
+        cache.forever(f'foo:{i}', 'a' * 100000)
+
+    assert RepositoryCache(str(directory)).evict() == 0
+
+    repository_cache = RepositoryCache(str(directory), max_size=250 * 1024)
+
+    assert repository_cache.evict() == 2
+    assert not pypi.has('foo:0')
+    assert not private.has('foo:1')
+    assert pypi.has('foo:2')
+    assert private.has('foo:3')
+
+    # The databases have been compacted
+    size = sum(repository_cache.stats(n)['size'] for n in ['pypi', 'private'])
+    assert 200000 < size <= 250 * 1024
+
+
+def test_evict_dependency_caches_by_size(directory, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr('poetry.cache.sqlite_store.time.time', lambda: now)
+    cache = make_cache(directory, 'private')
+    cache.forever('foo:1.0', 'a' * 100000)
+
+    depcache = directory.mkdir('private').join('depcache-py3.6.json')
+    depcache.write('a' * 100000)
+    os.utime(str(depcache), (now - 10,) * 2)
+
+    repository_cache = RepositoryCache(str(directory), max_size=150 * 1024)
+
+    assert repository_cache.evict() == 1
+    assert not depcache.exists()
+    assert cache.has('foo:1.0')
+
+
+def test_evict_old_items(directory, monkeypatch):
+    cache = make_cache(directory, 'pypi')
+
+    now = time.time()
+    monkeypatch.setattr(
+        'poetry.cache.sqlite_store.time.time', lambda: now - 40 * 86400
+    )
+    cache.forever('foo:old', 'bar')
+    monkeypatch.setattr('poetry.cache.sqlite_store.time.time', lambda: now)
+    cache.forever('foo:new', 'bar')
+
+    depcache = directory.mkdir('pypi').join('depcache-py3.6.json')
+    depcache.write('{}')
+    os.utime(str(depcache), (now - 40 * 86400,) * 2)
+
+    assert RepositoryCache(str(directory), max_age=30).evict() == 2
+    assert not cache.has('foo:old')
+    assert cache.has('foo:new')
+    assert not depcache.exists()
+
+
+def test_create_from_config(tmpdir):
+    config = tmpdir.join('config.toml')
+    config.write("""[settings.cache]
+max-size = "1.5M"
+max-age = 30
+""")
+
+    cache = RepositoryCache.create(Config(TomlFile(str(config))))
+
+    assert cache.max_size == int(1.5 * 1024 * 1024)
+    assert cache.max_age == 30
+
+
+def test_parse_size():
+    assert parse_size(1000) == 1000
+    assert parse_size('100') == 100
+    assert parse_size('2K') == 2048
+    assert parse_size('1 GB') == 1024 ** 3
+
+    with pytest.raises(ValueError):
+        parse_size('foo')
@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+from poetry.cache import CacheClient
+from poetry.cache import CacheServer
+from poetry.repositories.pypi_repository import PyPiRepository
+
+from ..repositories.server import PyPiServer
+
+
+@pytest.fixture()
+def server(tmpdir):
+    server = CacheServer(str(tmpdir.join('server.sock'))).start()
+
+    yield server
+
+    server.stop()
+
+
+def run_concurrently(*callbacks):
+    results = [None] * len(callbacks)
+
+    def run(i):
+        results[i] = callbacks[i]()
+
+    threads = [
+        threading.Thread(target=run, args=(i,)) for i in range(len(callbacks))
+    ]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def test_identical_retrievals_are_coalesced(server):
+    calls = []
+
+    def retrieve():
+        calls.append(1)
+        time.sleep(0.2)
+
+        return {'name': 'foo'}
+
+    results = run_concurrently(*[
+        lambda: CacheClient(server.path).remember('foo:1.0', retrieve)
+        for _ in range(4)
+    ])
+
+    assert results == [{'name': 'foo'}] * 4
+    assert len(calls) == 1
+
+
+def test_failed_retrievals_release_their_lease(server):
+    client = CacheClient(server.path)
+
+    def fail():
+        raise ValueError('Package [foo] not found.')
+
+    with pytest.raises(ValueError):
+        client.remember('foo:1.0', fail)
+
+    assert client.remember('foo:1.0', lambda: None) is None
+    assert client.remember('foo:1.0', lambda: 'other') is None
+
+
+def test_items_are_retrieved_directly_without_server(tmpdir):
+    client = CacheClient(str(tmpdir.join('server.sock')))
+
+    assert client.remember('foo:1.0', lambda: 'foo') == 'foo'
+
+
+def test_repositories_share_retrievals(server, tmpdir, monkeypatch):
+    monkeypatch.setattr(
+        'poetry.repositories.pypi_repository.CACHE_DIR', str(tmpdir)
+    )
+
+    pypi = PyPiServer(latency=0.1).start()
+    try:
+        repositories = [
+            PyPiRepository(
+                url=pypi.url,
+                max_workers=0,
+                cache_client=CacheClient(server.path)
+            )
+            for _ in range(3)
+        ]
+
+        results = run_concurrently(*[
+            lambda r=repository: r.get_release_info('requests', '2.18.3')
+            for repository in repositories
+        ])
+    finally:
+        pypi.stop()
+
+    assert results[0]['version'] == '2.18.3'
+    assert results.count(results[0]) == 3
+    assert sorted(pypi.requests) == [
+        '/pypi/requests/2.18.3/json',
+        '/pypi/requests/json',
+    ]
@@ -0,0 +1,160 @@
+import sqlite3
+import threading
+
+import pytest
+
+from poetry.cache import CacheManager
+from poetry.cache import SQLiteStore
+
+
+@pytest.fixture()
+def path(tmpdir):
+    return tmpdir.join('cache.db')
+
+
+@pytest.fixture()
+def cache(path):
+    return CacheManager({
+        'default': 'releases',
+        'serializer': 'json',
+        'stores': {
+            'releases': {
+                'driver': 'sqlite',
+                'path': str(path),
+                'table': 'releases'
+            },
+            'misses': {
+                'driver': 'sqlite',
+                'path': str(path),
+                'table': 'misses'
+            }
+        }
+    })
+
+
+def test_store(cache):
+    cache.forever('foo:1.0', {'name': 'foo'})
+    cache.store('misses').put('bar', True, 10)
+
+    assert cache.get('foo:1.0') == {'name': 'foo'}
+    assert cache.has('foo:1.0')
+    assert not cache.has('bar')
+    assert cache.store('misses').get('bar') is True
+    assert cache.remember_forever('baz:1.0', lambda: [1, 2]) == [1, 2]
+
+    assert cache.forget('foo:1.0')
+    assert not cache.has('foo:1.0')
+
+    cache.flush()
+
+    assert not cache.has('baz:1.0')
+    assert cache.store('misses').has('bar')
+
+
+def test_expired_items_are_not_returned(cache, monkeypatch):
+    cache.put('foo', 'bar', 1)
+
+    assert cache.get('foo') == 'bar'
+
+    monkeypatch.setattr('poetry.cache.sqlite_store.time.time', lambda: 5e9)
+
+    assert cache.get('foo') is None
+
+
+def test_reads_update_the_access_time(cache, path, monkeypatch):
+    monkeypatch.setattr('poetry.cache.sqlite_store.time.time', lambda: 1000)
+    cache.forever('foo', 'bar')
+    cache.forever('baz', 'bar')
+
+    def accessed(key):
+        with sqlite3.connect(str(path)) as connection:
+            return connection.execute(
+                'SELECT accessed FROM releases WHERE key = ?', (key,)
+            ).fetchone()[0]
+
+    monkeypatch.setattr('poetry.cache.sqlite_store.time.time', lambda: 2000)
+    assert cache.get('foo') == 'bar'
+    assert accessed('foo') == 1000
+
+    monkeypatch.setattr('poetry.cache.sqlite_store.time.time', lambda: 5000)
+    assert cache.get('foo') == 'bar'
+    assert cache.has('baz')
+    assert accessed('foo') == 5000
+    assert accessed('baz') == 1000
+
+
+def test_warm_up_loads_items_in_bulk(cache, path):
+    for i in range(1000):
+        cache.forever(f'foo:{i}', i)
+
+    store = cache.store().get_store()
+
+    assert store.warm_up(f'foo:{i}' for i in range(0, 1000, 2)) == 500
+
+    with sqlite3.connect(str(path)) as connection:
+        connection.execute('DELETE FROM releases')
+
+    assert cache.get('foo:2') == 2
+    assert cache.get('foo:3') is None
+
+
+def test_compaction(cache, path, monkeypatch):
+    cache.put('foo', 'bar', 1)
+    cache.forever('baz', 'qux')
+
+    monkeypatch.setattr(
+        'poetry.cache.sqlite_store.time.time', lambda: 5e9
+    )
+
+    # Compaction happens when the database is opened
+    store = SQLiteStore(str(path), 'releases')
+    store.set_serializer(cache.store().get_store()._serializer)
+
+    with sqlite3.connect(str(path)) as connection:
+        assert connection.execute('SELECT key FROM releases ORDER BY key').fetchall() == [
+            ('baz',), ('foo',)
+        ]
+
+    assert store.get('baz') == 'qux'
+
+    with sqlite3.connect(str(path)) as connection:
+        assert connection.execute('SELECT key FROM releases ORDER BY key').fetchall() == [
+            ('baz',)
+        ]
+
+
+def test_stores_are_usable_from_other_threads(cache):
+    cache.forever('foo', 'bar')
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(cache.get('foo')))
+    thread.start()
+    thread.join()
+
+    assert results == ['bar']
+
+
+def test_keys_are_normalized_once(path):
+    store = SQLiteStore(str(path), 'releases')
+    store.forever('Django:1.11', {'name': 'Django'})
+    store.forever('django:1.11', {'name': 'django'})
+    store.forever('requests:2.18', {'name': 'requests'})
+    store.connection.close()
+
+    store = SQLiteStore(str(path), 'releases', key_normalizer=str.lower)
+
+    assert store.get('django:1.11') is not None
+    assert store.get('requests:2.18') == {'name': 'requests'}
+    assert [
+        row[0] for row in store.connection.execute(
+            'SELECT key FROM releases ORDER BY key'
+        )
+    ] == ['django:1.11', 'requests:2.18']
+
+    store.forever('Flask:0.12', {'name': 'Flask'})
+    store.connection.close()
+
+    # Already normalized databases are left untouched
+    store = SQLiteStore(str(path), 'releases', key_normalizer=str.lower)
+
+    assert store.get('Flask:0.12') == {'name': 'Flask'}
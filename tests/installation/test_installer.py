@@ -4,12 +4,14 @@ import sys
 
 from pathlib import Path
 
+from poetry.config import Config
 from poetry.installation import Installer as BaseInstaller
 from poetry.installation.noop_installer import NoopInstaller
 from poetry.io import NullIO
 from poetry.packages import Locker as BaseLocker
 from poetry.repositories import Pool
 from poetry.repositories import Repository
+from poetry.utils.toml_file import TomlFile
 
 from tests.helpers import get_dependency
 from tests.helpers import get_package
@@ -109,6 +111,19 @@ def test_run_no_dependencies(installer, locker):
     assert locker.written_data == expected
 
 
+def test_run_uses_the_configured_engine(tmpdir, package, locker, pool):
+    config = tmpdir.join('config.toml')
+    config.write('[settings.resolver]\nengine = "unknown"\n')
+    installer = Installer(
+        NullIO(), package, locker, pool, Config(TomlFile(str(config)))
+    )
+
+    with pytest.raises(ValueError) as e:
+        installer.run()
+
+    assert str(e.value) == 'Invalid resolver engine [unknown]'
+
+
 def test_run_with_dependencies(installer, locker, repo, package):
     package_a = get_package('A', '1.0')
     package_b = get_package('B', '1.1')
@@ -313,6 +328,28 @@ def test_run_with_dependencies_extras(installer, locker, repo, package):
     assert locker.written_data == expected
 
 
+def test_run_with_sub_dependencies_extras(installer, locker, repo, package):
+    package_a = get_package('A', '1.0')
+    package_b = get_package('B', '1.0')
+    package_c = get_package('C', '1.0')
+
+    package_a.add_dependency('B', {'version': '^1.0', 'extras': ['foo']})
+    package_b.extras = {
+        'foo': [get_dependency('C', '^1.0')]
+    }
+
+    repo.add_package(package_a)
+    repo.add_package(package_b)
+    repo.add_package(package_c)
+
+    package.add_dependency('A', '^1.0')
+
+    installer.run()
+    expected = fixture('with-sub-dependencies-extras')
+
+    assert locker.written_data == expected
+
+
 def test_run_does_not_install_extras_if_not_requested(installer, locker, repo, package):
     package.extras['foo'] = [
         get_dependency('D')
@@ -0,0 +1,54 @@
+import pytest
+
+from poetry.mixology.pubgrub.term import DISJOINT
+from poetry.mixology.pubgrub.term import OVERLAPPING
+from poetry.mixology.pubgrub.term import SUBSET
+from poetry.mixology.pubgrub.term import Term
+from poetry.semver.version_parser import VersionParser
+
+
+def term(constraint, positive=True):
+    return Term(
+        'foo',
+        VersionParser().parse_constraints(constraint).to_range(),
+        positive
+    )
+
+
+@pytest.mark.parametrize(
+    'a, b, expected',
+    [
+        (term('^1.0'), term('>=1.0'), SUBSET),
+        (term('>=1.0'), term('^1.0'), OVERLAPPING),
+        (term('^1.0'), term('^2.0'), DISJOINT),
+        (term('^1.0'), term('^2.0', False), SUBSET),
+        (term('^1.0'), term('>=1.0', False), DISJOINT),
+        (term('^1.0', False), term('^1.0'), DISJOINT),
+        (term('^1.0', False), term('^2.0'), OVERLAPPING),
+        (term('>=1.0', False), term('^1.0', False), SUBSET),
+        (term('^1.0', False), term('>=1.0', False), OVERLAPPING),
+    ]
+)
+def test_relation(a, b, expected):
+    assert a.relation(b) == expected
+
+
+def test_intersect():
+    assert str(term('>=1.0').intersect(term('<2.0'))) == (
+        'foo (>= 1.0.0.0 < 2.0.0.0)'
+    )
+    assert str(term('>=1.0').intersect(term('>=2.0', False))) == (
+        'foo (>= 1.0.0.0 < 2.0.0.0)'
+    )
+    assert str(term('^1.0', False).intersect(term('^2.0', False))) == (
+        'not foo (>= 1.0.0.0 < 3.0.0.0)'
+    )
+    assert term('^1.0').intersect(term('^2.0')).is_empty()
+
+
+def test_difference():
+    difference = term('>=1.0').difference(term('>=2.0'))
+
+    assert difference.positive
+    assert str(difference) == 'foo (>= 1.0.0.0 < 2.0.0.0)'
+    assert term('^1.0').difference(term('>=1.0')).is_empty()
@@ -1,6 +1,7 @@
 import pytest
 
 from poetry.mixology import DependencyGraph
+from poetry.mixology.exceptions import CircularDependencyError
 
 
 @pytest.fixture()
@@ -81,3 +82,115 @@ def test_detach_vertex_with_predecessors(graph):
     assert graph.vertices == {parent.name: parent}
     assert len(parent.outgoing_edges) == 0
 
+
+def test_rewind_to_restores_tagged_state(graph):
+    root = graph.add_vertex('root', 'root', True)
+    graph.tag('initial')
+
+    child = graph.add_child_vertex('child', 'child', ['root'], 'child')
+    graph.set_payload('root', 'new root')
+    graph.add_explicit_requirement('root', 'root')
+
+    graph.rewind_to('initial')
+
+    assert graph.vertices == {'root': root}
+    assert graph.vertex_named('root') is root
+    assert root.payload == 'root'
+    assert root.explicit_requirements == []
+    assert root.outgoing_edges == []
+    assert child.name == 'child'
+    assert child.payload == 'child'
+    assert child.predecessors == [root]
+
+
+def test_reading_a_vertex_does_not_copy_its_state(graph):
+    root = graph.add_child_vertex('root', 'root', [None], 'root')
+    requirements = root.explicit_requirements
+    graph.tag('initial')
+
+    assert root.explicit_requirements is requirements
+
+    graph.add_explicit_requirement('root', 'other')
+
+    assert root.explicit_requirements == ['root', 'other']
+    assert requirements == ['root']
+
+
+def test_rewind_to_drops_later_tags(graph):
+    graph.add_vertex('root', 'root', True)
+    graph.tag('first')
+    graph.add_vertex('a', 'a', True)
+    graph.tag('second')
+    graph.add_vertex('b', 'b', True)
+
+    graph.rewind_to('first')
+
+    assert list(graph.vertices) == ['root']
+    with pytest.raises(ValueError):
+        graph.rewind_to('second')
+
+    with pytest.raises(ValueError):
+        graph.rewind_to('first')
+
+
+def test_rewind_to_most_recent_tag(graph):
+    graph.add_vertex('root', 'root', True)
+    graph.tag('swap')
+    graph.set_payload('root', 'a')
+    graph.tag('swap')
+    graph.set_payload('root', 'b')
+
+    graph.rewind_to('swap')
+    assert graph.vertex_named('root').payload == 'a'
+
+    graph.rewind_to('swap')
+    assert graph.vertex_named('root').payload == 'root'
+
+
+def test_rewind_to_restores_detached_vertices(graph):
+    root = graph.add_vertex('root', 'root', True)
+    child = graph.add_child_vertex('child', 'child', ['root'], 'child')
+    graph.tag('attached')
+
+    graph.detach_vertex_named('root')
+    assert len(graph.vertices) == 0
+
+    graph.rewind_to('attached')
+
+    assert graph.vertices == {'root': root, 'child': child}
+    assert root.successors == [child]
+    assert child.predecessors == [root]
+
+
+def test_has_path_to(graph):
+    root = graph.add_vertex('root', 'root', True)
+    a = graph.add_child_vertex('a', 'a', ['root'], 'a')
+    b = graph.add_child_vertex('b', 'b', ['a'], 'b')
+    c = graph.add_vertex('c', 'c', True)
+
+    assert root.has_path_to(root)
+    assert root.has_path_to(b)
+    assert not b.has_path_to(root)
+    assert not root.has_path_to(c)
+
+
+def test_has_path_to_walks_shared_subgraphs_once(graph):
+    # Every vertex of a layer depends on every vertex of the next one:
+    # there are 2 ** 30 paths from the top to the bottom.
+    previous = [graph.add_vertex('top', 'top', True)]
+    for layer in range(30):
+        current = [
+            graph.add_vertex(f'{layer}-{i}', f'{layer}-{i}') for i in range(2)
+        ]
+        for origin in previous:
+            for destination in current:
+                graph.add_edge(origin, destination, destination.name)
+
+        previous = current
+
+    bottom = graph.add_vertex('bottom', 'bottom', True)
+
+    assert not graph.vertex_named('top').has_path_to(bottom)
+
+    with pytest.raises(CircularDependencyError):
+        graph.add_edge(previous[0], graph.vertex_named('top'), 'top')
@@ -7,6 +7,9 @@ from poetry.mixology import Resolver
 from poetry.mixology.exceptions import CircularDependencyError
 from poetry.mixology.exceptions import ResolverError
 from poetry.mixology.exceptions import VersionConflict
+from poetry.mixology.exceptions import VersionSolvingFailure
+from poetry.mixology.pubgrub import PubGrubResolver
+from poetry.mixology.pubgrub.incompatibility import DependencyCause
 from poetry.packages import Dependency
 
 from .index import Index
@@ -130,9 +133,10 @@ def assert_graph(dg, result):
         'django',
     ]
 )
-def test_resolver(fixture):
+@pytest.mark.parametrize('resolver_class', [Resolver, PubGrubResolver])
+def test_resolver(resolver_class, fixture):
     c = case(fixture)
-    resolver = Resolver(c.index, UI(True))
+    resolver = resolver_class(c.index, UI(True))
     dg = resolver.resolve(c.requested, base=c.base)
 
     assert_graph(dg, c.result)
@@ -145,9 +149,10 @@ def test_resolver(fixture):
         'unresolvable_child'
     ]
 )
-def test_resolver_fail(fixture):
+@pytest.mark.parametrize('resolver_class', [Resolver, PubGrubResolver])
+def test_resolver_fail(resolver_class, fixture):
     c = case(fixture)
-    resolver = Resolver(c.index, UI())
+    resolver = resolver_class(c.index, UI())
 
     with pytest.raises(ResolverError) as e:
         resolver.resolve(c.requested, base=c.base)
@@ -158,5 +163,15 @@ def test_resolver_fail(fixture):
         names = [d.name for d in e.dependencies]
     elif isinstance(e, VersionConflict):
         names = [n for n in e.conflicts.keys()]
+    elif isinstance(e, VersionSolvingFailure):
+        # The conflicts are the dependencies which could not be satisfied
+        depending = set()
+        depended = set()
+        for i in e.incompatibility.external_incompatibilities():
+            if isinstance(i.cause, DependencyCause):
+                for term in i.terms:
+                    (depending if term.positive else depended).add(term.name)
+
+        names = list(depended - depending)
 
     assert sorted(names) == sorted(c.conflicts)
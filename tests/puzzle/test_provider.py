@@ -0,0 +1,64 @@
+from poetry.packages import Package
+from poetry.puzzle.provider import Provider
+from poetry.repositories.pool import Pool
+from poetry.repositories.repository import Repository
+
+from tests.helpers import get_dependency
+from tests.helpers import get_package
+
+
+def test_search_for_is_cached(monkeypatch):
+    repo = Repository([
+        get_package('A', '1.0'),
+        get_package('A', '2.0'),
+        get_package('B', '1.0'),
+    ])
+    pool = Pool([repo])
+    provider = Provider(Package('root', '1.0'), pool)
+
+    calls = []
+    find_packages = pool.find_packages
+
+    def spy(*args, **kwargs):
+        calls.append(args[0])
+
+        return find_packages(*args, **kwargs)
+
+    monkeypatch.setattr(pool, 'find_packages', spy)
+
+    packages = provider.search_for(get_dependency('A', '*'))
+    packages.pop()
+
+    packages = provider.search_for(get_dependency('A'))
+
+    assert [p.pretty_version for p in packages] == ['1.0', '2.0']
+    assert len(provider.search_for(get_dependency('A', '>=2.0'))) == 1
+    assert len(provider.search_for(get_dependency('B'))) == 1
+    assert calls == ['a', 'a', 'b']
+    assert provider.search_for_stats == {'hits': 1, 'misses': 3}
+
+    provider.clear_cache()
+    provider.search_for(get_dependency('A'))
+
+    assert calls == ['a', 'a', 'b', 'a']
+
+
+def test_dependencies_known_once_completed():
+    package_a = get_package('A', '1.0')
+    package_a.requires.append(get_dependency('B', '^1.0'))
+    locked_b = get_package('B', '1.0')
+    pool = Pool([Repository([package_a, get_package('B', '1.0')])])
+    provider = Provider(Package('root', '1.0'), pool, [locked_b])
+
+    a = provider.search_for(get_dependency('A'))[0]
+    b = provider.search_for(get_dependency('B'))[0]
+
+    assert not provider.dependencies_known(a)
+    assert provider.dependencies_known(b)
+
+    assert provider.dependencies_for(a) == [get_dependency('B', '^1.0')]
+    assert provider.dependencies_known(a)
+
+    provider.clear_cache()
+
+    assert not provider.dependencies_known(a)
@@ -1,8 +1,11 @@
 import pytest
 
+from pathlib import Path
+
 from cleo.outputs.null_output import NullOutput
 from cleo.styles import OutputStyle
 
+from poetry.packages import Locker
 from poetry.packages import Package
 from poetry.repositories.installed_repository import InstalledRepository
 from poetry.repositories.pool import Pool
@@ -39,9 +42,14 @@ def pool(repo):
     return Pool([repo])
 
 
+@pytest.fixture(params=['mixology', 'pubgrub'])
+def engine(request):
+    return request.param
+
+
 @pytest.fixture()
-def solver(package, pool, installed, io):
-    return Solver(package, pool, installed, io)
+def solver(package, pool, installed, io, engine):
+    return Solver(package, pool, installed, io, engine=engine)
 
 
 def check_solver_result(ops, expected):
@@ -440,3 +448,296 @@ def test_solver_does_not_return_prereleases_if_not_requested(solver, repo):
         {'job': 'install', 'package': package_b},
         {'job': 'install', 'package': package_a},
     ])
+
+
+def test_solver_only_completes_tried_packages(package, installed, io, engine):
+    class LazyRepository(Repository):
+
+        def __init__(self):
+            super().__init__()
+
+            self.completed = []
+
+        def find_packages(self, name, constraint=None, extras=None):
+            return [
+                get_package(p.pretty_name, p.pretty_version)
+                for p in super().find_packages(name, constraint, extras)
+            ]
+
+        def package(self, name, version, extras=None):
+            self.completed.append(f'{name} {version}')
+
+            return super().package(name, version, extras)
+
+    repo = LazyRepository()
+    package_a = get_package('A', '1.0')
+    package_b = get_package('B', '1.0')
+    new_package_b = get_package('B', '1.1')
+    repo.add_package(package_a)
+    repo.add_package(package_b)
+    repo.add_package(new_package_b)
+
+    package_a.requires.append(get_dependency('B', '^1.0'))
+
+    solver = Solver(package, Pool([repo]), installed, io, engine=engine)
+    ops = solver.solve([get_dependency('A')])
+
+    check_solver_result(ops, [
+        {'job': 'install', 'package': new_package_b},
+        {'job': 'install', 'package': package_a},
+    ])
+    assert ops[1].package.requires == package_a.requires
+    assert sorted(set(repo.completed)) == ['a 1.0.0.0', 'b 1.1.0.0']
+
+
+def test_solver_backtracks_on_conflicts(solver, repo):
+    package_a = get_package('A', '1.0')
+    package_b1 = get_package('B', '1.0')
+    package_b2 = get_package('B', '2.0')
+    package_c1 = get_package('C', '1.0')
+    package_c2 = get_package('C', '2.0')
+    repo.add_package(package_a)
+    repo.add_package(package_b1)
+    repo.add_package(package_b2)
+    repo.add_package(package_c1)
+    repo.add_package(package_c2)
+
+    package_a.requires.append(get_dependency('C', '^1.0'))
+    package_b1.requires.append(get_dependency('C', '^1.0'))
+    package_b2.requires.append(get_dependency('C', '^2.0'))
+
+    ops = solver.solve([get_dependency('A'), get_dependency('B')])
+
+    check_solver_result(ops, [
+        {'job': 'install', 'package': package_c1},
+        {'job': 'install', 'package': package_b1},
+        {'job': 'install', 'package': package_a},
+    ])
+
+
+def test_solver_fails_on_unsatisfiable_conflicts(solver, repo):
+    package_a = get_package('A', '1.0')
+    package_b = get_package('B', '1.0')
+    package_c1 = get_package('C', '1.0')
+    package_c2 = get_package('C', '2.0')
+    repo.add_package(package_a)
+    repo.add_package(package_b)
+    repo.add_package(package_c1)
+    repo.add_package(package_c2)
+
+    package_a.requires.append(get_dependency('C', '^1.0'))
+    package_b.requires.append(get_dependency('C', '^2.0'))
+
+    with pytest.raises(SolverProblemError):
+        solver.solve([get_dependency('A'), get_dependency('B')])
+
+
+def test_pubgrub_explains_failures(package, pool, repo, installed, io):
+    package_a = get_package('A', '1.0')
+    package_b = get_package('B', '1.0')
+    package_c1 = get_package('C', '1.0')
+    package_c2 = get_package('C', '2.0')
+    repo.add_package(package_a)
+    repo.add_package(package_b)
+    repo.add_package(package_c1)
+    repo.add_package(package_c2)
+
+    package_a.requires.append(get_dependency('C', '^1.0'))
+    package_b.requires.append(get_dependency('C', '^2.0'))
+
+    solver = Solver(package, pool, installed, io, engine='pubgrub')
+
+    with pytest.raises(SolverProblemError) as e:
+        solver.solve([get_dependency('A'), get_dependency('B')])
+
+    message = str(e.value)
+    assert 'the root project depends on a' in message
+    assert 'the root project depends on b' in message
+    assert 'a (1.0.0.0) depends on c (>= 1.0.0.0 < 2.0.0.0)' in message
+    assert 'b (1.0.0.0) depends on c (>= 2.0.0.0 < 3.0.0.0)' in message
+
+
+def test_pubgrub_prefers_fixed_versions(package, pool, repo, installed, io):
+    package_a = get_package('A', '1.0')
+    new_package_a = get_package('A', '1.1')
+    repo.add_package(package_a)
+    repo.add_package(new_package_a)
+
+    solver = Solver(package, pool, installed, io, engine='pubgrub')
+    ops = solver.solve(
+        [get_dependency('A')], fixed=[get_dependency('A', '1.0')]
+    )
+
+    check_solver_result(ops, [
+        {'job': 'install', 'package': package_a},
+    ])
+
+
+def test_solver_rejects_unknown_engines(package, pool, installed, io):
+    with pytest.raises(ValueError):
+        Solver(package, pool, installed, io, engine='unknown')
+
+
+def test_solver_reuses_unchanged_locked_packages(solver, repo, installed):
+    package_a = get_package('A', '1.0')
+    package_b = get_package('B', '1.0')
+    package_a.requires.append(get_dependency('B', '^1.0'))
+    installed.add_package(package_a)
+    installed.add_package(package_b)
+
+    new_package_a = get_package('A', '1.1')
+    new_package_a.requires.append(get_dependency('B', '^1.0'))
+    package_c = get_package('C', '1.0')
+    repo.add_package(get_package('A', '1.0'))
+    repo.add_package(new_package_a)
+    repo.add_package(get_package('B', '1.0'))
+    repo.add_package(get_package('B', '1.1'))
+    repo.add_package(package_c)
+
+    searched = []
+    find_packages = repo.find_packages
+
+    def spy(name, *args, **kwargs):
+        searched.append(name)
+
+        return find_packages(name, *args, **kwargs)
+
+    repo.find_packages = spy
+
+    ops = solver.solve(
+        [get_dependency('A'), get_dependency('C')], changed=['C']
+    )
+
+    check_solver_result(ops, [
+        {'job': 'install', 'package': package_c},
+    ])
+    assert searched == ['c']
+
+
+def test_solver_falls_back_to_full_resolution(solver, repo, installed):
+    package_a = get_package('A', '1.0')
+    package_b = get_package('B', '1.0')
+    package_a.requires.append(get_dependency('B', '^1.0'))
+    installed.add_package(package_a)
+    installed.add_package(package_b)
+
+    new_package_a = get_package('A', '1.1')
+    new_package_a.requires.append(get_dependency('B', '^2.0'))
+    new_package_b = get_package('B', '2.0')
+    package_c = get_package('C', '1.0')
+    package_c.requires.append(get_dependency('B', '^2.0'))
+    repo.add_package(get_package('A', '1.0'))
+    repo.add_package(new_package_a)
+    repo.add_package(get_package('B', '1.0'))
+    repo.add_package(new_package_b)
+    repo.add_package(package_c)
+
+    ops = solver.solve(
+        [get_dependency('A'), get_dependency('C')], changed=['C']
+    )
+
+    check_solver_result(ops, [
+        {'job': 'update', 'from': package_b, 'to': new_package_b},
+        {'job': 'install', 'package': package_c},
+        {'job': 'update', 'from': package_a, 'to': new_package_a},
+    ])
+
+
+def test_solver_does_not_reuse_locked_packages_for_extras(solver,
+                                                          repo,
+                                                          installed):
+    package_a = get_package('A', '1.0')
+    package_b = get_package('B', '1.0')
+    package_a.requires.append(get_dependency('B', '^1.0'))
+    installed.add_package(package_a)
+    installed.add_package(package_b)
+
+    new_package_b = get_package('B', '1.0')
+    new_package_b.extras = {
+        'foo': [get_dependency('D', '^1.0')]
+    }
+    package_c = get_package('C', '1.0')
+    dependency_b = get_dependency('B', '>=1.0')
+    dependency_b.extras.append('foo')
+    package_c.requires.append(dependency_b)
+    package_d = get_package('D', '1.0')
+    repo.add_package(package_a)
+    repo.add_package(new_package_b)
+    repo.add_package(package_c)
+    repo.add_package(package_d)
+
+    ops = solver.solve(
+        [get_dependency('A'), get_dependency('C')], changed=['C']
+    )
+
+    assert package_d in [op.package for op in ops]
+
+
+def test_solver_does_not_reuse_locked_packages_required_with_extras(tmpdir,
+                                                                   package,
+                                                                   pool,
+                                                                   repo,
+                                                                   io,
+                                                                   engine):
+    # The lock entry of B does not list the dependencies of its extras
+    lock = tmpdir.join('poetry.lock')
+    lock.write("""[[package]]
+name = "A"
+version = "1.0"
+category = "main"
+optional = false
+python-versions = "*"
+platform = "*"
+
+[package.dependencies]
+B = { version = "^1.0", extras = ["foo"] }
+
+[[package]]
+name = "B"
+version = "1.0"
+category = "main"
+optional = false
+python-versions = "*"
+platform = "*"
+
+[[package]]
+name = "D"
+version = "1.0"
+category = "main"
+optional = false
+python-versions = "*"
+platform = "*"
+
+[metadata]
+python-versions = "*"
+platform = "*"
+content-hash = "123456789"
+
+[metadata.hashes]
+A = []
+B = []
+D = []
+""")
+    locked = Locker(Path(str(lock)), {}).locked_repository()
+
+    package_a = get_package('A', '1.0')
+    package_a.add_dependency('B', {'version': '^1.0', 'extras': ['foo']})
+    package_b = get_package('B', '1.0')
+    package_b.extras = {
+        'foo': [get_dependency('D', '^1.0')]
+    }
+    package_c = get_package('C', '1.0')
+    repo.add_package(package_a)
+    repo.add_package(package_b)
+    repo.add_package(package_c)
+    repo.add_package(get_package('D', '1.0'))
+
+    solver = Solver(package, pool, locked, io, engine=engine)
+    ops = solver.solve(
+        [get_dependency('A'), get_dependency('C')], changed=['C']
+    )
+
+    assert [op.job_type for op in ops if op.job_type != 'update'] == [
+        'install'
+    ]
+    assert package_c in [op.package for op in ops if op.job_type == 'install']
@@ -0,0 +1,227 @@
+import hashlib
+import re
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn
+
+FIXTURES = Path(__file__).parent / 'fixtures' / 'pypi.org' / 'json'
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+
+    daemon_threads = True
+
+
+class _Server:
+
+    def __init__(self):
+        self._server = _ThreadingHTTPServer(
+            ('127.0.0.1', 0), self._create_handler()
+        )
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+
+        return f'http://{host}:{port}/'
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _create_handler(self):
+        raise NotImplementedError()
+
+
+class PyPiServer(_Server):
+    """
+    A minimal stand-in for the PyPI JSON API.
+
+    Every project and release document is served from the fixtures
+    and each request is recorded so tests can check what was fetched.
+    """
+
+    LAST_MODIFIED = 'Thu, 15 Mar 2018 10:00:00 GMT'
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.validators = True
+        self.requests = []
+        self.responses = []
+        self.max_concurrency = 0
+
+        self._concurrency = 0
+        self._lock = threading.Lock()
+
+        super().__init__()
+
+    def _create_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server._enter(self.path)
+
+                try:
+                    m = re.match('^/pypi/([^/]+)/(?:[^/]+/)?json$', self.path)
+                    fixture = None
+                    if m:
+                        fixture = FIXTURES / f'{m.group(1)}.json'
+
+                    if fixture is None or not fixture.exists():
+                        self._send(404, b'')
+
+                        return
+
+                    body = fixture.read_bytes()
+                    etag = '"{}"'.format(hashlib.md5(body).hexdigest())
+                    if self.headers.get('If-None-Match') == etag:
+                        self._send(304, b'', etag)
+
+                        return
+
+                    self._send(200, body, etag)
+                finally:
+                    server._leave()
+
+            def _send(self, status, body, etag=None):
+                server.responses.append((self.path, status))
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                if etag and server.validators:
+                    self.send_header('ETag', etag)
+                    self.send_header('Last-Modified', server.LAST_MODIFIED)
+
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _enter(self, path):
+        with self._lock:
+            self.requests.append(path)
+            self._concurrency += 1
+            self.max_concurrency = max(self.max_concurrency, self._concurrency)
+
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _leave(self):
+        with self._lock:
+            self._concurrency -= 1
+
+
+class IndexServer(_Server):
+    """
+    A minimal PEP 503 simple index serving in-memory distributions.
+
+    Range requests are honored if ``ranges`` is set, links carry
+    a sha256 fragment if ``hashes`` is set and every request
+    is recorded as a (method, path, range) tuple.
+    """
+
+    def __init__(self, files: dict, ranges=True, hashes=True):
+        self.files = files
+        self.ranges = ranges
+        self.hashes = hashes
+        self.requests = []
+
+        super().__init__()
+
+    def _create_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            protocol_version = 'HTTP/1.1'
+
+            def do_HEAD(self):
+                self._serve(head=True)
+
+            def do_GET(self):
+                self._serve()
+
+            def _serve(self, head=False):
+                server.requests.append(
+                    (self.command, self.path, self.headers.get('Range'))
+                )
+
+                m = re.match('^/simple/([^/]+)/$', self.path)
+                if m:
+                    links = []
+                    for filename, content in server.files.items():
+                        if not filename.startswith(f'{m.group(1)}-'):
+                            continue
+
+                        href = f'/files/{filename}'
+                        if server.hashes:
+                            digest = hashlib.sha256(content).hexdigest()
+                            href += f'#sha256={digest}'
+
+                        links.append(f'<a href="{href}">{filename}</a>')
+
+                    body = '<html><body>{}</body></html>'.format(
+                        '\n'.join(links)
+                    ).encode()
+
+                    return self._send(200, body, 'text/html', head=head)
+
+                filename = self.path.rsplit('/', 1)[-1]
+                if not self.path.startswith('/files/') \
+                        or filename not in server.files:
+                    return self._send(404, b'', 'text/plain', head=head)
+
+                body = server.files[filename]
+                requested = self.headers.get('Range')
+                if server.ranges and requested and not head:
+                    start, end = requested[len('bytes='):].split('-')
+                    start, end = int(start), min(int(end), len(body) - 1)
+
+                    return self._send(
+                        206, body[start:end + 1], 'application/octet-stream',
+                        headers={
+                            'Content-Range': f'bytes {start}-{end}/{len(body)}'
+                        }
+                    )
+
+                return self._send(
+                    200, body, 'application/octet-stream', head=head,
+                    headers={'Accept-Ranges': 'bytes'} if server.ranges else {}
+                )
+
+            def _send(self, status, body, content_type,
+                      head=False, headers=None):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+
+                self.end_headers()
+                if not head:
+                    self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,154 @@
+import hashlib
+import io
+import pytest
+import zipfile
+
+from poetry.repositories.exceptions import OfflineError
+from poetry.repositories.legacy_repository import LegacyRepository
+
+from .server import IndexServer
+
+
+METADATA = """\
+Metadata-Version: 2.1
+Name: foo
+Version: 1.0
+Summary: Foo package
+Requires-Python: >=3.4
+Requires-Dist: bar (>=1.0)
+Requires-Dist: baz; extra == "qux"
+
+Long description
+"""
+
+
+def make_wheel():
+    content = io.BytesIO()
+    with zipfile.ZipFile(content, 'w') as wheel:
+        wheel.writestr('foo/__init__.py', b'\0' * 100000)
+        wheel.writestr('foo-1.0.dist-info/METADATA', METADATA)
+
+    return content.getvalue()
+
+
+FILES = {
+    'foo-1.0-py3-none-any.whl': make_wheel(),
+    'foo-1.0.tar.gz': b'sdist',
+}
+
+
+def digest(filename):
+    return hashlib.sha256(FILES[filename]).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def environ(tmpdir, monkeypatch):
+    monkeypatch.setattr(
+        'poetry.repositories.legacy_repository.CACHE_DIR', str(tmpdir)
+    )
+    monkeypatch.setenv('PIP_TRUSTED_HOST', '127.0.0.1')
+
+
+@pytest.fixture()
+def index():
+    servers = []
+
+    def _index(**kwargs):
+        server = IndexServer(FILES, **kwargs).start()
+        servers.append(server)
+
+        return server
+
+    yield _index
+
+    for server in servers:
+        server.stop()
+
+
+def test_package_reads_metadata_from_wheel(index):
+    server = index()
+    repo = LegacyRepository('foo', server.url + 'simple/')
+
+    package = repo.package('foo', '1.0')
+
+    assert package.description == 'Foo package'
+    assert [dep.name for dep in package.requires] == ['bar']
+    assert [dep.name for dep in package.extras['qux']] == ['baz']
+    assert sorted(package.hashes) == sorted([
+        digest('foo-1.0-py3-none-any.whl'), digest('foo-1.0.tar.gz')
+    ])
+
+    # Only parts of the wheel have been downloaded
+    downloads = [
+        r for r in server.requests
+        if r[0] == 'GET' and r[1].startswith('/files/')
+    ]
+    assert downloads
+    assert all(r[2] is not None for r in downloads)
+    assert sum(
+        int(end) - int(start) + 1
+        for start, end in (r[2][len('bytes='):].split('-') for r in downloads)
+    ) < len(FILES['foo-1.0-py3-none-any.whl'])
+
+
+def test_files_are_retrieved_with_the_session_of_the_index(index):
+    server = index(hashes=False)
+    repo = LegacyRepository('foo', server.url + 'simple/')
+
+    repo.package('foo', '1.0')
+
+    # The session of pip carries the credentials and trusted hosts
+    assert any(r[1].startswith('/files/') for r in server.requests)
+    assert repo.session.stats()['requests'] == 0
+
+
+def test_package_downloads_and_hashes_wheel_without_ranges(index):
+    server = index(ranges=False, hashes=False)
+    repo = LegacyRepository('foo', server.url + 'simple/')
+
+    package = repo.package('foo', '1.0')
+
+    assert [dep.name for dep in package.requires] == ['bar']
+    assert sorted(package.hashes) == sorted([
+        digest('foo-1.0-py3-none-any.whl'), digest('foo-1.0.tar.gz')
+    ])
+
+    # Every file has been downloaded exactly once
+    downloads = sorted(
+        r[1] for r in server.requests
+        if r[0] == 'GET' and r[1].startswith('/files/')
+    )
+    assert downloads == [
+        '/files/foo-1.0-py3-none-any.whl', '/files/foo-1.0.tar.gz'
+    ]
+
+
+def test_package_matches_versions_spelled_differently(index):
+    server = index()
+    repo = LegacyRepository('foo', server.url + 'simple/')
+
+    package = repo.package('foo', '1.0.0')
+
+    assert package.description == 'Foo package'
+    assert [dep.name for dep in package.requires] == ['bar']
+    assert sorted(package.hashes) == sorted([
+        digest('foo-1.0-py3-none-any.whl'), digest('foo-1.0.tar.gz')
+    ])
+
+
+def test_offline_mode_only_uses_the_cache(index):
+    server = index()
+    repo = LegacyRepository('foo', server.url + 'simple/')
+    repo.find_packages('foo', '*')
+    repo.package('foo', '1.0')
+    requests = list(server.requests)
+
+    # Simulate a new run
+    repo = LegacyRepository('foo', server.url + 'simple/').offline()
+
+    assert [p.version for p in repo.find_packages('foo', '*')] == ['1.0']
+    assert [dep.name for dep in repo.package('foo', '1.0').requires] == ['bar']
+    assert server.requests == requests
+
+    with pytest.raises(OfflineError):
+        repo.find_packages('bar', '*')
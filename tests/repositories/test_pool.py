@@ -0,0 +1,104 @@
+import pytest
+import threading
+import time
+
+from poetry.packages import Package
+from poetry.repositories import Pool
+from poetry.repositories import Repository
+from poetry.repositories.exceptions import PackageNotFound
+
+
+class SlowRepository(Repository):
+
+    def __init__(self, packages=None, latency=0.0):
+        super().__init__(packages)
+
+        self.latency = latency
+        self.queries = []
+        self.threads = set()
+
+    def find_packages(self, name, constraint=None, extras=None):
+        self.queries.append(name)
+        self.threads.add(threading.current_thread())
+        time.sleep(self.latency)
+
+        return super().find_packages(name, constraint, extras=extras)
+
+
+def test_find_packages_respects_priority():
+    first = SlowRepository([Package('foo', '1.0')])
+    second = SlowRepository([Package('foo', '2.0'), Package('bar', '1.0')])
+    pool = Pool([first, second])
+
+    assert [p.version for p in pool.find_packages('foo', '*')] == ['1.0']
+    assert [p.version for p in pool.find_packages('bar', '*')] == ['1.0']
+    assert second.queries == ['bar']
+
+
+def test_find_packages_concurrently_respects_priority():
+    first = SlowRepository([Package('foo', '1.0')], latency=0.1)
+    second = SlowRepository([Package('foo', '2.0')])
+    pool = Pool([first, second], concurrent=True)
+
+    assert [p.version for p in pool.find_packages('foo', '*')] == ['1.0']
+    assert threading.current_thread() not in first.threads | second.threads
+
+
+def test_find_packages_concurrently_does_not_wait_for_misses_in_series():
+    repositories = [SlowRepository(latency=0.1) for _ in range(3)]
+    repositories.append(SlowRepository([Package('foo', '1.0')], latency=0.1))
+    pool = Pool(repositories, concurrent=True)
+
+    start = time.time()
+    packages = pool.find_packages('foo', '*')
+
+    assert len(packages) == 1
+    assert time.time() - start < 0.3
+
+
+def test_find_packages_caches_misses():
+    first = SlowRepository()
+    second = SlowRepository([Package('foo', '1.0')])
+    pool = Pool([first, second], concurrent=True)
+
+    pool.find_packages('foo', '*')
+    pool.find_packages('foo', '*')
+
+    assert first.queries == ['foo']
+    assert second.queries == ['foo', 'foo']
+
+
+def test_package_caches_misses():
+    first = Repository()
+    second = Repository([Package('foo', '1.0.0.0', '1.0')])
+
+    class FailingRepository(Repository):
+
+        calls = 0
+
+        def package(self, name, version, extras=None):
+            self.calls += 1
+
+            raise PackageNotFound(f'Package [{name}] not found.')
+
+    failing = FailingRepository()
+    pool = Pool([failing, first, second])
+
+    assert pool.package('foo', '1.0') is second.packages[0]
+    assert pool.package('bar', '1.0') is None
+    assert pool.package('bar', '1.0') is None
+    assert failing.calls == 2
+
+
+def test_package_does_not_hide_other_errors():
+    class BrokenRepository(Repository):
+
+        def package(self, name, version, extras=None):
+            raise ValueError('Invalid metadata')
+
+    pool = Pool([BrokenRepository()])
+
+    with pytest.raises(ValueError) as e:
+        pool.package('foo', '1.0')
+
+    assert str(e.value) == 'Invalid metadata'
@@ -1,9 +1,14 @@
 import json
+import pytest
 
 from pathlib import Path
 
+from poetry.repositories import Pool
+from poetry.repositories.exceptions import OfflineError
 from poetry.repositories.pypi_repository import PyPiRepository
 
+from .server import PyPiServer
+
 
 class MockRepository(PyPiRepository):
 
@@ -19,6 +24,15 @@ class MockRepository(PyPiRepository):
             return json.loads(f.read())
 
 
+@pytest.fixture()
+def server():
+    server = PyPiServer(latency=0.05).start()
+
+    yield server
+
+    server.stop()
+
+
 def test_find_packages():
     repo = MockRepository()
     packages = repo.find_packages('requests', '^2.18')
@@ -40,3 +54,255 @@ def test_package():
     assert win_inet.name == 'win-inet-pton'
     assert win_inet.python_versions == '==2.7 || ==2.6'
     assert win_inet.platform == '==win32'
+
+
+def test_find_packages_does_not_retrieve_release_info():
+    repo = MockRepository()
+    repo._max_workers = 0
+    packages = repo.find_packages('requests', '^2.18', extras=['security'])
+
+    assert len(packages) == 5
+    for package in packages:
+        assert package.requires == []
+        assert package.requires_extras == ['security']
+
+    assert repo.package('requests', '2.18.4').requires
+
+
+def test_find_packages_prefetches_latest_release_info(server):
+    repo = PyPiRepository(url=server.url, disable_cache=True, max_workers=4)
+    packages = repo.find_packages('requests', '^2.18')
+
+    assert len(packages) == 5
+
+    for i in range(1, 5):
+        repo.package('requests', f'2.18.{i}')
+
+    assert server.max_concurrency > 1
+
+    # The latest release is described by the project document
+    release_requests = [r for r in server.requests if r != '/pypi/requests/json']
+    assert sorted(release_requests) == [
+        f'/pypi/requests/2.18.{i}/json' for i in range(1, 4)
+    ]
+
+
+def test_find_packages_without_prefetching(server):
+    repo = PyPiRepository(url=server.url, disable_cache=True, max_workers=0)
+    packages = repo.find_packages('requests', '^2.18')
+
+    assert len(packages) == 5
+    assert server.requests == ['/pypi/requests/json']
+
+
+def test_repositories_share_the_pool_session(server):
+    repo = PyPiRepository(url=server.url, disable_cache=True, max_workers=0)
+    pool = Pool([repo])
+
+    assert repo.session is pool.session
+
+    repo.find_packages('requests', '^2.18')
+    repo.package('requests', '2.18.3')
+    repo.package('requests', '2.18.4')
+
+    assert pool.session.stats() == {
+        'requests': 2,
+        'connections': 1,
+        'reused': 1
+    }
+
+
+def test_release_info_is_derived_from_the_project_document(server):
+    repo = PyPiRepository(url=server.url, disable_cache=True, max_workers=0)
+
+    latest = repo.package('requests', '2.18.4')
+
+    assert server.requests == ['/pypi/requests/json']
+    assert latest.requires
+    assert latest.hashes == [
+        f['digests']['sha256']
+        for f in repo.get_package_info('requests')['releases']['2.18.4']
+    ]
+
+    repo.package('requests', '2.18.3')
+
+    assert server.requests == [
+        '/pypi/requests/json',
+        '/pypi/requests/2.18.3/json',
+    ]
+
+
+def test_package_info_is_revalidated(server, tmpdir, monkeypatch):
+    monkeypatch.setattr(
+        'poetry.repositories.pypi_repository.CACHE_DIR', str(tmpdir)
+    )
+
+    repo = PyPiRepository(url=server.url, max_workers=0)
+    info = repo.get_package_info('requests')
+
+    # Simulate a new run
+    repo = PyPiRepository(url=server.url, max_workers=0)
+
+    assert repo.get_package_info('requests') == info
+    assert server.responses == [
+        ('/pypi/requests/json', 200),
+        ('/pypi/requests/json', 304),
+    ]
+
+
+def test_missing_packages_are_remembered(server, tmpdir, monkeypatch):
+    monkeypatch.setattr(
+        'poetry.repositories.pypi_repository.CACHE_DIR', str(tmpdir)
+    )
+
+    repo = PyPiRepository(url=server.url, max_workers=0)
+
+    assert repo.find_packages('missing', '*') == []
+    assert repo.find_packages('missing', '*') == []
+    with pytest.raises(ValueError):
+        repo.package('missing', '1.0')
+
+    assert repo.find_packages('requests', '>=3.0') == []
+    assert repo.find_packages('requests', '>=3.0') == []
+
+    # Simulate a new run
+    repo = PyPiRepository(url=server.url, max_workers=0)
+
+    assert repo.find_packages('missing', '*') == []
+    assert repo.find_packages('requests', '>=3.0') == []
+
+    assert server.requests == [
+        '/pypi/missing/json',
+        '/pypi/requests/json',
+    ]
+
+
+def test_missing_packages_are_forgotten_after_a_while(server, monkeypatch):
+    repo = PyPiRepository(url=server.url, disable_cache=True, max_workers=0)
+
+    assert repo.find_packages('missing', '*') == []
+
+    monkeypatch.setattr(
+        'poetry.repositories.pypi_repository.time.time',
+        lambda: 1e11
+    )
+
+    assert repo.find_packages('missing', '*') == []
+    assert server.requests == ['/pypi/missing/json', '/pypi/missing/json']
+
+
+def test_offline_mode_only_uses_the_cache(server, tmpdir, monkeypatch):
+    monkeypatch.setattr(
+        'poetry.repositories.pypi_repository.CACHE_DIR', str(tmpdir)
+    )
+
+    repo = PyPiRepository(url=server.url, max_workers=0)
+    repo.find_packages('requests', '^2.18')
+    repo.package('requests', '2.18.3')
+
+    # Simulate a new run
+    repo = PyPiRepository(url=server.url, max_workers=0).offline()
+    requests = list(server.requests)
+
+    assert len(repo.find_packages('requests', '^2.18')) == 5
+    assert repo.package('requests', '2.18.3').requires
+    assert server.requests == requests
+
+
+def test_offline_mode_does_not_need_validators(server, tmpdir, monkeypatch):
+    monkeypatch.setattr(
+        'poetry.repositories.pypi_repository.CACHE_DIR', str(tmpdir)
+    )
+    server.validators = False
+
+    repo = PyPiRepository(url=server.url, max_workers=0)
+    repo.find_packages('requests', '^2.18')
+    repo.package('requests', '2.18.3')
+
+    # Simulate a new run
+    repo = PyPiRepository(url=server.url, max_workers=0).offline()
+    requests = list(server.requests)
+
+    assert len(repo.find_packages('requests', '^2.18')) == 5
+    assert repo.package('requests', '2.18.3').requires
+    assert server.requests == requests
+
+
+def test_offline_mode_fails_if_the_cache_is_disabled(server):
+    repo = PyPiRepository(url=server.url, disable_cache=True).offline()
+
+    with pytest.raises(OfflineError) as e:
+        repo.find_packages('requests', '^2.18')
+
+    assert str(e.value) == (
+        f'Unable to retrieve [{server.url}pypi/requests/json] '
+        f'in offline mode since the cache is disabled.'
+    )
+    assert server.requests == []
+
+
+def test_offline_mode_fails_on_cache_miss(server, tmpdir, monkeypatch):
+    monkeypatch.setattr(
+        'poetry.repositories.pypi_repository.CACHE_DIR', str(tmpdir)
+    )
+
+    repo = PyPiRepository(url=server.url, max_workers=4)
+    pool = Pool([repo]).offline()
+
+    assert repo.is_offline()
+
+    with pytest.raises(OfflineError) as e:
+        pool.find_packages('requests', '^2.18')
+
+    assert e.value.resource == server.url + 'pypi/requests/json'
+    assert server.requests == []
+
+
+def test_equivalent_names_and_versions_share_cache_entries(server,
+                                                           tmpdir,
+                                                           monkeypatch):
+    monkeypatch.setattr(
+        'poetry.repositories.pypi_repository.CACHE_DIR', str(tmpdir)
+    )
+
+    repo = PyPiRepository(url=server.url, max_workers=0)
+    info = repo.get_release_info('requests', '2.18.3')
+
+    assert repo.get_package_info('Requests') is \
+        repo.get_package_info('requests')
+
+    # Simulate a new run
+    repo = PyPiRepository(url=server.url, max_workers=0)
+
+    assert repo.get_release_info('Requests', '2.18.3.0') == info
+    assert server.requests == [
+        '/pypi/requests/json',
+        '/pypi/requests/2.18.3/json',
+    ]
+
+
+def test_release_info_is_retrieved_with_the_released_spelling(server,
+                                                              tmpdir,
+                                                              monkeypatch):
+    monkeypatch.setattr(
+        'poetry.repositories.pypi_repository.CACHE_DIR', str(tmpdir)
+    )
+
+    repo = PyPiRepository(url=server.url, max_workers=0)
+    info = repo.get_release_info('requests', '2.18.3.0')
+
+    assert info['version'] == '2.18.3'
+    assert info['digests'] == [
+        f['digests']['sha256']
+        for f in repo.get_package_info('requests')['releases']['2.18.3']
+    ]
+    assert info['digests']
+
+    # Simulate a new run
+    repo = PyPiRepository(url=server.url, max_workers=0)
+
+    assert repo.get_release_info('requests', '2.18.3') == info
+    assert server.requests == [
+        '/pypi/requests/json',
+        '/pypi/requests/2.18.3/json',
+    ]
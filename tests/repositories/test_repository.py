@@ -0,0 +1,71 @@
+from poetry.packages import Package
+from poetry.repositories import Repository
+
+
+def test_packages_are_indexed():
+    foo = Package('foo', '1.0.0.0', '1.0')
+    foo2 = Package('foo', '2.0.0.0', '2.0')
+    bar = Package('bar', '1.0.0.0', '1.0')
+    repo = Repository([foo, bar, foo2])
+
+    assert repo.packages == [foo, bar, foo2]
+    assert repo.packages_by_name('Foo') == [foo, foo2]
+    assert repo.package('foo', '2.0') is foo2
+    assert repo.package('baz', '1.0') is None
+    assert repo.has_package(Package('bar', '1.0.0.0'))
+    assert not repo.has_package(Package('bar', '2.0.0.0'))
+    assert [p.version for p in repo.find_packages('foo', '>=1.5')] == [
+        '2.0.0.0'
+    ]
+
+
+def test_remove_package_updates_indexes():
+    foo = Package('foo', '1.0.0.0', '1.0')
+    bar = Package('bar', '1.0.0.0', '1.0')
+    repo = Repository([foo, bar])
+
+    repo.remove_package(Package('foo', '1.0.0.0'))
+
+    assert repo.packages == [bar]
+    assert repo.packages_by_name('foo') == []
+    assert not repo.has_package(foo)
+    assert repo.package('foo', '1.0') is None
+    assert len(repo) == 1
+
+    repo.remove_package(foo)
+
+    assert repo.packages == [bar]
+
+
+def test_remove_package_with_duplicates():
+    foo = Package('foo', '1.0.0.0', '1.0')
+    duplicate = Package('foo', '1.0.0.0', '1.0')
+    repo = Repository([foo, duplicate])
+
+    repo.remove_package(foo)
+
+    assert repo.packages == [duplicate]
+    assert repo.packages[0] is duplicate
+    assert repo.package('foo', '1.0') is duplicate
+
+
+def test_find_packages_filters_sorted_versions():
+    packages = [
+        Package('foo', version)
+        for version in ['2.0.0.0', '1.0.0.0', '1.5.0.0', '3.0.0.0']
+    ]
+    repo = Repository(packages)
+
+    assert [p.version for p in repo.find_packages('foo', '>=1.5,<3.0')] == [
+        '1.5.0.0', '2.0.0.0'
+    ]
+    assert [p.version for p in repo.find_packages('foo', '<1.5 || 3.0')] == [
+        '1.0.0.0', '3.0.0.0'
+    ]
+
+    repo.add_package(Package('foo', '2.5.0.0'))
+    repo.remove_package(packages[0])
+
+    assert [p.version for p in repo.find_packages('foo', '>=1.5,<3.0')] == [
+        '1.5.0.0', '2.5.0.0'
+    ]
@@ -0,0 +1,31 @@
+from poetry.config import Config
+from poetry.repositories.session import Session
+from poetry.utils.toml_file import TomlFile
+
+
+def test_create_from_config(tmpdir):
+    path = tmpdir.join('config.toml')
+    path.write("""[settings.repositories]
+pool-size = 20
+retries = 5
+backoff-factor = 1
+timeout = 30
+""")
+
+    session = Session.create(Config(TomlFile(str(path))))
+    adapter = session.get_adapter('https://pypi.org/')
+
+    assert adapter._pool_connections == 20
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.backoff_factor == 1.0
+    assert session._timeout == 30.0
+
+
+def test_create_with_default_settings(tmpdir):
+    session = Session.create(Config(TomlFile(str(tmpdir.join('config.toml')))))
+    adapter = session.get_adapter('https://pypi.org/')
+
+    assert adapter._pool_maxsize == 10
+    assert adapter.max_retries.total == 3
+    assert session._timeout == 15
@@ -0,0 +1,72 @@
+import pytest
+
+from poetry.packages import Package
+from poetry.repositories import Pool
+from poetry.repositories.pypi_repository import PyPiRepository
+from poetry.repositories.snapshot_repository import SnapshotRepository
+
+from .server import PyPiServer
+
+
+@pytest.fixture()
+def server():
+    server = PyPiServer().start()
+
+    yield server
+
+    server.stop()
+
+
+@pytest.fixture()
+def snapshot(server, tmpdir):
+    pool = Pool([
+        PyPiRepository(url=server.url, disable_cache=True, max_workers=0)
+    ])
+    path = str(tmpdir.join('snapshot.zip'))
+
+    git_package = Package('poetry', '0.4.0', '0.4.0')
+    git_package.source_type = 'git'
+
+    count = SnapshotRepository.export(path, pool, [
+        Package('requests', '2.18.3', '2.18.3'),
+        Package('requests', '2.18.4', '2.18.4'),
+        git_package
+    ])
+
+    assert count == 2
+
+    return path
+
+
+def test_snapshot_serves_exported_releases(server, snapshot):
+    requests = list(server.requests)
+    repo = SnapshotRepository('snapshot', snapshot)
+
+    packages = repo.find_packages('requests', '^2.18')
+
+    assert sorted(p.version for p in packages) == ['2.18.3', '2.18.4']
+
+    package = repo.package('requests', '2.18.4')
+
+    assert len(package.requires) == 4
+    assert len(package.extras['security']) == 3
+    assert package.hashes
+    assert server.requests == requests
+
+
+def test_snapshot_misses(snapshot):
+    repo = SnapshotRepository('snapshot', snapshot)
+
+    assert repo.find_packages('requests', '<2.18.3') == []
+    assert repo.find_packages('pendulum', '*') == []
+
+    with pytest.raises(ValueError):
+        repo.package('requests', '2.18.1')
+
+
+def test_pool_can_be_configured_with_a_snapshot(snapshot):
+    pool = Pool().configure({'name': 'snapshot', 'snapshot': snapshot})
+
+    assert isinstance(pool.repositories[0], SnapshotRepository)
+    assert pool.repositories[0].name == 'snapshot'
+    assert len(pool.find_packages('requests', '*')) == 2
@@ -0,0 +1,118 @@
+import pytest
+
+from poetry.semver.constraints import Constraint
+from poetry.semver.constraints import MultiConstraint
+from poetry.semver.constraints import VersionRange
+from poetry.semver.constraints import VersionUnion
+from poetry.semver.version import Version
+from poetry.semver.version_parser import VersionParser
+
+
+def v(version):
+    return Version.parse(version)
+
+
+def parse(constraints):
+    return VersionParser().parse_constraints(constraints).to_range()
+
+
+@pytest.mark.parametrize(
+    'constraint, expected',
+    [
+        ('*', '*'),
+        ('1.2.3', '== 1.2.3.0'),
+        ('^1.2', '>= 1.2.0.0 < 2.0.0.0'),
+        ('>=1.0,<2.0 || >=1.5,<3.0', '>= 1.0.0.0 < 3.0.0.0'),
+        ('>=1.0,<2.0 || >=2.0,<3.0', '>= 1.0.0.0 < 3.0.0.0'),
+        ('<1.0 || >=1.0', '*'),
+        ('!=1.0', '< 1.0.0.0 || > 1.0.0.0'),
+        ('~2.7 || ^3.4', '>= 2.7.0.0 < 2.8.0.0 || >= 3.4.0.0 < 4.0.0.0'),
+    ]
+)
+def test_constraints_are_simplified(constraint, expected):
+    assert str(parse(constraint)) == expected
+
+
+def test_intersect():
+    a = parse('>=1.0,<2.0')
+
+    assert str(a.intersect(parse('>=1.5'))) == '>= 1.5.0.0 < 2.0.0.0'
+    assert str(a.intersect(parse('!=1.5'))) == \
+        '>= 1.0.0.0 < 1.5.0.0 || > 1.5.0.0 < 2.0.0.0'
+    assert a.intersect(parse('>=2.0')).is_empty()
+    assert a.intersect(parse('<=1.0')) == VersionRange(
+        v('1.0'), v('1.0'), True, True
+    )
+
+
+def test_union():
+    a = parse('>=1.0,<2.0')
+
+    assert str(a.union(parse('>=2.0,<3.0'))) == '>= 1.0.0.0 < 3.0.0.0'
+    assert str(a.union(parse('>2.0'))) == \
+        '>= 1.0.0.0 < 2.0.0.0 || > 2.0.0.0'
+    assert a.union(parse('<1.0 || >=2.0')).is_any()
+    assert isinstance(a.union(parse('>=3.0')), VersionUnion)
+
+
+def test_difference():
+    a = parse('>=1.0,<2.0')
+
+    assert str(a.difference(parse('>=1.5'))) == '>= 1.0.0.0 < 1.5.0.0'
+    assert str(a.difference(parse('1.5'))) == \
+        '>= 1.0.0.0 < 1.5.0.0 || > 1.5.0.0 < 2.0.0.0'
+    assert a.difference(parse('*')).is_empty()
+    assert parse('*').difference(parse('*')).is_empty()
+
+
+def test_allows():
+    a = parse('^1.2 || ^3.0')
+
+    assert a.allows('1.2.0')
+    assert a.allows(v('3.5'))
+    assert not a.allows('2.0')
+    assert a.allows_all(parse('>=1.3,<1.4 || 3.1'))
+    assert not a.allows_all(parse('>=1.3,<2.1'))
+    assert a.allows_any(parse('>=1.3,<2.1'))
+    assert not a.allows_any(parse('>=2.0,<3.0'))
+
+
+def test_to_constraint():
+    assert str(parse('>=1.0,<2.0').to_constraint()) == \
+        str(MultiConstraint((Constraint('>=', '1.0.0.0'),
+                             Constraint('<', '2.0.0.0'))))
+    assert str(parse('1.0').to_constraint()) == '== 1.0.0.0'
+    assert str(parse('*').to_constraint()) == '*'
+
+
+def test_contiguous_or_groups_are_collapsed():
+    constraint = VersionParser().parse_constraints(
+        '>=1.0,<1.1 || >=1.1,<2.0'
+    )
+
+    assert isinstance(constraint, MultiConstraint)
+    assert str(constraint) == '>= 1.0.0.0 < 2.0.0.0'
+    assert constraint.pretty_string == '>=1.0,<1.1 || >=1.1,<2.0'
+
+
+@pytest.mark.parametrize(
+    'constraint, expected',
+    [
+        ('*', ['0.9', '1.0', '1.0.1', '1.5b1', '1.5', '2.0', '3.0']),
+        ('>=1.0,<2.0', ['1.0', '1.0.1', '1.5b1', '1.5']),
+        ('>1.0,<=2.0', ['1.0.1', '1.5b1', '1.5', '2.0']),
+        ('1.5', ['1.5']),
+        ('!=1.5', ['0.9', '1.0', '1.0.1', '1.5b1', '2.0', '3.0']),
+        ('<1.0 || >=3.0', ['0.9', '3.0']),
+        ('>=4.0', []),
+    ]
+)
+def test_filter(constraint, expected):
+    versions = sorted(
+        v(version) for version in
+        ['3.0', '1.0', '1.5', '0.9', '2.0', '1.0.1', '1.5b1']
+    )
+    constraint = VersionParser().parse_constraints(constraint)
+
+    assert [version.text for version in constraint.filter(versions)] == \
+        expected
@@ -0,0 +1,135 @@
+import os
+import random
+import re
+import time
+
+import pytest
+
+from poetry.semver.helpers import _expand_stability
+from poetry.semver.helpers import _modifier_regex
+from poetry.semver.helpers import normalize_version
+
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get('POETRY_BENCHMARK'),
+    reason='Benchmarks only run if POETRY_BENCHMARK is set'
+)
+
+
+def baseline_normalize_version(version):
+    """
+    The implementation of normalize_version() before its patterns
+    were compiled once, plain versions had a fast path
+    and results were cached.
+    """
+    version = version.strip()
+
+    m = re.match(r'^([^,\s+]+)\+[^\s]+$', version)
+    if m:
+        version = m.group(1)
+
+    index = None
+    m = re.match(
+        r'(?i)^v?(\d{{1,5}})(\.\d+)?(\.\d+)?(\.\d+)?{}$'.format(
+            _modifier_regex
+        ),
+        version
+    )
+    if m:
+        version = f'{m.group(1)}' \
+                  f'{m.group(2) if m.group(2) else ".0"}' \
+                  f'{m.group(3) if m.group(3) else ".0"}' \
+                  f'{m.group(4) if m.group(4) else ".0"}'
+        index = 5
+    else:
+        m = re.match(
+            r'(?i)^v?(\d{{1,5}})(\.\d+)?(\.\d+)?(\.\d+)?-(?:\d+){}$'.format(
+                _modifier_regex
+            ),
+            version
+        )
+        if m:
+            version = f'{m.group(1)}' \
+                      f'{m.group(2) if m.group(2) else ".0"}' \
+                      f'{m.group(3) if m.group(3) else ".0"}' \
+                      f'{m.group(4) if m.group(4) else ".0"}'
+            index = 5
+        else:
+            m = re.match(
+                r'(?i)^v?(\d{{4}}(?:[.:-]?\d{{2}}){{1,6}}'
+                r'(?:[.:-]?\d{{1,3}})?){}$'.format(_modifier_regex),
+                version
+            )
+            if m:
+                version = re.sub(r'\D', '.', m.group(1))
+
+                index = 2
+
+    if index is not None:
+        if len(m.groups()) - 1 >= index and m.group(index):
+            version = f'{version}' \
+                      f'-{_expand_stability(m.group(index))}'
+
+            if m.group(index + 1):
+                version = f'{version}.{m.group(index + 1).lstrip(".-")}'
+
+        return version
+
+    raise ValueError(f'Invalid version string "{version}"')
+
+
+def corpus(size=50000):
+    """
+    Version strings distributed like the releases found on PyPI:
+    mostly plain versions, some pre-releases, post-releases
+    and date based versions, with many duplicates across packages.
+    """
+    r = random.Random(42)
+
+    versions = []
+    for _ in range(size):
+        major, minor, patch = r.randint(0, 5), r.randint(0, 20), r.randint(0, 9)
+        kind = r.random()
+        if kind < 0.6:
+            version = f'{major}.{minor}.{patch}'
+        elif kind < 0.75:
+            version = f'{major}.{minor}'
+        elif kind < 0.9:
+            modifier = r.choice(['a', 'b', 'rc', 'alpha', 'beta'])
+            version = f'{major}.{minor}.{patch}{modifier}{r.randint(1, 5)}'
+        elif kind < 0.95:
+            version = f'{major}.{minor}.{patch}.post{r.randint(1, 3)}'
+        else:
+            version = f'2018.{r.randint(1, 12):02}.{r.randint(1, 28):02}'
+
+        versions.append(version)
+
+    return versions
+
+
+def run(normalize, versions):
+    start = time.perf_counter()
+    for version in versions:
+        normalize(version)
+
+    return time.perf_counter() - start
+
+
+def test_normalize_version_benchmark(capsys):
+    versions = corpus()
+
+    assert [normalize_version(v) for v in versions] == \
+        [baseline_normalize_version(v) for v in versions]
+
+    normalize_version.cache_clear()
+
+    timings = [
+        ('baseline', run(baseline_normalize_version, versions)),
+        ('uncached', run(normalize_version.__wrapped__, versions)),
+        ('cached', run(normalize_version, versions)),
+    ]
+
+    with capsys.disabled():
+        print(f'\nnormalize_version() on {len(versions)} versions:')
+        for name, timing in timings:
+            print(f'  {name:>8}: {timing * 1000:.1f}ms')
@@ -15,6 +15,9 @@ from poetry.semver.helpers import normalize_version
         ('1.0.0.pl3', '1.0.0.0-patch.3'),
         ('1.0', '1.0.0.0'),
         ('0', '0.0.0.0'),
+        ('1.2.3', '1.2.3.0'),
+        ('01.02', '01.02.0.0'),
+        (' 1.2 ', '1.2.0.0'),
         ('10.4.13-b', '10.4.13.0-beta'),
         ('10.4.13-b5', '10.4.13.0-beta.5'),
         ('v1.0.0', '1.0.0.0'),
@@ -48,3 +51,19 @@ def test_normalize(version, expected):
 def test_normalize_fail(version):
     with pytest.raises(ValueError):
         normalize_version(version)
+
+
+@pytest.mark.parametrize(
+    'version',
+    [
+        '1', '1.2', '1.2.3', '1.2.3.4', '01.02', ' 1.2 ',
+        '1.0.0RC1', '10.4.13-b5', 'v1.0.0', '2010.01.02', '1.0.0-beta.5+foo',
+    ]
+)
+def test_normalize_cached(version):
+    normalize_version.cache_clear()
+    expected = normalize_version.__wrapped__(version)
+
+    assert normalize_version(version) == expected
+    assert normalize_version(version) == expected
+    assert normalize_version.cache_info().hits == 1
@@ -0,0 +1,41 @@
+import pytest
+
+from poetry.semver.version import Version
+
+
+@pytest.mark.parametrize(
+    'a, b',
+    [
+        ('1.0', '1.0.0'),
+        ('v1.2.3', '1.2.3'),
+        ('1.0b1', '1.0.0-beta.1'),
+        ('2018.03.15', '2018.3.15'),
+    ]
+)
+def test_equivalent_versions_are_equal(a, b):
+    assert Version.parse(a) == Version.parse(b)
+    assert hash(Version.parse(a)) == hash(Version.parse(b))
+
+
+@pytest.mark.parametrize(
+    'a, b',
+    [
+        ('1.0', '1.0.1'),
+        ('1.0.0-beta', '1.0.0'),
+        ('1.0.0-alpha.2', '1.0.0-beta.1'),
+        ('1.9.9', '1.10'),
+        ('foo', '1.0'),
+    ]
+)
+def test_versions_are_ordered(a, b):
+    assert Version.parse(a) < Version.parse(b)
+    assert Version.parse(b) > Version.parse(a)
+
+
+def test_parse_shares_instances():
+    version = Version.parse('1.2.3')
+
+    assert Version.parse('1.2.3') is version
+    assert version.text == '1.2.3'
+    assert version.normalized == '1.2.3.0'
+    assert str(version) == '1.2.3'
@@ -162,3 +162,16 @@ def test_parse_constraints_multi2(parser, input):
 def test_parse_constraints_fail(parser, input):
     with pytest.raises(ValueError):
         parser.parse_constraints(input)
+
+
+def test_parse_constraints_is_cached(parser):
+    VersionParser.clear_cache()
+
+    constraint = parser.parse_constraints('>=1.2, <2.0')
+
+    assert VersionParser().parse_constraints('>=1.2, <2.0') is constraint
+    assert constraint.pretty_string == '>=1.2, <2.0'
+
+    info = VersionParser.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
@@ -0,0 +1,22 @@
+from poetry.config import Config
+from poetry.utils.toml_file import TomlFile
+
+
+def test_config_setting(tmpdir):
+    path = tmpdir.join('config.toml')
+    path.write("""[settings.repositories]
+concurrent = true
+""")
+
+    config = Config(TomlFile(str(path)))
+
+    assert config.setting('settings.repositories.concurrent') is True
+    assert config.setting('settings.repositories.foo') is None
+    assert config.setting('settings.foo.bar', 'baz') == 'baz'
+
+
+def test_config_without_file(tmpdir):
+    config = Config(TomlFile(str(tmpdir.join('config.toml'))))
+
+    assert config.content == {}
+    assert config.setting('settings.repositories.concurrent', False) is False